@@ -0,0 +1,376 @@
+import glob
+import os
+import time
+import tracemalloc
+
+from PIL import Image
+
+from my_factorio_funcs import *
+from my_factorio_consts import MAX_PIXEL_COUNT, WireType
+
+"""
+性能基准测试
+测量各项优化在仓库蓝图与生成蓝图上的耗时与内存，只输出结果，不参与生产流程；正确性检查见tests目录
+
+用法示例：
+python my_factorio_benchmark.py  # 运行全部基准测试
+"""
+
+
+def get_repo_blueprint_path_list() -> list:
+	"""获取仓库中所有蓝图文本文件的路径，用于基准测试"""
+	
+	repo_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+	_ = glob.glob(os.path.join(repo_dir, 'toolbox', 'blueprints', '*.txt'))
+	_ += glob.glob(os.path.join(repo_dir, 'toolbox', 'scripts', '*.txt'))
+	_ += glob.glob(os.path.join(repo_dir, '飞船', '*', '*.txt'))
+	return sorted(_)
+
+
+def benchmark_json_backends(path_list: list | None = None, repeat: int = 5) -> None:
+	"""测试各JSON后端在仓库蓝图上的编解码吞吐量"""
+	
+	if path_list is None:
+		path_list = get_repo_blueprint_path_list()
+	
+	bp_dict_list = []
+	for path in path_list:
+		with open(path, 'r', encoding='utf-8') as f:
+			bp_dict_list.append(blueprint_stream_to_dict(f))
+	
+	original_backend = get_json_backend()
+	try:
+		for backend in get_available_json_backend_list():
+			set_json_backend(backend)
+			json_data_list = [json_encode(x) for x in bp_dict_list]
+			total_mb = sum(len(x) for x in json_data_list) * repeat / 1024 / 1024
+			
+			start = time.perf_counter()
+			for _ in range(repeat):
+				for bp_dict in bp_dict_list:
+					json_encode(bp_dict)
+			encode_time = time.perf_counter() - start
+			
+			start = time.perf_counter()
+			for _ in range(repeat):
+				for json_data in json_data_list:
+					json_decode(json_data)
+			decode_time = time.perf_counter() - start
+			
+			print('{}: 文件数={} JSON={:.2f}MB 编码={:.1f}MB/s 解码={:.1f}MB/s'.format(
+				backend, len(path_list), total_mb / repeat, total_mb / encode_time, total_mb / decode_time))
+	finally:
+		set_json_backend(original_backend)
+
+
+def benchmark_entity_memory(entity_count: int = 2935 * 4) -> None:
+	"""测试构建大量实体的蓝图对象时的内存占用，默认相当于4块最大显示屏的电灯数"""
+	
+	tracemalloc.start()
+	start = time.perf_counter()
+	
+	bp_object = Blueprint()
+	for i in range(entity_count):
+		entity = Entity({'name': 'small-lamp', 'position': {'x': i % 54, 'y': i // 54}})
+		bp_object.add_entity(entity)
+	
+	build_time = time.perf_counter() - start
+	current, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	
+	print('实体数={} 耗时={:.1f}ms 内存={:.2f}MB 峰值={:.2f}MB 单个实体={:.0f}B'.format(
+		entity_count, build_time * 1000, current / 1024 / 1024, peak / 1024 / 1024, current / entity_count))
+
+
+def benchmark_pixel_signal_lookup(repeat: int = 100) -> None:
+	"""对比按字符串键查询全信号字典与查询全像素信号列表的单像素耗时"""
+	
+	all_signal_dict = my_factorio_consts.ALL_SIGNAL_DICT
+	all_pixel_signal_list = my_factorio_consts.ALL_PIXEL_SIGNAL_LIST
+	
+	start = time.perf_counter()
+	for _ in range(repeat):
+		for i in range(MAX_PIXEL_COUNT):
+			signal = {
+				'name': all_signal_dict[str(i // 5)]['name'],
+				'quality': ALL_QUALITY_LIST[i % 5]
+			}
+			if 'type' in all_signal_dict[str(i // 5)]:
+				signal['type'] = all_signal_dict[str(i // 5)]['type']
+	dict_time = time.perf_counter() - start
+	
+	start = time.perf_counter()
+	for _ in range(repeat):
+		for i in range(MAX_PIXEL_COUNT):
+			name, type, quality = all_pixel_signal_list[i]
+			signal = {'name': name, 'quality': quality}
+			if type:
+				signal['type'] = type
+	list_time = time.perf_counter() - start
+	
+	pixel_count = MAX_PIXEL_COUNT * repeat
+	print('全信号字典={:.0f}ns/像素 全像素信号列表={:.0f}ns/像素 加速={:.1f}倍'.format(
+		dict_time / pixel_count * 1e9, list_time / pixel_count * 1e9, dict_time / list_time))
+
+
+def benchmark_frame_color_list(gif_path: str | None = None, width: int = 54, height: int = 54) -> None:
+	"""对比逐像素读取与NumPy向量化提取一个gif所有帧颜色的耗时"""
+	
+	if gif_path is None:
+		gif_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'media', 'earth.gif')
+	
+	frame_list = get_gif_frame_list(Image.open(gif_path))
+	
+	start = time.perf_counter()
+	python_result = [
+		[rgb[0] << 16 | rgb[1] << 8 | rgb[2] for rgb in get_frame_rgb_list(x, width, height)] for x in frame_list]
+	python_time = time.perf_counter() - start
+	
+	start = time.perf_counter()
+	numpy_result = [get_frame_color_list(x, width, height) for x in frame_list]
+	numpy_time = time.perf_counter() - start
+	
+	start = time.perf_counter()
+	parallel_result = get_frame_color_list_parallel(frame_list, width, height)
+	parallel_time = time.perf_counter() - start
+	
+	assert python_result == numpy_result == parallel_result
+	print('帧数={} 尺寸={}x{} 逐像素={:.1f}ms NumPy={:.1f}ms NumPy并行={:.1f}ms'.format(
+		len(frame_list), width, height, python_time * 1000, numpy_time * 1000, parallel_time * 1000))
+
+
+def benchmark_screen_blueprint(size_list: list | None = None, repeat: int = 5) -> None:
+	"""测试不同尺寸显示屏的生成耗时，包括构建字典与编码为蓝图"""
+	
+	if size_list is None:
+		size_list = [(1, 1), (10, 10), (20, 20), (32, 32), (40, 40), (54, 54), (5, 587)]
+	
+	for width, height in size_list:
+		start = time.perf_counter()
+		for _ in range(repeat):
+			d = get_screen_blueprint_dict(width, height, [1, 2])
+		build_time = (time.perf_counter() - start) / repeat
+		
+		start = time.perf_counter()
+		for _ in range(repeat):
+			dict_to_blueprint(d)
+		encode_time = (time.perf_counter() - start) / repeat
+		
+		print('{}x{} 像素={} 构建={:.2f}ms 编码={:.2f}ms'.format(
+			width, height, width * height, build_time * 1000, encode_time * 1000))
+
+
+def benchmark_book_codec(path_list: list | None = None, workers_list: list | None = None, repeat: int = 3) -> None:
+	"""将仓库中的蓝图放入同一本蓝图书，测试不同进程数下逐个加密与解码子蓝图的耗时"""
+	
+	if path_list is None:
+		path_list = get_repo_blueprint_path_list()
+	if workers_list is None:
+		workers_list = [1, None]
+	
+	blueprint_list = []
+	for path in path_list:
+		with open(path, 'r', encoding='utf-8') as f:
+			bp_dict = blueprint_to_dict(f.read().strip())
+		if 'blueprint' in bp_dict:
+			blueprint_list.append(bp_dict['blueprint'])
+	book_dict = {
+		'blueprint_book': {
+			'item': 'blueprint-book',
+			'blueprints': [{'index': i, 'blueprint': x} for i, x in enumerate(blueprint_list)],
+		}
+	}
+	
+	for workers in workers_list:
+		start = time.perf_counter()
+		for _ in range(repeat):
+			result_list = encode_book_blueprints(book_dict, workers=workers)
+		encode_time = (time.perf_counter() - start) / repeat
+		
+		start = time.perf_counter()
+		for _ in range(repeat):
+			blueprint_list_to_dict_list([x[1] for x in result_list], workers)
+		decode_time = (time.perf_counter() - start) / repeat
+		
+		print('workers={} 蓝图数={} 加密={:.2f}ms 解码={:.2f}ms'.format(
+			workers, len(result_list), encode_time * 1000, decode_time * 1000))
+
+
+def benchmark_decode_cache(path_list: list | None = None, repeat: int = 5) -> None:
+	"""对比直接解码、解码缓存内存层命中与磁盘层命中的耗时"""
+	
+	import tempfile
+	
+	if path_list is None:
+		path_list = get_repo_blueprint_path_list()
+	
+	with tempfile.TemporaryDirectory() as disk_dir:
+		DECODE_CACHE.set_disk_dir(disk_dir)
+		for path in path_list:
+			with open(path, 'r', encoding='utf-8') as f:
+				bp = f.read()
+			
+			start = time.perf_counter()
+			for _ in range(repeat):
+				blueprint_to_dict(bp.strip())
+			decode_time = (time.perf_counter() - start) / repeat
+			
+			blueprint_to_dict_cached(bp)  # 写入缓存
+			start = time.perf_counter()
+			for _ in range(repeat):
+				blueprint_to_dict_cached(bp)
+			memory_time = (time.perf_counter() - start) / repeat
+			
+			start = time.perf_counter()
+			for _ in range(repeat):
+				DECODE_CACHE.memory_dict.clear()
+				blueprint_to_dict_cached(bp)
+			disk_time = (time.perf_counter() - start) / repeat
+			
+			print('{} 字符数={} 解码={:.2f}ms 内存命中={:.3f}ms 磁盘命中={:.2f}ms'.format(
+				os.path.basename(path), len(bp), decode_time * 1000, memory_time * 1000, disk_time * 1000))
+		DECODE_CACHE.clear()
+		DECODE_CACHE.set_disk_dir(None)
+
+
+def benchmark_spatial_index(count: int = 20000, query_count: int = 1000) -> None:
+	"""对比线性扫描与空间索引的点查询、矩形查询和最近邻查询耗时"""
+	
+	import math
+	import random
+	
+	side = int(count ** 0.5)
+	bp = Blueprint()
+	for i in range(count):
+		bp.add_entity(Entity({'name': 'small-lamp', 'position': {'x': i % side + 0.5, 'y': i // side + 0.5}}))
+	
+	point_list = [(random.uniform(0, side), random.uniform(0, side)) for _ in range(query_count)]
+	box_list = [get_entity_box(x) for x in bp.entities]
+	
+	start = time.perf_counter()
+	bp.get_spatial_index()
+	build_time = time.perf_counter() - start
+	
+	start = time.perf_counter()
+	for x, y in point_list:
+		[e for e, b in zip(bp.entities, box_list) if b[0] <= x < b[2] and b[1] <= y < b[3]]
+	scan_point_time = (time.perf_counter() - start) / query_count
+	
+	start = time.perf_counter()
+	for x, y in point_list:
+		bp.get_entities_at(x, y)
+	index_point_time = (time.perf_counter() - start) / query_count
+	
+	start = time.perf_counter()
+	for x, y in point_list:
+		[e for e, b in zip(bp.entities, box_list) if b[0] < x + 10 and x < b[2] and b[1] < y + 10 and y < b[3]]
+	scan_rect_time = (time.perf_counter() - start) / query_count
+	
+	start = time.perf_counter()
+	for x, y in point_list:
+		bp.get_entities_in_rect(x, y, x + 10, y + 10)
+	index_rect_time = (time.perf_counter() - start) / query_count
+	
+	start = time.perf_counter()
+	for x, y in point_list:
+		min(bp.entities, key=lambda e: math.hypot(e.position_x - x, e.position_y - y))
+	scan_nearest_time = (time.perf_counter() - start) / query_count
+	
+	start = time.perf_counter()
+	for x, y in point_list:
+		bp.get_nearest_entity(x, y)
+	index_nearest_time = (time.perf_counter() - start) / query_count
+	
+	print('实体数={} 构建索引={:.1f}ms'.format(count, build_time * 1000))
+	print('点查询：线性扫描={:.3f}ms 索引={:.4f}ms'.format(scan_point_time * 1000, index_point_time * 1000))
+	print('矩形查询：线性扫描={:.3f}ms 索引={:.4f}ms'.format(scan_rect_time * 1000, index_rect_time * 1000))
+	print('最近邻查询：线性扫描={:.3f}ms 索引={:.4f}ms'.format(scan_nearest_time * 1000, index_nearest_time * 1000))
+
+
+def benchmark_wire_graph(count: int = 5000) -> None:
+	"""对比逐条扫描列表查重与信号线图索引添加链状线缆的耗时，并统计红绿网络数量"""
+	
+	wire_list = [[i, WireType.RED_OUTPUT.value, i + 1, WireType.RED_INPUT.value] for i in range(1, count)]
+	wire_list += [[i, WireType.GREEN_INPUT.value, i + 2, WireType.GREEN_INPUT.value] for i in range(1, count - 1)]
+	
+	start = time.perf_counter()
+	scan_list = []
+	for wire in wire_list[:count // 5]:
+		if wire not in scan_list:
+			scan_list.append(wire)
+	scan_time = (time.perf_counter() - start) * len(wire_list) / (count // 5)  # 按比例估算，扫描查重为平方复杂度，实际只会更慢
+	
+	start = time.perf_counter()
+	wire_graph = WireGraph()
+	wire_graph.add_wires(wire_list)
+	add_time = time.perf_counter() - start
+	
+	start = time.perf_counter()
+	red_count = len(wire_graph.get_networks('red'))
+	green_count = len(wire_graph.get_networks('green'))
+	network_time = time.perf_counter() - start
+	
+	print('线缆数={} 扫描查重（估算下限）={:.1f}ms 图索引添加={:.1f}ms 求连通网络={:.1f}ms 红网络={} 绿网络={}'.format(
+		len(wire_list), scan_time * 1000, add_time * 1000, network_time * 1000, red_count, green_count))
+
+
+def benchmark_blueprint_emitter(width: int = 54, height: int = 54, repeat: int = 5) -> None:
+	"""对比先构建字典再编码与直接写入JSON片段两种方式生成显示屏和满像素常量运算器的耗时与内存峰值"""
+	
+	def measure(function) -> tuple:
+		start = time.perf_counter()
+		for _ in range(repeat):
+			bp = function()
+		elapsed = (time.perf_counter() - start) / repeat
+		
+		# 内存追踪会拖慢分配，单独运行一次统计峰值
+		tracemalloc.start()
+		function()
+		peak = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+		return bp, elapsed, peak
+	
+	count_list = [i * 5717 % 0x1000000 for i in range(MAX_PIXEL_COUNT)]
+	
+	def build_combinator_dict() -> str:
+		bp_object = Blueprint()
+		cc_object = ConstantCombinator()
+		for count in count_list:
+			cc_object.add_filter_auto(count)
+		bp_object.add_entity(cc_object)
+		return dict_to_blueprint(bp_object.get_dict())
+	
+	def build_combinator_emitter() -> str:
+		bp_object = Blueprint()
+		cc_object = ConstantCombinator()
+		bp_object.add_entity(cc_object)
+		emitter = BlueprintEmitter()
+		bp_object.write_to_emitter(emitter, {cc_object.entity_number: iter_auto_filter_control_behavior_json(count_list)})
+		return emitter.finish()
+	
+	case_list = [
+		('显示屏{}x{}'.format(width, height),
+			lambda: dict_to_blueprint(get_screen_blueprint_dict(width, height, [1, 2])),
+			lambda: emit_screen_blueprint(width, height, [1, 2])),
+		('常量运算器{}像素'.format(MAX_PIXEL_COUNT), build_combinator_dict, build_combinator_emitter),
+	]
+	
+	for name, dict_function, emitter_function in case_list:
+		dict_bp, dict_time, dict_peak = measure(dict_function)
+		emitter_bp, emitter_time, emitter_peak = measure(emitter_function)
+		assert dict_bp == emitter_bp
+		print('{}: 字典={:.2f}ms/{:.2f}MB 片段={:.2f}ms/{:.2f}MB'.format(
+			name, dict_time * 1000, dict_peak / 1024 / 1024, emitter_time * 1000, emitter_peak / 1024 / 1024))
+
+
+if __name__ == '__main__':
+	benchmark_json_backends()
+	benchmark_entity_memory()
+	benchmark_pixel_signal_lookup()
+	benchmark_frame_color_list()
+	benchmark_screen_blueprint()
+	benchmark_book_codec()
+	benchmark_decode_cache()
+	benchmark_spatial_index()
+	benchmark_wire_graph()
+	benchmark_blueprint_emitter()
@@ -0,0 +1,150 @@
+import hashlib
+import os
+import pickle
+import threading
+
+from collections import OrderedDict
+
+"""
+内容寻址缓存
+
+键由内容哈希与参数共同生成，值可以是任意可pickle的对象
+内存层为固定条目数的LRU，可选的磁盘层按总字节数淘汰最久未使用的文件
+界面中被取消的任务可能与新任务同时运行，因此读写都持有锁
+"""
+
+
+def make_cache_key(*parts) -> str:
+	"""由若干参数生成缓存键"""
+	return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+
+_file_hash_dict = {}  # (路径, 修改时间, 大小) -> 文件哈希，避免重复读取未变化的文件
+
+
+def get_file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+	"""计算文件内容的sha256"""
+	
+	stat = os.stat(file_path)
+	memo_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+	if memo_key in _file_hash_dict:
+		return _file_hash_dict[memo_key]
+	
+	sha = hashlib.sha256()
+	with open(file_path, 'rb') as f:
+		while chunk := f.read(chunk_size):
+			sha.update(chunk)
+	
+	_file_hash_dict[memo_key] = sha.hexdigest()
+	return _file_hash_dict[memo_key]
+
+
+class ContentCache:
+	"""内存LRU + 可选磁盘层的缓存"""
+	
+	def __init__(
+			self, max_memory_items: int = 32,
+			disk_dir: str | None = None, max_disk_bytes: int = 256 * 1024 * 1024) -> None:
+		self.max_memory_items = max_memory_items  # 内存层最多保留的条目数
+		self.disk_dir = disk_dir  # 磁盘层目录，为None时不使用磁盘层
+		self.max_disk_bytes = max_disk_bytes  # 磁盘层最多占用的字节数
+		
+		self.memory_dict: OrderedDict = OrderedDict()
+		self.lock = threading.RLock()  # 保护内存层的OrderedDict与磁盘层的临时文件
+		self.hits = 0  # 命中次数
+		self.misses = 0  # 未命中次数
+		
+		if self.disk_dir:
+			os.makedirs(self.disk_dir, exist_ok=True)
+	
+	def set_disk_dir(self, disk_dir: str | None, max_disk_bytes: int | None = None) -> None:
+		"""启用、切换或关闭磁盘层"""
+		self.disk_dir = disk_dir
+		if max_disk_bytes is not None:
+			self.max_disk_bytes = max_disk_bytes
+		if self.disk_dir:
+			os.makedirs(self.disk_dir, exist_ok=True)
+	
+	def get_disk_path(self, key: str) -> str:
+		"""获取缓存键对应的磁盘文件路径"""
+		return os.path.join(self.disk_dir, key + '.pickle')
+	
+	def get(self, key: str, default=None):
+		"""读取缓存，先查内存层再查磁盘层，未命中时返回default"""
+		
+		with self.lock:
+			if key in self.memory_dict:
+				self.memory_dict.move_to_end(key)
+				self.hits += 1
+				return self.memory_dict[key]
+			
+			if self.disk_dir:
+				disk_path = self.get_disk_path(key)
+				try:
+					with open(disk_path, 'rb') as f:
+						value = pickle.load(f)
+					os.utime(disk_path)  # 以修改时间记录最近使用
+				except (OSError, pickle.UnpicklingError, EOFError):
+					pass
+				else:
+					self.put_memory(key, value)
+					self.hits += 1
+					return value
+			
+			self.misses += 1
+			return default
+	
+	def put(self, key: str, value) -> None:
+		"""写入缓存"""
+		with self.lock:
+			self.put_memory(key, value)
+			if self.disk_dir:
+				self.put_disk(key, value)
+	
+	def put_memory(self, key: str, value) -> None:
+		"""写入内存层，超出条目数时淘汰最久未使用的条目"""
+		with self.lock:
+			self.memory_dict[key] = value
+			self.memory_dict.move_to_end(key)
+			while len(self.memory_dict) > self.max_memory_items:
+				self.memory_dict.popitem(last=False)
+	
+	def put_disk(self, key: str, value) -> None:
+		"""写入磁盘层，超出总字节数时按最近使用时间淘汰"""
+		with self.lock:
+			disk_path = self.get_disk_path(key)
+			temp_path = disk_path + '.tmp'
+			with open(temp_path, 'wb') as f:
+				pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+			os.replace(temp_path, disk_path)
+			
+			self.evict_disk()
+	
+	def evict_disk(self) -> None:
+		"""淘汰磁盘层中最久未使用的文件，直到总字节数不超过上限"""
+		file_list = []
+		total_size = 0
+		for entry in os.scandir(self.disk_dir):
+			if entry.is_file() and entry.name.endswith('.pickle'):
+				stat = entry.stat()
+				file_list.append((stat.st_mtime_ns, stat.st_size, entry.path))
+				total_size += stat.st_size
+		
+		file_list.sort()
+		for _, size, path in file_list:
+			if total_size <= self.max_disk_bytes:
+				break
+			try:
+				os.remove(path)
+			except OSError:
+				continue
+			total_size -= size
+	
+	def clear(self) -> None:
+		"""清空内存层与磁盘层"""
+		with self.lock:
+			self.memory_dict.clear()
+			if self.disk_dir:
+				for entry in os.scandir(self.disk_dir):
+					if entry.is_file() and entry.name.endswith('.pickle'):
+						os.remove(entry.path)
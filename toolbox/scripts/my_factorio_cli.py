@@ -0,0 +1,252 @@
+import argparse
+import glob
+import os
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+from my_factorio_lib import *
+from my_factorio_consts import QualityType
+
+"""
+无界面的批量处理命令行
+对目录树下的每个蓝图文件依次解码、变换（改名、改品质、旋转）、重新编码并校验，
+每个文件由一个工作进程独立处理，结果直接流式写入磁盘，主进程只汇总耗时
+
+用法示例：
+python my_factorio_cli.py ../../飞船 -o ../../导出 --quality legendary --rotate 1
+python my_factorio_cli.py ../blueprints  # 不指定输出目录时只校验，不写文件
+"""
+
+
+def get_blueprint_dict_list(bp_dict: dict) -> list:
+	"""获取蓝图或蓝图书字典中的所有蓝图字典（'blueprint'键对应的值），蓝图书会递归展开"""
+	
+	if 'blueprint' in bp_dict:
+		return [bp_dict['blueprint']]
+	if 'blueprint_book' in bp_dict:
+		return [x['blueprint'] for x in get_book_blueprint_entry_list(bp_dict)]
+	raise KeyError('blueprint')
+
+
+def set_blueprint_quality(blueprint: dict, quality: str) -> None:
+	"""将蓝图中所有实体的品质设为quality，普通品质时删除该键"""
+	
+	for entity in blueprint.get('entities', []):
+		if quality == QualityType.NORMAL.value:
+			entity.pop('quality', None)
+		else:
+			entity['quality'] = quality
+
+
+# 旋转时可以安全处理的蓝图键，其余键可能含有坐标或尺寸（如snap-to-grid），旋转后会与实体错位
+ROTATABLE_BLUEPRINT_KEY_SET = {
+	'item', 'label', 'description', 'icons', 'version', 'entities', 'tiles', 'wires', 'schedules'}
+
+# 旋转时无法处理的实体键，如载具的朝向为0~1的小数而不是方向枚举
+UNROTATABLE_ENTITY_KEY_SET = {'orientation'}
+
+
+def check_blueprint_rotatable(blueprint: dict) -> None:
+	"""检查蓝图是否只含旋转时能处理的数据，否则抛出ValueError"""
+	
+	key_set = set(blueprint) - ROTATABLE_BLUEPRINT_KEY_SET
+	for entity in blueprint.get('entities', []):
+		key_set |= set(entity) & UNROTATABLE_ENTITY_KEY_SET
+	if key_set:
+		raise ValueError('蓝图含有无法旋转的数据：{}'.format(', '.join(sorted(key_set))))
+
+
+def rotate_tiles(tile_list: list, quarter_turns: int) -> None:
+	"""
+	绕原点顺时针旋转地砖若干个90度
+	地砖坐标为其左上角，中心为 (x + 0.5, y + 0.5)，中心按 (x, y) -> (-y, x) 旋转后再换算回左上角
+	"""
+	
+	for tile in tile_list:
+		position = tile['position']
+		x, y = position['x'], position['y']
+		for _ in range(quarter_turns % 4):
+			x, y = -y - 1, x
+		position['x'], position['y'] = x, y
+
+
+def rotate_blueprint(blueprint: dict, quarter_turns: int) -> None:
+	"""
+	绕原点顺时针旋转蓝图中的所有实体与地砖若干个90度，原点旋转不会破坏网格对齐
+	蓝图含有无法处理的坐标数据时抛出ValueError，此时蓝图保持不变
+	"""
+	
+	check_blueprint_rotatable(blueprint)
+	
+	entity_table = EntityTable(blueprint.get('entities', []))
+	entity_table.rotate(quarter_turns)
+	entity_table.write_back()
+	
+	rotate_tiles(blueprint.get('tiles', []), quarter_turns)
+
+
+def transform_blueprint_dict(
+		bp_dict: dict, label: str | None = None, quality: str | None = None,
+		quarter_turns: int = 0, stem: str = '') -> dict:
+	"""
+	就地变换蓝图或蓝图书字典
+	label只改写顶层的名称，其中的{stem}替换为文件名；品质与旋转作用于其中的每个蓝图
+	"""
+	
+	blueprint_list = get_blueprint_dict_list(bp_dict)
+	if quarter_turns % 4:
+		for blueprint in blueprint_list:
+			check_blueprint_rotatable(blueprint)  # 先检查全部蓝图，避免蓝图书只旋转了一部分
+	
+	if label is not None:
+		patch_blueprint_dict_metadata(bp_dict, label=label.replace('{stem}', stem))
+	
+	for blueprint in blueprint_list:
+		if quality:
+			set_blueprint_quality(blueprint, quality)
+		if quarter_turns % 4:
+			rotate_blueprint(blueprint, quarter_turns)
+	
+	return bp_dict
+
+
+def process_blueprint_file(
+		input_path: str, output_path: str | None = None,
+		label: str | None = None, quality: str | None = None, quarter_turns: int = 0,
+		compression_level: int = CompressionLevelType.DEFAULT.value) -> dict:
+	"""
+	处理单个蓝图文件，在工作进程中调用
+	output_path为None时只在内存中编码并校验；返回处理报告，出错时报告中的error为错误信息
+	"""
+	
+	report = {
+		'input': input_path, 'output': output_path, 'error': '',
+		'input_size': os.path.getsize(input_path), 'output_size': 0,
+		'decode': 0.0, 'transform': 0.0, 'encode': 0.0, 'validate': 0.0,
+	}
+	
+	try:
+		start = time.perf_counter()
+		with open(input_path, 'r', encoding='utf-8') as f:
+			bp_dict = blueprint_stream_to_dict(f)
+		report['decode'] = time.perf_counter() - start
+		
+		start = time.perf_counter()
+		stem = os.path.splitext(os.path.basename(input_path))[0]
+		transform_blueprint_dict(bp_dict, label, quality, quarter_turns, stem)
+		report['transform'] = time.perf_counter() - start
+		
+		start = time.perf_counter()
+		if output_path:
+			os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+			with open(output_path, 'w', encoding='utf-8') as f:
+				report['output_size'] = dict_to_blueprint_stream(bp_dict, f, compression_level=compression_level)
+		else:
+			bp = dict_to_blueprint(bp_dict, compression_level)
+			report['output_size'] = len(bp)
+		report['encode'] = time.perf_counter() - start
+		
+		# 重新解码写出的结果，确认与变换后的字典一致
+		start = time.perf_counter()
+		if output_path:
+			with open(output_path, 'r', encoding='utf-8') as f:
+				decoded_dict = blueprint_stream_to_dict(f)
+		else:
+			decoded_dict = blueprint_to_dict(bp)
+		if decoded_dict != bp_dict:
+			report['error'] = '重新解码后的结果与原数据不一致'
+		report['validate'] = time.perf_counter() - start
+	except Exception as e:
+		report['error'] = '{}: {}'.format(type(e).__name__, e)
+	
+	return report
+
+
+def get_blueprint_file_path_list(input_dir: str, pattern: str = '*.txt') -> list:
+	"""递归获取目录树下所有匹配pattern的文件，按路径排序"""
+	return sorted(glob.glob(os.path.join(input_dir, '**', pattern), recursive=True))
+
+
+def process_blueprint_dir(
+		input_dir: str, output_dir: str | None = None, pattern: str = '*.txt',
+		label: str | None = None, quality: str | None = None, quarter_turns: int = 0,
+		compression_level: int = CompressionLevelType.DEFAULT.value, workers: int | None = None) -> list:
+	"""
+	用进程池处理目录树下的所有蓝图文件，输出文件保持相对路径，每处理完一个文件立即打印其耗时
+	返回全部处理报告
+	"""
+	
+	input_path_list = get_blueprint_file_path_list(input_dir, pattern)
+	output_path_list = [
+		os.path.join(output_dir, os.path.relpath(x, input_dir)) if output_dir else None for x in input_path_list]
+	args = (
+		input_path_list, output_path_list,
+		[label] * len(input_path_list), [quality] * len(input_path_list),
+		[quarter_turns] * len(input_path_list), [compression_level] * len(input_path_list))
+	
+	report_list = []
+	start = time.perf_counter()
+	if workers == 1 or len(input_path_list) <= 1:
+		report_iter = map(process_blueprint_file, *args)
+		executor = None
+	else:
+		executor = ProcessPoolExecutor(max_workers=workers)
+		report_iter = executor.map(process_blueprint_file, *args)
+	
+	try:
+		for report in report_iter:
+			report_list.append(report)
+			print_report(report, input_dir)
+	finally:
+		if executor is not None:
+			executor.shutdown()
+	
+	failed_count = sum(1 for x in report_list if x['error'])
+	print('共{}个文件，失败{}个，总耗时{:.2f}s'.format(
+		len(report_list), failed_count, time.perf_counter() - start))
+	return report_list
+
+
+def print_report(report: dict, input_dir: str = '') -> None:
+	"""打印单个文件的处理结果与各阶段耗时"""
+	
+	path = os.path.relpath(report['input'], input_dir) if input_dir else report['input']
+	if report['error']:
+		print('[失败] {} {}'.format(path, report['error']))
+		return
+	
+	print('[成功] {} 解码={:.1f}ms 变换={:.1f}ms 编码={:.1f}ms 校验={:.1f}ms 字符数={}->{}'.format(
+		path, report['decode'] * 1000, report['transform'] * 1000, report['encode'] * 1000,
+		report['validate'] * 1000, report['input_size'], report['output_size']))
+
+
+def main(argv: list | None = None) -> int:
+	"""命令行入口，返回退出码，有文件失败时为1"""
+	
+	parser = argparse.ArgumentParser(description='批量解码、变换、重新编码并校验目录树下的蓝图文件')
+	parser.add_argument('input_dir', help='输入目录，递归查找其中的蓝图文件')
+	parser.add_argument('-o', '--output-dir', default=None, help='输出目录，保持相对路径；不指定时只校验不写文件')
+	parser.add_argument('--pattern', default='*.txt', help='蓝图文件名匹配模式，默认*.txt')
+	parser.add_argument('--label', default=None, help='改写顶层名称，{stem}会替换为文件名，空字符串表示删除名称')
+	parser.add_argument('--quality', default=None, choices=ALL_QUALITY_LIST, help='将所有实体设为该品质')
+	parser.add_argument('--rotate', type=int, default=0, help='绕原点顺时针旋转的90度次数')
+	parser.add_argument(
+		'--compression-level', type=int, default=CompressionLevelType.DEFAULT.value, help='zlib压缩等级，-1~9')
+	parser.add_argument('--workers', type=int, default=None, help='工作进程数，默认按CPU核数，1为串行')
+	args = parser.parse_args(argv)
+	
+	if not os.path.isdir(args.input_dir):
+		print('输入目录不存在：{}'.format(args.input_dir))
+		return 1
+	
+	report_list = process_blueprint_dir(
+		args.input_dir, args.output_dir, args.pattern,
+		args.label, args.quality, args.rotate, args.compression_level, args.workers)
+	
+	return 1 if any(x['error'] for x in report_list) else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -33,596 +33,702 @@ class WireType(Enum):
 	GREEN_OUTPUT = 4  # 绿线输出
 
 
+class CompressionLevelType(Enum):
+	"""蓝图压缩档位枚举，值为zlib压缩等级"""
+	
+	FAST = 1  # 最快，适合交互预览
+	DEFAULT = -1  # zlib默认等级
+	MAX = 9  # 最小体积
+
+
 # 全品质列表
 ALL_QUALITY_LIST = ['normal', 'uncommon', 'rare', 'epic', 'legendary']
 
-# 全信号字典
-ALL_SIGNAL_DICT = {
-	'0': {'name': 'accumulator'},
-	'1': {'name': 'acid-neutralisation', 'type': 'recipe'},
-	'2': {'name': 'active-provider-chest'},
-	'3': {'name': 'advanced-carbonic-asteroid-crushing', 'type': 'recipe'},
-	'4': {'name': 'advanced-circuit'},
-	'5': {'name': 'advanced-metallic-asteroid-crushing', 'type': 'recipe'},
-	'6': {'name': 'advanced-oil-processing', 'type': 'recipe'},
-	'7': {'name': 'advanced-oxide-asteroid-crushing', 'type': 'recipe'},
-	'8': {'name': 'advanced-thruster-fuel', 'type': 'recipe'},
-	'9': {'name': 'advanced-thruster-oxidizer', 'type': 'recipe'},
-	'10': {'name': 'agricultural-science-pack'},
-	'11': {'name': 'agricultural-tower'},
-	'12': {'name': 'ammonia', 'type': 'fluid'},
-	'13': {'name': 'ammonia-rocket-fuel', 'type': 'recipe'},
-	'14': {'name': 'ammoniacal-solution', 'type': 'fluid'},
-	'15': {'name': 'ammoniacal-solution-separation', 'type': 'recipe'},
-	'16': {'name': 'aquilo', 'type': 'space-location'},
-	'17': {'name': 'arithmetic-combinator'},
-	'18': {'name': 'artificial-jellynut-soil'},
-	'19': {'name': 'artificial-yumako-soil'},
-	'20': {'name': 'artillery-shell'},
-	'21': {'name': 'artillery-targeting-remote'},
-	'22': {'name': 'artillery-turret'},
-	'23': {'name': 'artillery-wagon'},
-	'24': {'name': 'assembling-machine-1'},
-	'25': {'name': 'assembling-machine-2'},
-	'26': {'name': 'assembling-machine-3'},
-	'27': {'name': 'asteroid-collector'},
-	'28': {'name': 'atomic-bomb'},
-	'29': {'name': 'automation-science-pack'},
-	'30': {'name': 'barrel'},
-	'31': {'name': 'basic-oil-processing', 'type': 'recipe'},
-	'32': {'name': 'battery'},
-	'33': {'name': 'battery-equipment'},
-	'34': {'name': 'battery-mk2-equipment'},
-	'35': {'name': 'battery-mk3-equipment'},
-	'36': {'name': 'beacon'},
-	'37': {'name': 'behemoth-biter', 'type': 'entity'},
-	'38': {'name': 'behemoth-spitter', 'type': 'entity'},
-	'39': {'name': 'behemoth-worm-turret', 'type': 'entity'},
-	'40': {'name': 'belt-immunity-equipment'},
-	'41': {'name': 'big-biter', 'type': 'entity'},
-	'42': {'name': 'big-carbonic-asteroid', 'type': 'entity'},
-	'43': {'name': 'big-demolisher', 'type': 'entity'},
-	'44': {'name': 'big-demolisher-corpse', 'type': 'entity'},
-	'45': {'name': 'big-electric-pole'},
-	'46': {'name': 'big-fulgora-rock', 'type': 'entity'},
-	'47': {'name': 'big-metallic-asteroid', 'type': 'entity'},
-	'48': {'name': 'big-mining-drill'},
-	'49': {'name': 'big-oxide-asteroid', 'type': 'entity'},
-	'50': {'name': 'big-promethium-asteroid', 'type': 'entity'},
-	'51': {'name': 'big-sand-rock', 'type': 'entity'},
-	'52': {'name': 'big-spitter', 'type': 'entity'},
-	'53': {'name': 'big-stomper-pentapod', 'type': 'entity'},
-	'54': {'name': 'big-stomper-shell', 'type': 'entity'},
-	'55': {'name': 'big-strafer-pentapod', 'type': 'entity'},
-	'56': {'name': 'big-volcanic-rock', 'type': 'entity'},
-	'57': {'name': 'big-worm-turret', 'type': 'entity'},
-	'58': {'name': 'big-wriggler-pentapod', 'type': 'entity'},
-	'59': {'name': 'big-wriggler-pentapod-premature', 'type': 'entity'},
-	'60': {'name': 'biochamber'},
-	'61': {'name': 'bioflux'},
-	'62': {'name': 'biolab'},
-	'63': {'name': 'biolubricant', 'type': 'recipe'},
-	'64': {'name': 'bioplastic', 'type': 'recipe'},
-	'65': {'name': 'biosulfur', 'type': 'recipe'},
-	'66': {'name': 'biter-egg'},
-	'67': {'name': 'biter-spawner', 'type': 'entity'},
-	'68': {'name': 'blueprint'},
-	'69': {'name': 'blueprint-book'},
-	'70': {'name': 'boiler'},
-	'71': {'name': 'boompuff', 'type': 'entity'},
-	'72': {'name': 'buffer-chest'},
-	'73': {'name': 'bulk-inserter'},
-	'74': {'name': 'burner-generator'},
-	'75': {'name': 'burner-inserter'},
-	'76': {'name': 'burner-mining-drill'},
-	'77': {'name': 'burnt-spoilage', 'type': 'recipe'},
-	'78': {'name': 'calcite'},
-	'79': {'name': 'cannon-shell'},
-	'80': {'name': 'captive-biter-spawner'},
-	'81': {'name': 'capture-robot-rocket'},
-	'82': {'name': 'car'},
-	'83': {'name': 'carbon'},
-	'84': {'name': 'carbon-fiber'},
-	'85': {'name': 'carbonic-asteroid-chunk'},
-	'86': {'name': 'carbonic-asteroid-crushing', 'type': 'recipe'},
-	'87': {'name': 'carbonic-asteroid-reprocessing', 'type': 'recipe'},
-	'88': {'name': 'cargo-bay'},
-	'89': {'name': 'cargo-landing-pad'},
-	'90': {'name': 'cargo-pod', 'type': 'entity'},
-	'91': {'name': 'cargo-pod-container', 'type': 'entity'},
-	'92': {'name': 'cargo-wagon'},
-	'93': {'name': 'casting-copper', 'type': 'recipe'},
-	'94': {'name': 'casting-copper-cable', 'type': 'recipe'},
-	'95': {'name': 'casting-iron', 'type': 'recipe'},
-	'96': {'name': 'casting-iron-gear-wheel', 'type': 'recipe'},
-	'97': {'name': 'casting-iron-stick', 'type': 'recipe'},
-	'98': {'name': 'casting-low-density-structure', 'type': 'recipe'},
-	'99': {'name': 'casting-pipe', 'type': 'recipe'},
-	'100': {'name': 'casting-pipe-to-ground', 'type': 'recipe'},
-	'101': {'name': 'casting-steel', 'type': 'recipe'},
-	'102': {'name': 'centrifuge'},
-	'103': {'name': 'character', 'type': 'entity'},
-	'104': {'name': 'chemical-plant'},
-	'105': {'name': 'chemical-science-pack'},
-	'106': {'name': 'cliff', 'type': 'entity'},
-	'107': {'name': 'cliff-explosives'},
-	'108': {'name': 'cliff-fulgora', 'type': 'entity'},
-	'109': {'name': 'cliff-gleba', 'type': 'entity'},
-	'110': {'name': 'cliff-vulcanus', 'type': 'entity'},
-	'111': {'name': 'cluster-grenade'},
-	'112': {'name': 'coal'},
-	'113': {'name': 'coal-liquefaction', 'type': 'recipe'},
-	'114': {'name': 'coal-synthesis', 'type': 'recipe'},
-	'115': {'name': 'combat-shotgun'},
-	'116': {'name': 'concrete'},
-	'117': {'name': 'concrete-from-molten-iron', 'type': 'recipe'},
-	'118': {'name': 'constant-combinator'},
-	'119': {'name': 'construction-robot'},
-	'120': {'name': 'copper-bacteria'},
-	'121': {'name': 'copper-bacteria-cultivation', 'type': 'recipe'},
-	'122': {'name': 'copper-cable'},
-	'123': {'name': 'copper-ore'},
-	'124': {'name': 'copper-plate'},
-	'125': {'name': 'copper-stromatolite', 'type': 'entity'},
-	'126': {'name': 'copper-wire'},
-	'127': {'name': 'crater-cliff', 'type': 'entity'},
-	'128': {'name': 'crude-oil', 'type': 'fluid'},
-	'129': {'name': 'crude-oil', 'type': 'entity'},
-	'130': {'name': 'crude-oil-barrel'},
-	'131': {'name': 'crude-oil-barrel', 'type': 'recipe'},
-	'132': {'name': 'crusher'},
-	'133': {'name': 'cryogenic-plant'},
-	'134': {'name': 'cryogenic-science-pack'},
-	'135': {'name': 'cuttlepop', 'type': 'entity'},
-	'136': {'name': 'decider-combinator'},
-	'137': {'name': 'deconstruction-planner'},
-	'138': {'name': 'defender', 'type': 'entity'},
-	'139': {'name': 'defender-capsule'},
-	'140': {'name': 'depleted-uranium-fuel-cell'},
-	'141': {'name': 'destroyer', 'type': 'entity'},
-	'142': {'name': 'destroyer-capsule'},
-	'143': {'name': 'discharge-defense-equipment'},
-	'144': {'name': 'discharge-defense-remote'},
-	'145': {'name': 'display-panel'},
-	'146': {'name': 'distractor', 'type': 'entity'},
-	'147': {'name': 'distractor-capsule'},
-	'148': {'name': 'down-arrow', 'type': 'virtual'},
-	'149': {'name': 'down-left-arrow', 'type': 'virtual'},
-	'150': {'name': 'down-right-arrow', 'type': 'virtual'},
-	'151': {'name': 'efficiency-module'},
-	'152': {'name': 'efficiency-module-2'},
-	'153': {'name': 'efficiency-module-3'},
-	'154': {'name': 'electric-energy-interface'},
-	'155': {'name': 'electric-engine-unit'},
-	'156': {'name': 'electric-furnace'},
-	'157': {'name': 'electric-mining-drill'},
-	'158': {'name': 'electrolyte', 'type': 'fluid'},
-	'159': {'name': 'electromagnetic-plant'},
-	'160': {'name': 'electromagnetic-science-pack'},
-	'161': {'name': 'electronic-circuit'},
-	'162': {'name': 'empty-crude-oil-barrel', 'type': 'recipe'},
-	'163': {'name': 'empty-fluoroketone-cold-barrel', 'type': 'recipe'},
-	'164': {'name': 'empty-fluoroketone-hot-barrel', 'type': 'recipe'},
-	'165': {'name': 'empty-heavy-oil-barrel', 'type': 'recipe'},
-	'166': {'name': 'empty-light-oil-barrel', 'type': 'recipe'},
-	'167': {'name': 'empty-lubricant-barrel', 'type': 'recipe'},
-	'168': {'name': 'empty-petroleum-gas-barrel', 'type': 'recipe'},
-	'169': {'name': 'empty-sulfuric-acid-barrel', 'type': 'recipe'},
-	'170': {'name': 'empty-water-barrel', 'type': 'recipe'},
-	'171': {'name': 'energy-shield-equipment'},
-	'172': {'name': 'energy-shield-mk2-equipment'},
-	'173': {'name': 'engine-unit'},
-	'174': {'name': 'entity-ghost', 'type': 'entity'},
-	'175': {'name': 'epic', 'type': 'quality'},
-	'176': {'name': 'exoskeleton-equipment'},
-	'177': {'name': 'explosive-cannon-shell'},
-	'178': {'name': 'explosive-rocket'},
-	'179': {'name': 'explosive-uranium-cannon-shell'},
-	'180': {'name': 'explosives'},
-	'181': {'name': 'express-splitter'},
-	'182': {'name': 'express-transport-belt'},
-	'183': {'name': 'express-underground-belt'},
-	'184': {'name': 'fast-inserter'},
-	'185': {'name': 'fast-splitter'},
-	'186': {'name': 'fast-transport-belt'},
-	'187': {'name': 'fast-underground-belt'},
-	'188': {'name': 'firearm-magazine'},
-	'189': {'name': 'fish-breeding', 'type': 'recipe'},
-	'190': {'name': 'fission-reactor-equipment'},
-	'191': {'name': 'flamethrower'},
-	'192': {'name': 'flamethrower-ammo'},
-	'193': {'name': 'flamethrower-turret'},
-	'194': {'name': 'fluid-wagon'},
-	'195': {'name': 'fluorine', 'type': 'fluid'},
-	'196': {'name': 'fluorine-vent', 'type': 'entity'},
-	'197': {'name': 'fluoroketone-cold', 'type': 'fluid'},
-	'198': {'name': 'fluoroketone-cold-barrel'},
-	'199': {'name': 'fluoroketone-cold-barrel', 'type': 'recipe'},
-	'200': {'name': 'fluoroketone-cooling', 'type': 'recipe'},
-	'201': {'name': 'fluoroketone-hot', 'type': 'fluid'},
-	'202': {'name': 'fluoroketone-hot-barrel'},
-	'203': {'name': 'fluoroketone-hot-barrel', 'type': 'recipe'},
-	'204': {'name': 'flying-robot-frame'},
-	'205': {'name': 'foundation'},
-	'206': {'name': 'foundry'},
-	'207': {'name': 'fulgora', 'type': 'space-location'},
-	'208': {'name': 'fulgoran-ruin-attractor', 'type': 'entity'},
-	'209': {'name': 'fulgoran-ruin-big', 'type': 'entity'},
-	'210': {'name': 'fulgoran-ruin-colossal', 'type': 'entity'},
-	'211': {'name': 'fulgoran-ruin-huge', 'type': 'entity'},
-	'212': {'name': 'fulgoran-ruin-medium', 'type': 'entity'},
-	'213': {'name': 'fulgoran-ruin-small', 'type': 'entity'},
-	'214': {'name': 'fulgoran-ruin-stonehenge', 'type': 'entity'},
-	'215': {'name': 'fulgoran-ruin-vault', 'type': 'entity'},
-	'216': {'name': 'fulgurite', 'type': 'entity'},
-	'217': {'name': 'fulgurite-small', 'type': 'entity'},
-	'218': {'name': 'funneltrunk', 'type': 'entity'},
-	'219': {'name': 'fusion-generator'},
-	'220': {'name': 'fusion-plasma', 'type': 'fluid'},
-	'221': {'name': 'fusion-power-cell'},
-	'222': {'name': 'fusion-reactor'},
-	'223': {'name': 'fusion-reactor-equipment'},
-	'224': {'name': 'gate'},
-	'225': {'name': 'gleba', 'type': 'space-location'},
-	'226': {'name': 'gleba-spawner', 'type': 'entity'},
-	'227': {'name': 'gleba-spawner-small', 'type': 'entity'},
-	'228': {'name': 'green-wire'},
-	'229': {'name': 'grenade'},
-	'230': {'name': 'gun-turret'},
-	'231': {'name': 'hairyclubnub', 'type': 'entity'},
-	'232': {'name': 'hazard-concrete'},
-	'233': {'name': 'heat-exchanger'},
-	'234': {'name': 'heat-interface'},
-	'235': {'name': 'heat-pipe'},
-	'236': {'name': 'heating-tower'},
-	'237': {'name': 'heavy-armor'},
-	'238': {'name': 'heavy-oil', 'type': 'fluid'},
-	'239': {'name': 'heavy-oil-barrel'},
-	'240': {'name': 'heavy-oil-barrel', 'type': 'recipe'},
-	'241': {'name': 'heavy-oil-cracking', 'type': 'recipe'},
-	'242': {'name': 'holmium-ore'},
-	'243': {'name': 'holmium-plate'},
-	'244': {'name': 'holmium-solution', 'type': 'fluid'},
-	'245': {'name': 'huge-carbonic-asteroid', 'type': 'entity'},
-	'246': {'name': 'huge-metallic-asteroid', 'type': 'entity'},
-	'247': {'name': 'huge-oxide-asteroid', 'type': 'entity'},
-	'248': {'name': 'huge-promethium-asteroid', 'type': 'entity'},
-	'249': {'name': 'huge-rock', 'type': 'entity'},
-	'250': {'name': 'huge-volcanic-rock', 'type': 'entity'},
-	'251': {'name': 'ice'},
-	'252': {'name': 'ice-melting', 'type': 'recipe'},
-	'253': {'name': 'ice-platform'},
-	'254': {'name': 'infinity-chest'},
-	'255': {'name': 'infinity-pipe'},
-	'256': {'name': 'inserter'},
-	'257': {'name': 'iron-bacteria'},
-	'258': {'name': 'iron-bacteria-cultivation', 'type': 'recipe'},
-	'259': {'name': 'iron-chest'},
-	'260': {'name': 'iron-gear-wheel'},
-	'261': {'name': 'iron-ore'},
-	'262': {'name': 'iron-plate'},
-	'263': {'name': 'iron-stick'},
-	'264': {'name': 'iron-stromatolite', 'type': 'entity'},
-	'265': {'name': 'item-on-ground', 'type': 'entity'},
-	'266': {'name': 'item-request-proxy', 'type': 'entity'},
-	'267': {'name': 'jelly'},
-	'268': {'name': 'jellynut'},
-	'269': {'name': 'jellynut-processing', 'type': 'recipe'},
-	'270': {'name': 'jellynut-seed'},
-	'271': {'name': 'kovarex-enrichment-process', 'type': 'recipe'},
-	'272': {'name': 'lab'},
-	'273': {'name': 'land-mine'},
-	'274': {'name': 'landfill'},
-	'275': {'name': 'lane-splitter'},
-	'276': {'name': 'laser-turret'},
-	'277': {'name': 'lava', 'type': 'fluid'},
-	'278': {'name': 'left-arrow', 'type': 'virtual'},
-	'279': {'name': 'legendary', 'type': 'quality'},
-	'280': {'name': 'light-armor'},
-	'281': {'name': 'light-oil', 'type': 'fluid'},
-	'282': {'name': 'light-oil-barrel'},
-	'283': {'name': 'light-oil-barrel', 'type': 'recipe'},
-	'284': {'name': 'light-oil-cracking', 'type': 'recipe'},
-	'285': {'name': 'lightning', 'type': 'entity'},
-	'286': {'name': 'lightning-collector'},
-	'287': {'name': 'lightning-rod'},
-	'288': {'name': 'linked-belt'},
-	'289': {'name': 'linked-chest'},
-	'290': {'name': 'lithium'},
-	'291': {'name': 'lithium-brine', 'type': 'fluid'},
-	'292': {'name': 'lithium-brine', 'type': 'entity'},
-	'293': {'name': 'lithium-iceberg-big', 'type': 'entity'},
-	'294': {'name': 'lithium-iceberg-huge', 'type': 'entity'},
-	'295': {'name': 'lithium-plate'},
-	'296': {'name': 'locomotive'},
-	'297': {'name': 'logistic-robot'},
-	'298': {'name': 'logistic-science-pack'},
-	'299': {'name': 'long-handed-inserter'},
-	'300': {'name': 'low-density-structure'},
-	'301': {'name': 'lubricant', 'type': 'fluid'},
-	'302': {'name': 'lubricant-barrel'},
-	'303': {'name': 'lubricant-barrel', 'type': 'recipe'},
-	'304': {'name': 'mech-armor'},
-	'305': {'name': 'medium-biter', 'type': 'entity'},
-	'306': {'name': 'medium-carbonic-asteroid', 'type': 'entity'},
-	'307': {'name': 'medium-demolisher', 'type': 'entity'},
-	'308': {'name': 'medium-demolisher-corpse', 'type': 'entity'},
-	'309': {'name': 'medium-electric-pole'},
-	'310': {'name': 'medium-metallic-asteroid', 'type': 'entity'},
-	'311': {'name': 'medium-oxide-asteroid', 'type': 'entity'},
-	'312': {'name': 'medium-promethium-asteroid', 'type': 'entity'},
-	'313': {'name': 'medium-spitter', 'type': 'entity'},
-	'314': {'name': 'medium-stomper-pentapod', 'type': 'entity'},
-	'315': {'name': 'medium-stomper-shell', 'type': 'entity'},
-	'316': {'name': 'medium-strafer-pentapod', 'type': 'entity'},
-	'317': {'name': 'medium-worm-turret', 'type': 'entity'},
-	'318': {'name': 'medium-wriggler-pentapod', 'type': 'entity'},
-	'319': {'name': 'medium-wriggler-pentapod-premature', 'type': 'entity'},
-	'320': {'name': 'metallic-asteroid-chunk'},
-	'321': {'name': 'metallic-asteroid-crushing', 'type': 'recipe'},
-	'322': {'name': 'metallic-asteroid-reprocessing', 'type': 'recipe'},
-	'323': {'name': 'metallurgic-science-pack'},
-	'324': {'name': 'military-science-pack'},
-	'325': {'name': 'modular-armor'},
-	'326': {'name': 'molten-copper', 'type': 'recipe'},
-	'327': {'name': 'molten-copper', 'type': 'fluid'},
-	'328': {'name': 'molten-copper-from-lava', 'type': 'recipe'},
-	'329': {'name': 'molten-iron', 'type': 'recipe'},
-	'330': {'name': 'molten-iron', 'type': 'fluid'},
-	'331': {'name': 'molten-iron-from-lava', 'type': 'recipe'},
-	'332': {'name': 'nauvis', 'type': 'space-location'},
-	'333': {'name': 'night-vision-equipment'},
-	'334': {'name': 'normal', 'type': 'quality'},
-	'335': {'name': 'nuclear-fuel'},
-	'336': {'name': 'nuclear-fuel-reprocessing', 'type': 'recipe'},
-	'337': {'name': 'nuclear-reactor'},
-	'338': {'name': 'nutrients'},
-	'339': {'name': 'nutrients-from-bioflux', 'type': 'recipe'},
-	'340': {'name': 'nutrients-from-biter-egg', 'type': 'recipe'},
-	'341': {'name': 'nutrients-from-fish', 'type': 'recipe'},
-	'342': {'name': 'nutrients-from-spoilage', 'type': 'recipe'},
-	'343': {'name': 'nutrients-from-yumako-mash', 'type': 'recipe'},
-	'344': {'name': 'offshore-pump'},
-	'345': {'name': 'oil-refinery'},
-	'346': {'name': 'overgrowth-jellynut-soil'},
-	'347': {'name': 'overgrowth-yumako-soil'},
-	'348': {'name': 'oxide-asteroid-chunk'},
-	'349': {'name': 'oxide-asteroid-crushing', 'type': 'recipe'},
-	'350': {'name': 'oxide-asteroid-reprocessing', 'type': 'recipe'},
-	'351': {'name': 'passive-provider-chest'},
-	'352': {'name': 'pentapod-egg'},
-	'353': {'name': 'personal-laser-defense-equipment'},
-	'354': {'name': 'personal-roboport-equipment'},
-	'355': {'name': 'personal-roboport-mk2-equipment'},
-	'356': {'name': 'petroleum-gas', 'type': 'fluid'},
-	'357': {'name': 'petroleum-gas-barrel'},
-	'358': {'name': 'petroleum-gas-barrel', 'type': 'recipe'},
-	'359': {'name': 'piercing-rounds-magazine'},
-	'360': {'name': 'piercing-shotgun-shell'},
-	'361': {'name': 'pipe'},
-	'362': {'name': 'pipe-to-ground'},
-	'363': {'name': 'pistol'},
-	'364': {'name': 'plastic-bar'},
-	'365': {'name': 'poison-capsule'},
-	'366': {'name': 'power-armor'},
-	'367': {'name': 'power-armor-mk2'},
-	'368': {'name': 'power-switch'},
-	'369': {'name': 'processing-unit'},
-	'370': {'name': 'production-science-pack'},
-	'371': {'name': 'productivity-module'},
-	'372': {'name': 'productivity-module-2'},
-	'373': {'name': 'productivity-module-3'},
-	'374': {'name': 'programmable-speaker'},
-	'375': {'name': 'promethium-asteroid-chunk'},
-	'376': {'name': 'promethium-science-pack'},
-	'377': {'name': 'pump'},
-	'378': {'name': 'pumpjack'},
-	'379': {'name': 'quality-module'},
-	'380': {'name': 'quality-module-2'},
-	'381': {'name': 'quality-module-3'},
-	'382': {'name': 'quantum-processor'},
-	'383': {'name': 'radar'},
-	'384': {'name': 'rail'},
-	'385': {'name': 'rail-chain-signal'},
-	'386': {'name': 'rail-ramp'},
-	'387': {'name': 'rail-signal'},
-	'388': {'name': 'rail-support'},
-	'389': {'name': 'railgun'},
-	'390': {'name': 'railgun-ammo'},
-	'391': {'name': 'railgun-turret'},
-	'392': {'name': 'rare', 'type': 'quality'},
-	'393': {'name': 'raw-fish'},
-	'394': {'name': 'recycler'},
-	'395': {'name': 'red-wire'},
-	'396': {'name': 'refined-concrete'},
-	'397': {'name': 'refined-hazard-concrete'},
-	'398': {'name': 'repair-pack'},
-	'399': {'name': 'requester-chest'},
-	'400': {'name': 'right-arrow', 'type': 'virtual'},
-	'401': {'name': 'roboport'},
-	'402': {'name': 'rocket'},
-	'403': {'name': 'rocket-fuel'},
-	'404': {'name': 'rocket-fuel-from-jelly', 'type': 'recipe'},
-	'405': {'name': 'rocket-launcher'},
-	'406': {'name': 'rocket-part', 'type': 'recipe'},
-	'407': {'name': 'rocket-silo'},
-	'408': {'name': 'rocket-turret'},
-	'409': {'name': 'scrap'},
-	'410': {'name': 'scrap-recycling', 'type': 'recipe'},
-	'411': {'name': 'selector-combinator'},
-	'412': {'name': 'shape-circle', 'type': 'virtual'},
-	'413': {'name': 'shape-corner', 'type': 'virtual'},
-	'414': {'name': 'shape-cross', 'type': 'virtual'},
-	'415': {'name': 'shape-curve', 'type': 'virtual'},
-	'416': {'name': 'shape-diagonal', 'type': 'virtual'},
-	'417': {'name': 'shape-diagonal-cross', 'type': 'virtual'},
-	'418': {'name': 'shape-horizontal', 'type': 'virtual'},
-	'419': {'name': 'shape-t', 'type': 'virtual'},
-	'420': {'name': 'shape-vertical', 'type': 'virtual'},
-	'421': {'name': 'shattered-planet', 'type': 'space-location'},
-	'422': {'name': 'shotgun'},
-	'423': {'name': 'shotgun-shell'},
-	'424': {'name': 'signal-0', 'type': 'virtual'},
-	'425': {'name': 'signal-1', 'type': 'virtual'},
-	'426': {'name': 'signal-2', 'type': 'virtual'},
-	'427': {'name': 'signal-3', 'type': 'virtual'},
-	'428': {'name': 'signal-4', 'type': 'virtual'},
-	'429': {'name': 'signal-5', 'type': 'virtual'},
-	'430': {'name': 'signal-6', 'type': 'virtual'},
-	'431': {'name': 'signal-7', 'type': 'virtual'},
-	'432': {'name': 'signal-8', 'type': 'virtual'},
-	'433': {'name': 'signal-9', 'type': 'virtual'},
-	'434': {'name': 'signal-A', 'type': 'virtual'},
-	'435': {'name': 'signal-B', 'type': 'virtual'},
-	'436': {'name': 'signal-C', 'type': 'virtual'},
-	'437': {'name': 'signal-D', 'type': 'virtual'},
-	'438': {'name': 'signal-E', 'type': 'virtual'},
-	'439': {'name': 'signal-F', 'type': 'virtual'},
-	'440': {'name': 'signal-G', 'type': 'virtual'},
-	'441': {'name': 'signal-H', 'type': 'virtual'},
-	'442': {'name': 'signal-I', 'type': 'virtual'},
-	'443': {'name': 'signal-J', 'type': 'virtual'},
-	'444': {'name': 'signal-K', 'type': 'virtual'},
-	'445': {'name': 'signal-L', 'type': 'virtual'},
-	'446': {'name': 'signal-M', 'type': 'virtual'},
-	'447': {'name': 'signal-N', 'type': 'virtual'},
-	'448': {'name': 'signal-O', 'type': 'virtual'},
-	'449': {'name': 'signal-P', 'type': 'virtual'},
-	'450': {'name': 'signal-Q', 'type': 'virtual'},
-	'451': {'name': 'signal-R', 'type': 'virtual'},
-	'452': {'name': 'signal-S', 'type': 'virtual'},
-	'453': {'name': 'signal-T', 'type': 'virtual'},
-	'454': {'name': 'signal-U', 'type': 'virtual'},
-	'455': {'name': 'signal-V', 'type': 'virtual'},
-	'456': {'name': 'signal-W', 'type': 'virtual'},
-	'457': {'name': 'signal-X', 'type': 'virtual'},
-	'458': {'name': 'signal-Y', 'type': 'virtual'},
-	'459': {'name': 'signal-Z', 'type': 'virtual'},
-	'460': {'name': 'signal-any-quality', 'type': 'virtual'},
-	'461': {'name': 'signal-check', 'type': 'virtual'},
-	'462': {'name': 'signal-deny', 'type': 'virtual'},
-	'463': {'name': 'signal-dot', 'type': 'virtual'},
-	'464': {'name': 'signal-ghost', 'type': 'virtual'},
-	'465': {'name': 'signal-heart', 'type': 'virtual'},
-	'466': {'name': 'signal-info', 'type': 'virtual'},
-	'467': {'name': 'signal-skull', 'type': 'virtual'},
-	'468': {'name': 'signal-stack-size', 'type': 'virtual'},
-	'469': {'name': 'simple-coal-liquefaction', 'type': 'recipe'},
-	'470': {'name': 'simple-entity-with-force'},
-	'471': {'name': 'simple-entity-with-owner'},
-	'472': {'name': 'slipstack', 'type': 'entity'},
-	'473': {'name': 'slowdown-capsule'},
-	'474': {'name': 'small-biter', 'type': 'entity'},
-	'475': {'name': 'small-carbonic-asteroid', 'type': 'entity'},
-	'476': {'name': 'small-demolisher', 'type': 'entity'},
-	'477': {'name': 'small-demolisher-corpse', 'type': 'entity'},
-	'478': {'name': 'small-electric-pole'},
-	'479': {'name': 'small-lamp'},
-	'480': {'name': 'small-metallic-asteroid', 'type': 'entity'},
-	'481': {'name': 'small-oxide-asteroid', 'type': 'entity'},
-	'482': {'name': 'small-promethium-asteroid', 'type': 'entity'},
-	'483': {'name': 'small-spitter', 'type': 'entity'},
-	'484': {'name': 'small-stomper-pentapod', 'type': 'entity'},
-	'485': {'name': 'small-stomper-shell', 'type': 'entity'},
-	'486': {'name': 'small-strafer-pentapod', 'type': 'entity'},
-	'487': {'name': 'small-worm-turret', 'type': 'entity'},
-	'488': {'name': 'small-wriggler-pentapod', 'type': 'entity'},
-	'489': {'name': 'small-wriggler-pentapod-premature', 'type': 'entity'},
-	'490': {'name': 'solar-panel'},
-	'491': {'name': 'solar-panel-equipment'},
-	'492': {'name': 'solar-system-edge', 'type': 'space-location'},
-	'493': {'name': 'solid-fuel'},
-	'494': {'name': 'solid-fuel-from-ammonia', 'type': 'recipe'},
-	'495': {'name': 'solid-fuel-from-heavy-oil', 'type': 'recipe'},
-	'496': {'name': 'solid-fuel-from-light-oil', 'type': 'recipe'},
-	'497': {'name': 'solid-fuel-from-petroleum-gas', 'type': 'recipe'},
-	'498': {'name': 'space-platform-foundation'},
-	'499': {'name': 'space-platform-starter-pack'},
-	'500': {'name': 'space-science-pack'},
-	'501': {'name': 'speed-module'},
-	'502': {'name': 'speed-module-2'},
-	'503': {'name': 'speed-module-3'},
-	'504': {'name': 'spidertron'},
-	'505': {'name': 'spidertron-remote'},
-	'506': {'name': 'spitter-spawner', 'type': 'entity'},
-	'507': {'name': 'splitter'},
-	'508': {'name': 'spoilage'},
-	'509': {'name': 'stack-inserter'},
-	'510': {'name': 'steam', 'type': 'fluid'},
-	'511': {'name': 'steam-condensation', 'type': 'recipe'},
-	'512': {'name': 'steam-engine'},
-	'513': {'name': 'steam-turbine'},
-	'514': {'name': 'steel-chest'},
-	'515': {'name': 'steel-furnace'},
-	'516': {'name': 'steel-plate'},
-	'517': {'name': 'stingfrond', 'type': 'entity'},
-	'518': {'name': 'stone'},
-	'519': {'name': 'stone-brick'},
-	'520': {'name': 'stone-furnace'},
-	'521': {'name': 'stone-wall'},
-	'522': {'name': 'storage-chest'},
-	'523': {'name': 'storage-tank'},
-	'524': {'name': 'submachine-gun'},
-	'525': {'name': 'substation'},
-	'526': {'name': 'sulfur'},
-	'527': {'name': 'sulfuric-acid', 'type': 'fluid'},
-	'528': {'name': 'sulfuric-acid-barrel'},
-	'529': {'name': 'sulfuric-acid-barrel', 'type': 'recipe'},
-	'530': {'name': 'sulfuric-acid-geyser', 'type': 'entity'},
-	'531': {'name': 'supercapacitor'},
-	'532': {'name': 'superconductor'},
-	'533': {'name': 'tank'},
-	'534': {'name': 'teflilly', 'type': 'entity'},
-	'535': {'name': 'tesla-ammo'},
-	'536': {'name': 'tesla-turret'},
-	'537': {'name': 'teslagun'},
-	'538': {'name': 'thruster'},
-	'539': {'name': 'thruster-fuel', 'type': 'fluid'},
-	'540': {'name': 'thruster-oxidizer', 'type': 'fluid'},
-	'541': {'name': 'tile-ghost', 'type': 'entity'},
-	'542': {'name': 'toolbelt-equipment'},
-	'543': {'name': 'train-stop'},
-	'544': {'name': 'transport-belt'},
-	'545': {'name': 'tree-seed'},
-	'546': {'name': 'tungsten-carbide'},
-	'547': {'name': 'tungsten-ore'},
-	'548': {'name': 'tungsten-plate'},
-	'549': {'name': 'turbo-splitter'},
-	'550': {'name': 'turbo-transport-belt'},
-	'551': {'name': 'turbo-underground-belt'},
-	'552': {'name': 'uncommon', 'type': 'quality'},
-	'553': {'name': 'underground-belt'},
-	'554': {'name': 'up-arrow', 'type': 'virtual'},
-	'555': {'name': 'up-left-arrow', 'type': 'virtual'},
-	'556': {'name': 'up-right-arrow', 'type': 'virtual'},
-	'557': {'name': 'upgrade-planner'},
-	'558': {'name': 'uranium-235'},
-	'559': {'name': 'uranium-238'},
-	'560': {'name': 'uranium-cannon-shell'},
-	'561': {'name': 'uranium-fuel-cell'},
-	'562': {'name': 'uranium-ore'},
-	'563': {'name': 'uranium-processing', 'type': 'recipe'},
-	'564': {'name': 'uranium-rounds-magazine'},
-	'565': {'name': 'utility-science-pack'},
-	'566': {'name': 'vulcanus', 'type': 'space-location'},
-	'567': {'name': 'vulcanus-chimney', 'type': 'entity'},
-	'568': {'name': 'vulcanus-chimney-cold', 'type': 'entity'},
-	'569': {'name': 'vulcanus-chimney-faded', 'type': 'entity'},
-	'570': {'name': 'vulcanus-chimney-short', 'type': 'entity'},
-	'571': {'name': 'vulcanus-chimney-truncated', 'type': 'entity'},
-	'572': {'name': 'water', 'type': 'fluid'},
-	'573': {'name': 'water-barrel'},
-	'574': {'name': 'water-barrel', 'type': 'recipe'},
-	'575': {'name': 'wood'},
-	'576': {'name': 'wood-processing', 'type': 'recipe'},
-	'577': {'name': 'wooden-chest'},
-	'578': {'name': 'wube-logo-space-platform', 'type': 'entity'},
-	'579': {'name': 'yumako'},
-	'580': {'name': 'yumako-mash'},
-	'581': {'name': 'yumako-processing', 'type': 'recipe'},
-	'582': {'name': 'yumako-seed'},
-	'583': {'name': 'loader'},
-	'584': {'name': 'fast-loader'},
-	'585': {'name': 'express-loader'},
-	'586': {'name': 'turbo-loader'},
+def _get_all_signal_dict() -> dict:
+	"""全信号字典，由模块的__getattr__在首次访问ALL_SIGNAL_DICT时调用"""
+	return {
+		'0': {'name': 'accumulator'},
+		'1': {'name': 'acid-neutralisation', 'type': 'recipe'},
+		'2': {'name': 'active-provider-chest'},
+		'3': {'name': 'advanced-carbonic-asteroid-crushing', 'type': 'recipe'},
+		'4': {'name': 'advanced-circuit'},
+		'5': {'name': 'advanced-metallic-asteroid-crushing', 'type': 'recipe'},
+		'6': {'name': 'advanced-oil-processing', 'type': 'recipe'},
+		'7': {'name': 'advanced-oxide-asteroid-crushing', 'type': 'recipe'},
+		'8': {'name': 'advanced-thruster-fuel', 'type': 'recipe'},
+		'9': {'name': 'advanced-thruster-oxidizer', 'type': 'recipe'},
+		'10': {'name': 'agricultural-science-pack'},
+		'11': {'name': 'agricultural-tower'},
+		'12': {'name': 'ammonia', 'type': 'fluid'},
+		'13': {'name': 'ammonia-rocket-fuel', 'type': 'recipe'},
+		'14': {'name': 'ammoniacal-solution', 'type': 'fluid'},
+		'15': {'name': 'ammoniacal-solution-separation', 'type': 'recipe'},
+		'16': {'name': 'aquilo', 'type': 'space-location'},
+		'17': {'name': 'arithmetic-combinator'},
+		'18': {'name': 'artificial-jellynut-soil'},
+		'19': {'name': 'artificial-yumako-soil'},
+		'20': {'name': 'artillery-shell'},
+		'21': {'name': 'artillery-targeting-remote'},
+		'22': {'name': 'artillery-turret'},
+		'23': {'name': 'artillery-wagon'},
+		'24': {'name': 'assembling-machine-1'},
+		'25': {'name': 'assembling-machine-2'},
+		'26': {'name': 'assembling-machine-3'},
+		'27': {'name': 'asteroid-collector'},
+		'28': {'name': 'atomic-bomb'},
+		'29': {'name': 'automation-science-pack'},
+		'30': {'name': 'barrel'},
+		'31': {'name': 'basic-oil-processing', 'type': 'recipe'},
+		'32': {'name': 'battery'},
+		'33': {'name': 'battery-equipment'},
+		'34': {'name': 'battery-mk2-equipment'},
+		'35': {'name': 'battery-mk3-equipment'},
+		'36': {'name': 'beacon'},
+		'37': {'name': 'behemoth-biter', 'type': 'entity'},
+		'38': {'name': 'behemoth-spitter', 'type': 'entity'},
+		'39': {'name': 'behemoth-worm-turret', 'type': 'entity'},
+		'40': {'name': 'belt-immunity-equipment'},
+		'41': {'name': 'big-biter', 'type': 'entity'},
+		'42': {'name': 'big-carbonic-asteroid', 'type': 'entity'},
+		'43': {'name': 'big-demolisher', 'type': 'entity'},
+		'44': {'name': 'big-demolisher-corpse', 'type': 'entity'},
+		'45': {'name': 'big-electric-pole'},
+		'46': {'name': 'big-fulgora-rock', 'type': 'entity'},
+		'47': {'name': 'big-metallic-asteroid', 'type': 'entity'},
+		'48': {'name': 'big-mining-drill'},
+		'49': {'name': 'big-oxide-asteroid', 'type': 'entity'},
+		'50': {'name': 'big-promethium-asteroid', 'type': 'entity'},
+		'51': {'name': 'big-sand-rock', 'type': 'entity'},
+		'52': {'name': 'big-spitter', 'type': 'entity'},
+		'53': {'name': 'big-stomper-pentapod', 'type': 'entity'},
+		'54': {'name': 'big-stomper-shell', 'type': 'entity'},
+		'55': {'name': 'big-strafer-pentapod', 'type': 'entity'},
+		'56': {'name': 'big-volcanic-rock', 'type': 'entity'},
+		'57': {'name': 'big-worm-turret', 'type': 'entity'},
+		'58': {'name': 'big-wriggler-pentapod', 'type': 'entity'},
+		'59': {'name': 'big-wriggler-pentapod-premature', 'type': 'entity'},
+		'60': {'name': 'biochamber'},
+		'61': {'name': 'bioflux'},
+		'62': {'name': 'biolab'},
+		'63': {'name': 'biolubricant', 'type': 'recipe'},
+		'64': {'name': 'bioplastic', 'type': 'recipe'},
+		'65': {'name': 'biosulfur', 'type': 'recipe'},
+		'66': {'name': 'biter-egg'},
+		'67': {'name': 'biter-spawner', 'type': 'entity'},
+		'68': {'name': 'blueprint'},
+		'69': {'name': 'blueprint-book'},
+		'70': {'name': 'boiler'},
+		'71': {'name': 'boompuff', 'type': 'entity'},
+		'72': {'name': 'buffer-chest'},
+		'73': {'name': 'bulk-inserter'},
+		'74': {'name': 'burner-generator'},
+		'75': {'name': 'burner-inserter'},
+		'76': {'name': 'burner-mining-drill'},
+		'77': {'name': 'burnt-spoilage', 'type': 'recipe'},
+		'78': {'name': 'calcite'},
+		'79': {'name': 'cannon-shell'},
+		'80': {'name': 'captive-biter-spawner'},
+		'81': {'name': 'capture-robot-rocket'},
+		'82': {'name': 'car'},
+		'83': {'name': 'carbon'},
+		'84': {'name': 'carbon-fiber'},
+		'85': {'name': 'carbonic-asteroid-chunk'},
+		'86': {'name': 'carbonic-asteroid-crushing', 'type': 'recipe'},
+		'87': {'name': 'carbonic-asteroid-reprocessing', 'type': 'recipe'},
+		'88': {'name': 'cargo-bay'},
+		'89': {'name': 'cargo-landing-pad'},
+		'90': {'name': 'cargo-pod', 'type': 'entity'},
+		'91': {'name': 'cargo-pod-container', 'type': 'entity'},
+		'92': {'name': 'cargo-wagon'},
+		'93': {'name': 'casting-copper', 'type': 'recipe'},
+		'94': {'name': 'casting-copper-cable', 'type': 'recipe'},
+		'95': {'name': 'casting-iron', 'type': 'recipe'},
+		'96': {'name': 'casting-iron-gear-wheel', 'type': 'recipe'},
+		'97': {'name': 'casting-iron-stick', 'type': 'recipe'},
+		'98': {'name': 'casting-low-density-structure', 'type': 'recipe'},
+		'99': {'name': 'casting-pipe', 'type': 'recipe'},
+		'100': {'name': 'casting-pipe-to-ground', 'type': 'recipe'},
+		'101': {'name': 'casting-steel', 'type': 'recipe'},
+		'102': {'name': 'centrifuge'},
+		'103': {'name': 'character', 'type': 'entity'},
+		'104': {'name': 'chemical-plant'},
+		'105': {'name': 'chemical-science-pack'},
+		'106': {'name': 'cliff', 'type': 'entity'},
+		'107': {'name': 'cliff-explosives'},
+		'108': {'name': 'cliff-fulgora', 'type': 'entity'},
+		'109': {'name': 'cliff-gleba', 'type': 'entity'},
+		'110': {'name': 'cliff-vulcanus', 'type': 'entity'},
+		'111': {'name': 'cluster-grenade'},
+		'112': {'name': 'coal'},
+		'113': {'name': 'coal-liquefaction', 'type': 'recipe'},
+		'114': {'name': 'coal-synthesis', 'type': 'recipe'},
+		'115': {'name': 'combat-shotgun'},
+		'116': {'name': 'concrete'},
+		'117': {'name': 'concrete-from-molten-iron', 'type': 'recipe'},
+		'118': {'name': 'constant-combinator'},
+		'119': {'name': 'construction-robot'},
+		'120': {'name': 'copper-bacteria'},
+		'121': {'name': 'copper-bacteria-cultivation', 'type': 'recipe'},
+		'122': {'name': 'copper-cable'},
+		'123': {'name': 'copper-ore'},
+		'124': {'name': 'copper-plate'},
+		'125': {'name': 'copper-stromatolite', 'type': 'entity'},
+		'126': {'name': 'copper-wire'},
+		'127': {'name': 'crater-cliff', 'type': 'entity'},
+		'128': {'name': 'crude-oil', 'type': 'fluid'},
+		'129': {'name': 'crude-oil', 'type': 'entity'},
+		'130': {'name': 'crude-oil-barrel'},
+		'131': {'name': 'crude-oil-barrel', 'type': 'recipe'},
+		'132': {'name': 'crusher'},
+		'133': {'name': 'cryogenic-plant'},
+		'134': {'name': 'cryogenic-science-pack'},
+		'135': {'name': 'cuttlepop', 'type': 'entity'},
+		'136': {'name': 'decider-combinator'},
+		'137': {'name': 'deconstruction-planner'},
+		'138': {'name': 'defender', 'type': 'entity'},
+		'139': {'name': 'defender-capsule'},
+		'140': {'name': 'depleted-uranium-fuel-cell'},
+		'141': {'name': 'destroyer', 'type': 'entity'},
+		'142': {'name': 'destroyer-capsule'},
+		'143': {'name': 'discharge-defense-equipment'},
+		'144': {'name': 'discharge-defense-remote'},
+		'145': {'name': 'display-panel'},
+		'146': {'name': 'distractor', 'type': 'entity'},
+		'147': {'name': 'distractor-capsule'},
+		'148': {'name': 'down-arrow', 'type': 'virtual'},
+		'149': {'name': 'down-left-arrow', 'type': 'virtual'},
+		'150': {'name': 'down-right-arrow', 'type': 'virtual'},
+		'151': {'name': 'efficiency-module'},
+		'152': {'name': 'efficiency-module-2'},
+		'153': {'name': 'efficiency-module-3'},
+		'154': {'name': 'electric-energy-interface'},
+		'155': {'name': 'electric-engine-unit'},
+		'156': {'name': 'electric-furnace'},
+		'157': {'name': 'electric-mining-drill'},
+		'158': {'name': 'electrolyte', 'type': 'fluid'},
+		'159': {'name': 'electromagnetic-plant'},
+		'160': {'name': 'electromagnetic-science-pack'},
+		'161': {'name': 'electronic-circuit'},
+		'162': {'name': 'empty-crude-oil-barrel', 'type': 'recipe'},
+		'163': {'name': 'empty-fluoroketone-cold-barrel', 'type': 'recipe'},
+		'164': {'name': 'empty-fluoroketone-hot-barrel', 'type': 'recipe'},
+		'165': {'name': 'empty-heavy-oil-barrel', 'type': 'recipe'},
+		'166': {'name': 'empty-light-oil-barrel', 'type': 'recipe'},
+		'167': {'name': 'empty-lubricant-barrel', 'type': 'recipe'},
+		'168': {'name': 'empty-petroleum-gas-barrel', 'type': 'recipe'},
+		'169': {'name': 'empty-sulfuric-acid-barrel', 'type': 'recipe'},
+		'170': {'name': 'empty-water-barrel', 'type': 'recipe'},
+		'171': {'name': 'energy-shield-equipment'},
+		'172': {'name': 'energy-shield-mk2-equipment'},
+		'173': {'name': 'engine-unit'},
+		'174': {'name': 'entity-ghost', 'type': 'entity'},
+		'175': {'name': 'epic', 'type': 'quality'},
+		'176': {'name': 'exoskeleton-equipment'},
+		'177': {'name': 'explosive-cannon-shell'},
+		'178': {'name': 'explosive-rocket'},
+		'179': {'name': 'explosive-uranium-cannon-shell'},
+		'180': {'name': 'explosives'},
+		'181': {'name': 'express-splitter'},
+		'182': {'name': 'express-transport-belt'},
+		'183': {'name': 'express-underground-belt'},
+		'184': {'name': 'fast-inserter'},
+		'185': {'name': 'fast-splitter'},
+		'186': {'name': 'fast-transport-belt'},
+		'187': {'name': 'fast-underground-belt'},
+		'188': {'name': 'firearm-magazine'},
+		'189': {'name': 'fish-breeding', 'type': 'recipe'},
+		'190': {'name': 'fission-reactor-equipment'},
+		'191': {'name': 'flamethrower'},
+		'192': {'name': 'flamethrower-ammo'},
+		'193': {'name': 'flamethrower-turret'},
+		'194': {'name': 'fluid-wagon'},
+		'195': {'name': 'fluorine', 'type': 'fluid'},
+		'196': {'name': 'fluorine-vent', 'type': 'entity'},
+		'197': {'name': 'fluoroketone-cold', 'type': 'fluid'},
+		'198': {'name': 'fluoroketone-cold-barrel'},
+		'199': {'name': 'fluoroketone-cold-barrel', 'type': 'recipe'},
+		'200': {'name': 'fluoroketone-cooling', 'type': 'recipe'},
+		'201': {'name': 'fluoroketone-hot', 'type': 'fluid'},
+		'202': {'name': 'fluoroketone-hot-barrel'},
+		'203': {'name': 'fluoroketone-hot-barrel', 'type': 'recipe'},
+		'204': {'name': 'flying-robot-frame'},
+		'205': {'name': 'foundation'},
+		'206': {'name': 'foundry'},
+		'207': {'name': 'fulgora', 'type': 'space-location'},
+		'208': {'name': 'fulgoran-ruin-attractor', 'type': 'entity'},
+		'209': {'name': 'fulgoran-ruin-big', 'type': 'entity'},
+		'210': {'name': 'fulgoran-ruin-colossal', 'type': 'entity'},
+		'211': {'name': 'fulgoran-ruin-huge', 'type': 'entity'},
+		'212': {'name': 'fulgoran-ruin-medium', 'type': 'entity'},
+		'213': {'name': 'fulgoran-ruin-small', 'type': 'entity'},
+		'214': {'name': 'fulgoran-ruin-stonehenge', 'type': 'entity'},
+		'215': {'name': 'fulgoran-ruin-vault', 'type': 'entity'},
+		'216': {'name': 'fulgurite', 'type': 'entity'},
+		'217': {'name': 'fulgurite-small', 'type': 'entity'},
+		'218': {'name': 'funneltrunk', 'type': 'entity'},
+		'219': {'name': 'fusion-generator'},
+		'220': {'name': 'fusion-plasma', 'type': 'fluid'},
+		'221': {'name': 'fusion-power-cell'},
+		'222': {'name': 'fusion-reactor'},
+		'223': {'name': 'fusion-reactor-equipment'},
+		'224': {'name': 'gate'},
+		'225': {'name': 'gleba', 'type': 'space-location'},
+		'226': {'name': 'gleba-spawner', 'type': 'entity'},
+		'227': {'name': 'gleba-spawner-small', 'type': 'entity'},
+		'228': {'name': 'green-wire'},
+		'229': {'name': 'grenade'},
+		'230': {'name': 'gun-turret'},
+		'231': {'name': 'hairyclubnub', 'type': 'entity'},
+		'232': {'name': 'hazard-concrete'},
+		'233': {'name': 'heat-exchanger'},
+		'234': {'name': 'heat-interface'},
+		'235': {'name': 'heat-pipe'},
+		'236': {'name': 'heating-tower'},
+		'237': {'name': 'heavy-armor'},
+		'238': {'name': 'heavy-oil', 'type': 'fluid'},
+		'239': {'name': 'heavy-oil-barrel'},
+		'240': {'name': 'heavy-oil-barrel', 'type': 'recipe'},
+		'241': {'name': 'heavy-oil-cracking', 'type': 'recipe'},
+		'242': {'name': 'holmium-ore'},
+		'243': {'name': 'holmium-plate'},
+		'244': {'name': 'holmium-solution', 'type': 'fluid'},
+		'245': {'name': 'huge-carbonic-asteroid', 'type': 'entity'},
+		'246': {'name': 'huge-metallic-asteroid', 'type': 'entity'},
+		'247': {'name': 'huge-oxide-asteroid', 'type': 'entity'},
+		'248': {'name': 'huge-promethium-asteroid', 'type': 'entity'},
+		'249': {'name': 'huge-rock', 'type': 'entity'},
+		'250': {'name': 'huge-volcanic-rock', 'type': 'entity'},
+		'251': {'name': 'ice'},
+		'252': {'name': 'ice-melting', 'type': 'recipe'},
+		'253': {'name': 'ice-platform'},
+		'254': {'name': 'infinity-chest'},
+		'255': {'name': 'infinity-pipe'},
+		'256': {'name': 'inserter'},
+		'257': {'name': 'iron-bacteria'},
+		'258': {'name': 'iron-bacteria-cultivation', 'type': 'recipe'},
+		'259': {'name': 'iron-chest'},
+		'260': {'name': 'iron-gear-wheel'},
+		'261': {'name': 'iron-ore'},
+		'262': {'name': 'iron-plate'},
+		'263': {'name': 'iron-stick'},
+		'264': {'name': 'iron-stromatolite', 'type': 'entity'},
+		'265': {'name': 'item-on-ground', 'type': 'entity'},
+		'266': {'name': 'item-request-proxy', 'type': 'entity'},
+		'267': {'name': 'jelly'},
+		'268': {'name': 'jellynut'},
+		'269': {'name': 'jellynut-processing', 'type': 'recipe'},
+		'270': {'name': 'jellynut-seed'},
+		'271': {'name': 'kovarex-enrichment-process', 'type': 'recipe'},
+		'272': {'name': 'lab'},
+		'273': {'name': 'land-mine'},
+		'274': {'name': 'landfill'},
+		'275': {'name': 'lane-splitter'},
+		'276': {'name': 'laser-turret'},
+		'277': {'name': 'lava', 'type': 'fluid'},
+		'278': {'name': 'left-arrow', 'type': 'virtual'},
+		'279': {'name': 'legendary', 'type': 'quality'},
+		'280': {'name': 'light-armor'},
+		'281': {'name': 'light-oil', 'type': 'fluid'},
+		'282': {'name': 'light-oil-barrel'},
+		'283': {'name': 'light-oil-barrel', 'type': 'recipe'},
+		'284': {'name': 'light-oil-cracking', 'type': 'recipe'},
+		'285': {'name': 'lightning', 'type': 'entity'},
+		'286': {'name': 'lightning-collector'},
+		'287': {'name': 'lightning-rod'},
+		'288': {'name': 'linked-belt'},
+		'289': {'name': 'linked-chest'},
+		'290': {'name': 'lithium'},
+		'291': {'name': 'lithium-brine', 'type': 'fluid'},
+		'292': {'name': 'lithium-brine', 'type': 'entity'},
+		'293': {'name': 'lithium-iceberg-big', 'type': 'entity'},
+		'294': {'name': 'lithium-iceberg-huge', 'type': 'entity'},
+		'295': {'name': 'lithium-plate'},
+		'296': {'name': 'locomotive'},
+		'297': {'name': 'logistic-robot'},
+		'298': {'name': 'logistic-science-pack'},
+		'299': {'name': 'long-handed-inserter'},
+		'300': {'name': 'low-density-structure'},
+		'301': {'name': 'lubricant', 'type': 'fluid'},
+		'302': {'name': 'lubricant-barrel'},
+		'303': {'name': 'lubricant-barrel', 'type': 'recipe'},
+		'304': {'name': 'mech-armor'},
+		'305': {'name': 'medium-biter', 'type': 'entity'},
+		'306': {'name': 'medium-carbonic-asteroid', 'type': 'entity'},
+		'307': {'name': 'medium-demolisher', 'type': 'entity'},
+		'308': {'name': 'medium-demolisher-corpse', 'type': 'entity'},
+		'309': {'name': 'medium-electric-pole'},
+		'310': {'name': 'medium-metallic-asteroid', 'type': 'entity'},
+		'311': {'name': 'medium-oxide-asteroid', 'type': 'entity'},
+		'312': {'name': 'medium-promethium-asteroid', 'type': 'entity'},
+		'313': {'name': 'medium-spitter', 'type': 'entity'},
+		'314': {'name': 'medium-stomper-pentapod', 'type': 'entity'},
+		'315': {'name': 'medium-stomper-shell', 'type': 'entity'},
+		'316': {'name': 'medium-strafer-pentapod', 'type': 'entity'},
+		'317': {'name': 'medium-worm-turret', 'type': 'entity'},
+		'318': {'name': 'medium-wriggler-pentapod', 'type': 'entity'},
+		'319': {'name': 'medium-wriggler-pentapod-premature', 'type': 'entity'},
+		'320': {'name': 'metallic-asteroid-chunk'},
+		'321': {'name': 'metallic-asteroid-crushing', 'type': 'recipe'},
+		'322': {'name': 'metallic-asteroid-reprocessing', 'type': 'recipe'},
+		'323': {'name': 'metallurgic-science-pack'},
+		'324': {'name': 'military-science-pack'},
+		'325': {'name': 'modular-armor'},
+		'326': {'name': 'molten-copper', 'type': 'recipe'},
+		'327': {'name': 'molten-copper', 'type': 'fluid'},
+		'328': {'name': 'molten-copper-from-lava', 'type': 'recipe'},
+		'329': {'name': 'molten-iron', 'type': 'recipe'},
+		'330': {'name': 'molten-iron', 'type': 'fluid'},
+		'331': {'name': 'molten-iron-from-lava', 'type': 'recipe'},
+		'332': {'name': 'nauvis', 'type': 'space-location'},
+		'333': {'name': 'night-vision-equipment'},
+		'334': {'name': 'normal', 'type': 'quality'},
+		'335': {'name': 'nuclear-fuel'},
+		'336': {'name': 'nuclear-fuel-reprocessing', 'type': 'recipe'},
+		'337': {'name': 'nuclear-reactor'},
+		'338': {'name': 'nutrients'},
+		'339': {'name': 'nutrients-from-bioflux', 'type': 'recipe'},
+		'340': {'name': 'nutrients-from-biter-egg', 'type': 'recipe'},
+		'341': {'name': 'nutrients-from-fish', 'type': 'recipe'},
+		'342': {'name': 'nutrients-from-spoilage', 'type': 'recipe'},
+		'343': {'name': 'nutrients-from-yumako-mash', 'type': 'recipe'},
+		'344': {'name': 'offshore-pump'},
+		'345': {'name': 'oil-refinery'},
+		'346': {'name': 'overgrowth-jellynut-soil'},
+		'347': {'name': 'overgrowth-yumako-soil'},
+		'348': {'name': 'oxide-asteroid-chunk'},
+		'349': {'name': 'oxide-asteroid-crushing', 'type': 'recipe'},
+		'350': {'name': 'oxide-asteroid-reprocessing', 'type': 'recipe'},
+		'351': {'name': 'passive-provider-chest'},
+		'352': {'name': 'pentapod-egg'},
+		'353': {'name': 'personal-laser-defense-equipment'},
+		'354': {'name': 'personal-roboport-equipment'},
+		'355': {'name': 'personal-roboport-mk2-equipment'},
+		'356': {'name': 'petroleum-gas', 'type': 'fluid'},
+		'357': {'name': 'petroleum-gas-barrel'},
+		'358': {'name': 'petroleum-gas-barrel', 'type': 'recipe'},
+		'359': {'name': 'piercing-rounds-magazine'},
+		'360': {'name': 'piercing-shotgun-shell'},
+		'361': {'name': 'pipe'},
+		'362': {'name': 'pipe-to-ground'},
+		'363': {'name': 'pistol'},
+		'364': {'name': 'plastic-bar'},
+		'365': {'name': 'poison-capsule'},
+		'366': {'name': 'power-armor'},
+		'367': {'name': 'power-armor-mk2'},
+		'368': {'name': 'power-switch'},
+		'369': {'name': 'processing-unit'},
+		'370': {'name': 'production-science-pack'},
+		'371': {'name': 'productivity-module'},
+		'372': {'name': 'productivity-module-2'},
+		'373': {'name': 'productivity-module-3'},
+		'374': {'name': 'programmable-speaker'},
+		'375': {'name': 'promethium-asteroid-chunk'},
+		'376': {'name': 'promethium-science-pack'},
+		'377': {'name': 'pump'},
+		'378': {'name': 'pumpjack'},
+		'379': {'name': 'quality-module'},
+		'380': {'name': 'quality-module-2'},
+		'381': {'name': 'quality-module-3'},
+		'382': {'name': 'quantum-processor'},
+		'383': {'name': 'radar'},
+		'384': {'name': 'rail'},
+		'385': {'name': 'rail-chain-signal'},
+		'386': {'name': 'rail-ramp'},
+		'387': {'name': 'rail-signal'},
+		'388': {'name': 'rail-support'},
+		'389': {'name': 'railgun'},
+		'390': {'name': 'railgun-ammo'},
+		'391': {'name': 'railgun-turret'},
+		'392': {'name': 'rare', 'type': 'quality'},
+		'393': {'name': 'raw-fish'},
+		'394': {'name': 'recycler'},
+		'395': {'name': 'red-wire'},
+		'396': {'name': 'refined-concrete'},
+		'397': {'name': 'refined-hazard-concrete'},
+		'398': {'name': 'repair-pack'},
+		'399': {'name': 'requester-chest'},
+		'400': {'name': 'right-arrow', 'type': 'virtual'},
+		'401': {'name': 'roboport'},
+		'402': {'name': 'rocket'},
+		'403': {'name': 'rocket-fuel'},
+		'404': {'name': 'rocket-fuel-from-jelly', 'type': 'recipe'},
+		'405': {'name': 'rocket-launcher'},
+		'406': {'name': 'rocket-part', 'type': 'recipe'},
+		'407': {'name': 'rocket-silo'},
+		'408': {'name': 'rocket-turret'},
+		'409': {'name': 'scrap'},
+		'410': {'name': 'scrap-recycling', 'type': 'recipe'},
+		'411': {'name': 'selector-combinator'},
+		'412': {'name': 'shape-circle', 'type': 'virtual'},
+		'413': {'name': 'shape-corner', 'type': 'virtual'},
+		'414': {'name': 'shape-cross', 'type': 'virtual'},
+		'415': {'name': 'shape-curve', 'type': 'virtual'},
+		'416': {'name': 'shape-diagonal', 'type': 'virtual'},
+		'417': {'name': 'shape-diagonal-cross', 'type': 'virtual'},
+		'418': {'name': 'shape-horizontal', 'type': 'virtual'},
+		'419': {'name': 'shape-t', 'type': 'virtual'},
+		'420': {'name': 'shape-vertical', 'type': 'virtual'},
+		'421': {'name': 'shattered-planet', 'type': 'space-location'},
+		'422': {'name': 'shotgun'},
+		'423': {'name': 'shotgun-shell'},
+		'424': {'name': 'signal-0', 'type': 'virtual'},
+		'425': {'name': 'signal-1', 'type': 'virtual'},
+		'426': {'name': 'signal-2', 'type': 'virtual'},
+		'427': {'name': 'signal-3', 'type': 'virtual'},
+		'428': {'name': 'signal-4', 'type': 'virtual'},
+		'429': {'name': 'signal-5', 'type': 'virtual'},
+		'430': {'name': 'signal-6', 'type': 'virtual'},
+		'431': {'name': 'signal-7', 'type': 'virtual'},
+		'432': {'name': 'signal-8', 'type': 'virtual'},
+		'433': {'name': 'signal-9', 'type': 'virtual'},
+		'434': {'name': 'signal-A', 'type': 'virtual'},
+		'435': {'name': 'signal-B', 'type': 'virtual'},
+		'436': {'name': 'signal-C', 'type': 'virtual'},
+		'437': {'name': 'signal-D', 'type': 'virtual'},
+		'438': {'name': 'signal-E', 'type': 'virtual'},
+		'439': {'name': 'signal-F', 'type': 'virtual'},
+		'440': {'name': 'signal-G', 'type': 'virtual'},
+		'441': {'name': 'signal-H', 'type': 'virtual'},
+		'442': {'name': 'signal-I', 'type': 'virtual'},
+		'443': {'name': 'signal-J', 'type': 'virtual'},
+		'444': {'name': 'signal-K', 'type': 'virtual'},
+		'445': {'name': 'signal-L', 'type': 'virtual'},
+		'446': {'name': 'signal-M', 'type': 'virtual'},
+		'447': {'name': 'signal-N', 'type': 'virtual'},
+		'448': {'name': 'signal-O', 'type': 'virtual'},
+		'449': {'name': 'signal-P', 'type': 'virtual'},
+		'450': {'name': 'signal-Q', 'type': 'virtual'},
+		'451': {'name': 'signal-R', 'type': 'virtual'},
+		'452': {'name': 'signal-S', 'type': 'virtual'},
+		'453': {'name': 'signal-T', 'type': 'virtual'},
+		'454': {'name': 'signal-U', 'type': 'virtual'},
+		'455': {'name': 'signal-V', 'type': 'virtual'},
+		'456': {'name': 'signal-W', 'type': 'virtual'},
+		'457': {'name': 'signal-X', 'type': 'virtual'},
+		'458': {'name': 'signal-Y', 'type': 'virtual'},
+		'459': {'name': 'signal-Z', 'type': 'virtual'},
+		'460': {'name': 'signal-any-quality', 'type': 'virtual'},
+		'461': {'name': 'signal-check', 'type': 'virtual'},
+		'462': {'name': 'signal-deny', 'type': 'virtual'},
+		'463': {'name': 'signal-dot', 'type': 'virtual'},
+		'464': {'name': 'signal-ghost', 'type': 'virtual'},
+		'465': {'name': 'signal-heart', 'type': 'virtual'},
+		'466': {'name': 'signal-info', 'type': 'virtual'},
+		'467': {'name': 'signal-skull', 'type': 'virtual'},
+		'468': {'name': 'signal-stack-size', 'type': 'virtual'},
+		'469': {'name': 'simple-coal-liquefaction', 'type': 'recipe'},
+		'470': {'name': 'simple-entity-with-force'},
+		'471': {'name': 'simple-entity-with-owner'},
+		'472': {'name': 'slipstack', 'type': 'entity'},
+		'473': {'name': 'slowdown-capsule'},
+		'474': {'name': 'small-biter', 'type': 'entity'},
+		'475': {'name': 'small-carbonic-asteroid', 'type': 'entity'},
+		'476': {'name': 'small-demolisher', 'type': 'entity'},
+		'477': {'name': 'small-demolisher-corpse', 'type': 'entity'},
+		'478': {'name': 'small-electric-pole'},
+		'479': {'name': 'small-lamp'},
+		'480': {'name': 'small-metallic-asteroid', 'type': 'entity'},
+		'481': {'name': 'small-oxide-asteroid', 'type': 'entity'},
+		'482': {'name': 'small-promethium-asteroid', 'type': 'entity'},
+		'483': {'name': 'small-spitter', 'type': 'entity'},
+		'484': {'name': 'small-stomper-pentapod', 'type': 'entity'},
+		'485': {'name': 'small-stomper-shell', 'type': 'entity'},
+		'486': {'name': 'small-strafer-pentapod', 'type': 'entity'},
+		'487': {'name': 'small-worm-turret', 'type': 'entity'},
+		'488': {'name': 'small-wriggler-pentapod', 'type': 'entity'},
+		'489': {'name': 'small-wriggler-pentapod-premature', 'type': 'entity'},
+		'490': {'name': 'solar-panel'},
+		'491': {'name': 'solar-panel-equipment'},
+		'492': {'name': 'solar-system-edge', 'type': 'space-location'},
+		'493': {'name': 'solid-fuel'},
+		'494': {'name': 'solid-fuel-from-ammonia', 'type': 'recipe'},
+		'495': {'name': 'solid-fuel-from-heavy-oil', 'type': 'recipe'},
+		'496': {'name': 'solid-fuel-from-light-oil', 'type': 'recipe'},
+		'497': {'name': 'solid-fuel-from-petroleum-gas', 'type': 'recipe'},
+		'498': {'name': 'space-platform-foundation'},
+		'499': {'name': 'space-platform-starter-pack'},
+		'500': {'name': 'space-science-pack'},
+		'501': {'name': 'speed-module'},
+		'502': {'name': 'speed-module-2'},
+		'503': {'name': 'speed-module-3'},
+		'504': {'name': 'spidertron'},
+		'505': {'name': 'spidertron-remote'},
+		'506': {'name': 'spitter-spawner', 'type': 'entity'},
+		'507': {'name': 'splitter'},
+		'508': {'name': 'spoilage'},
+		'509': {'name': 'stack-inserter'},
+		'510': {'name': 'steam', 'type': 'fluid'},
+		'511': {'name': 'steam-condensation', 'type': 'recipe'},
+		'512': {'name': 'steam-engine'},
+		'513': {'name': 'steam-turbine'},
+		'514': {'name': 'steel-chest'},
+		'515': {'name': 'steel-furnace'},
+		'516': {'name': 'steel-plate'},
+		'517': {'name': 'stingfrond', 'type': 'entity'},
+		'518': {'name': 'stone'},
+		'519': {'name': 'stone-brick'},
+		'520': {'name': 'stone-furnace'},
+		'521': {'name': 'stone-wall'},
+		'522': {'name': 'storage-chest'},
+		'523': {'name': 'storage-tank'},
+		'524': {'name': 'submachine-gun'},
+		'525': {'name': 'substation'},
+		'526': {'name': 'sulfur'},
+		'527': {'name': 'sulfuric-acid', 'type': 'fluid'},
+		'528': {'name': 'sulfuric-acid-barrel'},
+		'529': {'name': 'sulfuric-acid-barrel', 'type': 'recipe'},
+		'530': {'name': 'sulfuric-acid-geyser', 'type': 'entity'},
+		'531': {'name': 'supercapacitor'},
+		'532': {'name': 'superconductor'},
+		'533': {'name': 'tank'},
+		'534': {'name': 'teflilly', 'type': 'entity'},
+		'535': {'name': 'tesla-ammo'},
+		'536': {'name': 'tesla-turret'},
+		'537': {'name': 'teslagun'},
+		'538': {'name': 'thruster'},
+		'539': {'name': 'thruster-fuel', 'type': 'fluid'},
+		'540': {'name': 'thruster-oxidizer', 'type': 'fluid'},
+		'541': {'name': 'tile-ghost', 'type': 'entity'},
+		'542': {'name': 'toolbelt-equipment'},
+		'543': {'name': 'train-stop'},
+		'544': {'name': 'transport-belt'},
+		'545': {'name': 'tree-seed'},
+		'546': {'name': 'tungsten-carbide'},
+		'547': {'name': 'tungsten-ore'},
+		'548': {'name': 'tungsten-plate'},
+		'549': {'name': 'turbo-splitter'},
+		'550': {'name': 'turbo-transport-belt'},
+		'551': {'name': 'turbo-underground-belt'},
+		'552': {'name': 'uncommon', 'type': 'quality'},
+		'553': {'name': 'underground-belt'},
+		'554': {'name': 'up-arrow', 'type': 'virtual'},
+		'555': {'name': 'up-left-arrow', 'type': 'virtual'},
+		'556': {'name': 'up-right-arrow', 'type': 'virtual'},
+		'557': {'name': 'upgrade-planner'},
+		'558': {'name': 'uranium-235'},
+		'559': {'name': 'uranium-238'},
+		'560': {'name': 'uranium-cannon-shell'},
+		'561': {'name': 'uranium-fuel-cell'},
+		'562': {'name': 'uranium-ore'},
+		'563': {'name': 'uranium-processing', 'type': 'recipe'},
+		'564': {'name': 'uranium-rounds-magazine'},
+		'565': {'name': 'utility-science-pack'},
+		'566': {'name': 'vulcanus', 'type': 'space-location'},
+		'567': {'name': 'vulcanus-chimney', 'type': 'entity'},
+		'568': {'name': 'vulcanus-chimney-cold', 'type': 'entity'},
+		'569': {'name': 'vulcanus-chimney-faded', 'type': 'entity'},
+		'570': {'name': 'vulcanus-chimney-short', 'type': 'entity'},
+		'571': {'name': 'vulcanus-chimney-truncated', 'type': 'entity'},
+		'572': {'name': 'water', 'type': 'fluid'},
+		'573': {'name': 'water-barrel'},
+		'574': {'name': 'water-barrel', 'type': 'recipe'},
+		'575': {'name': 'wood'},
+		'576': {'name': 'wood-processing', 'type': 'recipe'},
+		'577': {'name': 'wooden-chest'},
+		'578': {'name': 'wube-logo-space-platform', 'type': 'entity'},
+		'579': {'name': 'yumako'},
+		'580': {'name': 'yumako-mash'},
+		'581': {'name': 'yumako-processing', 'type': 'recipe'},
+		'582': {'name': 'yumako-seed'},
+		'583': {'name': 'loader'},
+		'584': {'name': 'fast-loader'},
+		'585': {'name': 'express-loader'},
+		'586': {'name': 'turbo-loader'},
+	}
+
+
+# 全信号数量，与_get_all_signal_dict中的条目数一致，不必为了计算像素上限而构建整个字典
+SIGNAL_COUNT = 587
+
+
+# 实体占地尺寸字典，值为朝北时的 (宽, 高)，未列出的实体按1x1处理
+# 仓库蓝图中出现的实体都应列出，由tests/test_consts.py检查
+ENTITY_SIZE_DICT = {
+	'small-lamp': (1, 1),
+	'constant-combinator': (1, 1),
+	'display-panel': (1, 1),
+	'pipe': (1, 1),
+	'pipe-to-ground': (1, 1),
+	'land-mine': (0.8, 0.8),  # 地雷可以不对齐网格放置，按碰撞箱计算
+	'fast-inserter': (1, 1),
+	'long-handed-inserter': (1, 1),
+	'bulk-inserter': (1, 1),
+	'stack-inserter': (1, 1),
+	'express-transport-belt': (1, 1),
+	'turbo-transport-belt': (1, 1),
+	'fast-underground-belt': (1, 1),
+	'express-underground-belt': (1, 1),
+	'turbo-underground-belt': (1, 1),
+	'pump': (1, 2),
+	'arithmetic-combinator': (1, 2),
+	'decider-combinator': (1, 2),
+	'selector-combinator': (1, 2),
+	'accumulator': (2, 2),
+	'big-electric-pole': (2, 2),
+	'substation': (2, 2),
+	'splitter': (2, 1),
+	'fast-splitter': (2, 1),
+	'express-splitter': (2, 1),
+	'turbo-splitter': (2, 1),
+	'loader': (1, 2),
+	'fast-loader': (1, 2),
+	'express-loader': (1, 2),
+	'turbo-loader': (1, 2),
+	'stone-furnace': (2, 2),
+	'steel-furnace': (2, 2),
+	'gun-turret': (2, 2),
+	'laser-turret': (2, 2),
+	'assembling-machine-1': (3, 3),
+	'assembling-machine-2': (3, 3),
+	'assembling-machine-3': (3, 3),
+	'chemical-plant': (3, 3),
+	'electric-furnace': (3, 3),
+	'centrifuge': (3, 3),
+	'beacon': (3, 3),
+	'radar': (3, 3),
+	'solar-panel': (3, 3),
+	'storage-tank': (3, 3),
+	'asteroid-collector': (3, 3),
+	'crusher': (2, 3),
+	'artillery-turret': (3, 3),
+	'rocket-turret': (3, 3),
+	'railgun-turret': (3, 3),
+	'fusion-reactor': (6, 6),
+	'fusion-generator': (3, 5),
+	'lab': (3, 3),
+	'thruster': (4, 5),
+	'cargo-bay': (4, 4),
+	'roboport': (4, 4),
+	'foundry': (5, 5),
+	'electromagnetic-plant': (4, 4),
+	'cryogenic-plant': (5, 5),
+	'oil-refinery': (5, 5),
+	'biochamber': (3, 3),
+	'recycler': (2, 4),
+	'space-platform-hub': (8, 8),
 }
+
+
+# 像素数量上限，每个信号按5种品质展开，总数即单个常量运算器能存储的像素上限
+MAX_PIXEL_COUNT = SIGNAL_COUNT * len(ALL_QUALITY_LIST)
+
+
+def __getattr__(name: str):
+	"""
+	全信号字典 ALL_SIGNAL_DICT 与全像素信号列表 ALL_PIXEL_SIGNAL_LIST 在首次访问时才构建，缩短启动时间
+	第i个像素对应的信号为 (名称, 类型, 品质)，类型为None时表示物品
+	"""
+	if name == 'ALL_SIGNAL_DICT':
+		value = _get_all_signal_dict()
+	elif name == 'ALL_PIXEL_SIGNAL_LIST':
+		# 模块内部按名称引用不会经过__getattr__，需要显式取得全信号字典
+		all_signal_dict = globals().get('ALL_SIGNAL_DICT') or __getattr__('ALL_SIGNAL_DICT')
+		value = [
+			(all_signal_dict[str(i // 5)]['name'], all_signal_dict[str(i // 5)].get('type'), ALL_QUALITY_LIST[i % 5])
+			for i in range(MAX_PIXEL_COUNT)
+		]
+	else:
+		raise AttributeError(name)
+	
+	globals()[name] = value
+	return value
@@ -1,6 +1,20 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
 from PIL import Image, ImageEnhance, ImageFile
 
 from my_factorio_lib import *
+import my_factorio_consts
+from my_factorio_consts import MAX_PIXEL_COUNT, WireType
+from my_factorio_cache import ContentCache, make_cache_key, get_file_hash
+
+# 可选的NumPy，用于向量化地提取像素颜色，未安装时回退到逐像素读取
+try:
+	import numpy
+except ImportError:
+	numpy = None
 
 """测试用函数"""
 
@@ -30,18 +44,19 @@ def generate_all_item_constant_combinator_blueprint() -> str:
 	# 生成一个包含全信号的常量运算器蓝图
 	
 	item_dict_list = []
+	all_signal_dict = my_factorio_consts.ALL_SIGNAL_DICT
 	
-	for i in range(len(ALL_SIGNAL_DICT)):
+	for i in range(len(all_signal_dict)):
 		_ = {
 			'comparator': '=',
 			'count': 1,
 			'index': i + 1,
-			'name': ALL_SIGNAL_DICT[str(i)]['name'],
+			'name': all_signal_dict[str(i)]['name'],
 			'quality': 'normal'
 		}
 		
-		if 'type' in ALL_SIGNAL_DICT[str(i)]:
-			_['type'] = ALL_SIGNAL_DICT[str(i)]['type']
+		if 'type' in all_signal_dict[str(i)]:
+			_['type'] = all_signal_dict[str(i)]['type']
 		
 		item_dict_list.append(_)
 	
@@ -103,63 +118,189 @@ def generate_one_item_constant_combinator_blueprint() -> str:
 
 """生产用函数"""
 
+# 图片帧颜色缓存，键为图片内容哈希与缩放、量化参数，只要这些参数不变，修改帧间间隔等参数时无需重新处理图片
+FRAME_COLOR_CACHE = ContentCache(max_memory_items=16)
 
-def generate_screen_blueprint(
+# 生成结果缓存，键为图片内容哈希与全部生成参数
+BLUEPRINT_CACHE = ContentCache(max_memory_items=32)
+
+
+class ProgressReporter:
+	"""
+	线程安全的进度计数器，每完成一步调用一次 progress_callback(已完成步数, 总步数)
+	progress_callback可以抛出GenerationCancelled等异常来中止生成，异常会从生成函数中传出
+	"""
+	
+	def __init__(self, progress_callback=None, total: int = 0) -> None:
+		self.progress_callback = progress_callback
+		self.total = total  # 总步数，生成过程中可以追加
+		self.done = 0  # 已完成步数
+		self.lock = threading.Lock()
+	
+	def add_total(self, count: int) -> None:
+		"""追加总步数"""
+		with self.lock:
+			self.total += count
+	
+	def step(self, count: int = 1) -> None:
+		"""完成若干步"""
+		with self.lock:
+			self.done += count
+			done, total = self.done, self.total
+		if self.progress_callback:
+			self.progress_callback(done, total)
+	
+	def finish(self) -> None:
+		"""标记全部完成"""
+		with self.lock:
+			self.done = self.total
+		if self.progress_callback:
+			self.progress_callback(self.total, self.total)
+
+
+def iter_with_progress(iterable, progress: ProgressReporter | None):
+	"""遍历完iterable后完成一步，用于统计惰性写入的JSON片段"""
+	yield from iterable
+	if progress:
+		progress.step()
+
+
+def make_lamp_control_behavior(pixel_index: int) -> dict:
+	"""生成第pixel_index个像素电灯的控制行为字典，每次返回新的字典，调用方可以随意修改"""
+	
+	name, type, quality = my_factorio_consts.ALL_PIXEL_SIGNAL_LIST[pixel_index]
+	rgb_signal = {'name': name, 'quality': quality}
+	if type:
+		rgb_signal['type'] = type
+	return {'color_mode': 2, 'use_colors': True, 'rgb_signal': rgb_signal}
+
+
+def get_screen_blueprint_dict(
 		width: int = 10, height: int = 10,
 		wire_type_list: list | None = None,
-		always_on: bool = True) -> str:
-	"""参数化生成彩色显示屏"""
+		always_on: bool = True) -> dict:
+	"""
+	生成彩色显示屏的蓝图字典
+	每个电灯的控制行为都是新的字典，修改返回的蓝图不会影响之后生成的显示屏；实体与线缆在同一次遍历中生成
+	"""
 	
-	if width * height > 2985:
-		print('像素总和超过2985上限！')
-		return ''
-	
-	d = {
-		'blueprint': {
-			'entities': [],
-			'item': 'blueprint',
-			'wires': [],
-		}
-	}
+	use_red = bool(wire_type_list) and 1 in wire_type_list
+	use_green = bool(wire_type_list) and 2 in wire_type_list
 	
+	entities = []
+	wires = []
 	for x in range(width):
 		for y in range(height):
-			_ = {
-				'entity_number': y * width + x + 1,
+			number = y * width + x + 1
+			entities.append({
+				'entity_number': number,
 				'name': 'small-lamp',
 				'position': {'x': x, 'y': y},
-				'control_behavior': {
-					'color_mode': 2,
-					'use_colors': True,
-					'rgb_signal': {},
-				},
+				'control_behavior': make_lamp_control_behavior(number - 1),
 				'always_on': always_on
-			}
+			})
 			
-			_['control_behavior']['rgb_signal']['name'] = ALL_SIGNAL_DICT[str((y * width + x) // 5)]['name']
-			_['control_behavior']['rgb_signal']['quality'] = ALL_QUALITY_LIST[(y * width + x) % 5]
+			if x == width - 1 and y > 0:  # 连接最后一列电灯
+				if use_red:
+					wires.append([number - width, 1, number, 1])
+				if use_green:
+					wires.append([number - width, 2, number, 2])
 			
-			if 'type' in ALL_SIGNAL_DICT[str((y * width + x) // 5)]:
-				_['control_behavior']['rgb_signal']['type'] = ALL_SIGNAL_DICT[str((y * width + x) // 5)]['type']
+			if x > 0:  # 连接水平电灯
+				if use_red:
+					wires.append([number - 1, 1, number, 1])
+				if use_green:
+					wires.append([number - 1, 2, number, 2])
+	
+	return {
+		'blueprint': {
+			'entities': entities,
+			'item': 'blueprint',
+			'wires': wires,
+		}
+	}
+
+
+_lamp_control_behavior_json_list: list | None = None  # 第i个像素电灯控制行为的JSON片段，首次使用时构建
+
+
+def get_lamp_control_behavior_json_list() -> list:
+	"""获取每个像素电灯控制行为的JSON片段，字符串不可变，所有显示屏共用同一份"""
+	global _lamp_control_behavior_json_list
+	
+	if _lamp_control_behavior_json_list is None:
+		_lamp_control_behavior_json_list = [
+			json_encode(make_lamp_control_behavior(i)).decode('utf-8') for i in range(MAX_PIXEL_COUNT)]
+	return _lamp_control_behavior_json_list
+
+
+def get_lamp_json_template(always_on: bool = True) -> str:
+	"""
+	获取像素电灯实体的JSON模板，依次填入控制行为片段、实体编号、x与y，
+	键的顺序与json_encode一致，显示屏与分块图片共用
+	"""
+	return '{"always_on":%s,"control_behavior":%%s,"entity_number":%%d,"name":"small-lamp","position":{"x":%%d,"y":%%d}}' % (
+		'true' if always_on else 'false')
+
+
+def emit_screen_blueprint(
+		width: int = 10, height: int = 10,
+		wire_type_list: list | None = None,
+		always_on: bool = True, progress_callback=None) -> str:
+	"""
+	不构建字典，直接以JSON片段生成彩色显示屏蓝图
+	结果与dict_to_blueprint(get_screen_blueprint_dict(...))逐字节相同；每写完一列电灯报告一次进度
+	"""
+	lamp_control_behavior_json_list = get_lamp_control_behavior_json_list()
+	use_red = bool(wire_type_list) and 1 in wire_type_list
+	use_green = bool(wire_type_list) and 2 in wire_type_list
+	lamp_json = get_lamp_json_template(always_on)
+	
+	progress = ProgressReporter(progress_callback, width)
+	emitter = BlueprintEmitter()
+	emitter.write('{"blueprint":{"entities":[')
+	
+	wire_fragment_list = []
+	for x in range(width):
+		progress.step()
+		for y in range(height):
+			number = y * width + x + 1
+			if x or y:
+				emitter.write(',')
+			emitter.write(lamp_json % (lamp_control_behavior_json_list[number - 1], number, x, y))
+			
+			if x == width - 1 and y > 0:  # 连接最后一列电灯
+				if use_red:
+					wire_fragment_list.append('[%d,1,%d,1]' % (number - width, number))
+				if use_green:
+					wire_fragment_list.append('[%d,2,%d,2]' % (number - width, number))
 			
-			d['blueprint']['entities'].append(_)
+			if x > 0:  # 连接水平电灯
+				if use_red:
+					wire_fragment_list.append('[%d,1,%d,1]' % (number - 1, number))
+				if use_green:
+					wire_fragment_list.append('[%d,2,%d,2]' % (number - 1, number))
+	
+	emitter.write('],"item":"blueprint","wires":[')
+	emitter.write(','.join(wire_fragment_list))
+	emitter.write(']}}')
+	
+	bp = emitter.finish()
+	progress.finish()
+	return bp
+
+
+def generate_screen_blueprint(
+		width: int = 10, height: int = 10,
+		wire_type_list: list | None = None,
+		always_on: bool = True, progress_callback=None) -> str:
+	"""参数化生成彩色显示屏，progress_callback(已完成步数, 总步数)用于报告进度，抛出异常即可取消"""
 	
-	if wire_type_list:
-		for x in range(width):
-			for y in range(height):
-				if (x + 1) % width == 0 and y > 0:  # 连接最后一列电灯
-					if 1 in wire_type_list:
-						d['blueprint']['wires'].append([(y - 1) * width + x + 1, 1, y * width + x + 1, 1])
-					if 2 in wire_type_list:
-						d['blueprint']['wires'].append([(y - 1) * width + x + 1, 2, y * width + x + 1, 2])
-				
-				if x > 0:  # 连接水平电灯
-					if 1 in wire_type_list:
-						d['blueprint']['wires'].append([y * width + x, 1, y * width + x + 1, 1])
-					if 2 in wire_type_list:
-						d['blueprint']['wires'].append([y * width + x, 2, y * width + x + 1, 2])
+	if width * height > MAX_PIXEL_COUNT:
+		print('像素总和超过{}上限！'.format(MAX_PIXEL_COUNT))
+		return ''
 	
-	return dict_to_blueprint(d)
+	return emit_screen_blueprint(width, height, wire_type_list, always_on, progress_callback)
 
 
 def get_gif_duration(gif_path: str) -> int:
@@ -171,13 +312,19 @@ def get_gif_duration(gif_path: str) -> int:
 	return duration_tick
 
 
-def get_frame_rgb_list(frame: ImageFile, width: int = 10, height: int = 10) -> list:
-	"""获取一个图片的像素rgb列表"""
+def resize_and_enhance_frame(frame: ImageFile, width: int = 10, height: int = 10) -> ImageFile:
+	"""将图片缩放到目标尺寸并增强对比度"""
 	
 	frame = frame.resize((width, height))
 	
 	enhancer = ImageEnhance.Contrast(frame)
-	frame = enhancer.enhance(1.5)
+	return enhancer.enhance(1.5)
+
+
+def get_frame_rgb_list(frame: ImageFile, width: int = 10, height: int = 10) -> list:
+	"""获取一个图片的像素rgb列表，按行优先排列"""
+	
+	frame = resize_and_enhance_frame(frame, width, height)
 	
 	pix = frame.load()
 	
@@ -186,9 +333,9 @@ def get_frame_rgb_list(frame: ImageFile, width: int = 10, height: int = 10) -> l
 	
 	_ = []
 	
-	for x in range(width):
-		for y in range(height):
-			rgb = pix[y, x]
+	for y in range(height):
+		for x in range(width):
+			rgb = pix[x, y]
 			if not len(rgb) == 3:
 				rgb = rgb[:-1]
 			_.append(rgb)
@@ -196,35 +343,231 @@ def get_frame_rgb_list(frame: ImageFile, width: int = 10, height: int = 10) -> l
 	return _
 
 
-def generate_mini_static_image_blueprint(img_path: str, width: int = 10, height: int = 10) -> str:
-	"""参数化生成小静态图片蓝图"""
+def get_frame_color_list(frame: ImageFile, width: int = 10, height: int = 10) -> list:
+	"""
+	获取一个图片的像素颜色整数列表，每个像素打包为 r << 16 | g << 8 | b，顺序与get_frame_rgb_list一致
+	安装了NumPy时整帧一次完成打包
+	"""
+	
+	return get_packed_color_list(resize_and_enhance_frame(frame, width, height))
+
+
+def get_packed_color_list(frame: ImageFile) -> list:
+	"""将已经缩放好的图片按行优先打包为颜色整数列表"""
+	
+	if numpy is None:
+		return [rgb[0] << 16 | rgb[1] << 8 | rgb[2] for rgb in frame.convert('RGB').getdata()]
+	
+	rgb = numpy.asarray(frame.convert('RGB'), dtype=numpy.int32)  # (高, 宽, 3)
+	return (rgb[:, :, 0] << 16 | rgb[:, :, 1] << 8 | rgb[:, :, 2]).ravel().tolist()
+
+
+def quantize_frame_list(frame_list: list, palette_colors: int = 16, dither: bool = False) -> list:
+	"""
+	用所有帧共享的全局调色板量化图片，返回RGB图片列表
+	颜色种类减少后信号值大量重复，蓝图的zlib压缩率会明显提高
+	"""
+	
+	if not frame_list:
+		return []
+	
+	# 将所有帧竖向拼接，统一计算调色板
+	width, height = frame_list[0].size
+	atlas = Image.new('RGB', (width, height * len(frame_list)))
+	for i, frame in enumerate(frame_list):
+		atlas.paste(frame.convert('RGB'), (0, i * height))
+	palette_image = atlas.quantize(colors=palette_colors, method=Image.Quantize.MEDIANCUT)
+	
+	dither_mode = Image.Dither.FLOYDSTEINBERG if dither else Image.Dither.NONE
+	return [x.convert('RGB').quantize(palette=palette_image, dither=dither_mode).convert('RGB') for x in frame_list]
+
+
+def generate_mini_static_image_blueprint(
+		img_path: str, width: int = 10, height: int = 10,
+		palette_colors: int = 0, dither: bool = False, progress_callback=None) -> str:
+	"""
+	参数化生成小静态图片蓝图
+	palette_colors大于0时先将图片量化为该数量的颜色；progress_callback(已完成步数, 总步数)用于报告进度，抛出异常即可取消
+	"""
+	
+	file_hash = get_file_hash(img_path)
+	bp_key = make_cache_key('static', file_hash, width, height, palette_colors, dither)
+	bp = BLUEPRINT_CACHE.get(bp_key)
+	if bp is not None:
+		return bp
 	
 	bp_object = Blueprint()
 	cc_object = ConstantCombinator()
-	
-	rgb_list = get_frame_rgb_list(Image.open(img_path), width, height)
-	for i in range(len(rgb_list)):
-		cc_object.add_filter_auto(count=rgb_list[i][0] << 16 | rgb_list[i][1] << 8 | rgb_list[i][2])
+	progress = ProgressReporter(progress_callback, 2)
+	
+	# 静态图片只解码第一帧，调色板也只由这一帧生成，键中注明解码方式，以免与动态图片的全部帧混用
+	frame_key = make_cache_key('frames', 'first_frame', file_hash, width, height, palette_colors, dither)
+	color_list_list = FRAME_COLOR_CACHE.get(frame_key)
+	if color_list_list is None:
+		if palette_colors:
+			frame = quantize_frame_list(
+				[resize_and_enhance_frame(Image.open(img_path), width, height)], palette_colors, dither)[0]
+			color_list_list = [get_packed_color_list(frame)]
+		else:
+			color_list_list = [get_frame_color_list(Image.open(img_path), width, height)]
+		FRAME_COLOR_CACHE.put(frame_key, color_list_list)
+	progress.step()
 	
 	bp_object.add_entity(cc_object)
-	return dict_to_blueprint(bp_object.get_dict())
+	
+	# 过滤器直接以JSON片段写入，不构建字典
+	emitter = BlueprintEmitter()
+	bp_object.write_to_emitter(
+		emitter, {cc_object.entity_number: iter_auto_filter_control_behavior_json(color_list_list[0])})
+	bp = emitter.finish()
+	BLUEPRINT_CACHE.put(bp_key, bp)
+	progress.finish()
+	return bp
+
+
+def get_gif_frame_list(gif: ImageFile) -> list:
+	"""按顺序解码gif的所有帧，每帧转换为RGB图片"""
+	
+	_ = []
+	for i in range(gif.n_frames):
+		gif.seek(i)
+		_.append(gif.convert('RGB'))
+	return _
 
 
-def generate_mini_dynamic_image_blueprint(gif_path: str, width: int = 10, height: int = 10, duration: int = 1) -> str:
-	"""参数化生成小动态图片蓝图"""
+def map_frame_list(
+		function, frame_list: list, workers: int | None = None, *args,
+		progress: ProgressReporter | None = None) -> list:
+	"""
+	并行地对每一帧调用function(frame, *args)，结果顺序与frame_list一致
+	图片缩放、增强对比度、量化和NumPy打包期间会释放GIL，因此使用线程池；workers为1时串行处理，为None时按CPU核数
+	传入progress时每处理完一帧完成一步
+	"""
+	
+	if progress is not None:
+		inner_function = function
+		
+		def function(frame, *inner_args):
+			result = inner_function(frame, *inner_args)
+			progress.step()
+			return result
+	
+	if workers == 1 or len(frame_list) <= 1:
+		return [function(x, *args) for x in frame_list]
+	
+	with ThreadPoolExecutor(max_workers=workers) as executor:
+		return list(executor.map(function, frame_list, *[repeat(x) for x in args]))
+
+
+def get_frame_color_list_parallel(
+		frame_list: list, width: int = 10, height: int = 10, workers: int | None = None,
+		progress: ProgressReporter | None = None) -> list:
+	"""并行获取多帧图片的像素颜色整数列表，结果顺序与frame_list一致"""
+	
+	return map_frame_list(get_frame_color_list, frame_list, workers, width, height, progress=progress)
+
+
+def get_frame_color_distance(first_color_list: list, second_color_list: list) -> float:
+	"""两帧颜色的差异，即所有像素RGB通道差值绝对值的平均数，范围0~255"""
+	
+	if numpy is not None:
+		shift = numpy.array([16, 8, 0], dtype=numpy.int32)
+		first = numpy.array(first_color_list, dtype=numpy.int32)[:, None] >> shift & 255
+		second = numpy.array(second_color_list, dtype=numpy.int32)[:, None] >> shift & 255
+		return float(numpy.abs(first - second).mean())
+	
+	total = 0
+	for a, b in zip(first_color_list, second_color_list):
+		total += abs((a >> 16 & 255) - (b >> 16 & 255)) + abs((a >> 8 & 255) - (b >> 8 & 255)) + abs((a & 255) - (b & 255))
+	return total / (len(first_color_list) * 3)
+
+
+def dedupe_frame_color_list(color_list_list: list, merge_threshold: float = 0) -> tuple[list, list]:
+	"""
+	帧去重
+	返回 (去重后的帧颜色列表, 每个去重帧对应的原始帧序号列表)
+	完全相同的帧按内容哈希合并；merge_threshold大于0时，与已有帧差异不超过该值的帧也会合并（有损）
+	"""
+	
+	unique_color_list_list = []
+	frame_index_list_list = []
+	unique_index_dict = {}  # 帧内容 -> 去重帧序号
+	
+	for i, color_list in enumerate(color_list_list):
+		key = tuple(color_list)
+		unique_index = unique_index_dict.get(key)
+		
+		if unique_index is None and merge_threshold > 0:
+			for j, unique_color_list in enumerate(unique_color_list_list):
+				if get_frame_color_distance(color_list, unique_color_list) <= merge_threshold:
+					unique_index = j
+					unique_index_dict[key] = j
+					break
+		
+		if unique_index is None:
+			unique_index = len(unique_color_list_list)
+			unique_index_dict[key] = unique_index
+			unique_color_list_list.append(color_list)
+			frame_index_list_list.append([])
+		
+		frame_index_list_list[unique_index].append(i)
+	
+	return unique_color_list_list, frame_index_list_list
+
+
+def generate_mini_dynamic_image_blueprint(
+		gif_path: str, width: int = 10, height: int = 10, duration: int = 1,
+		workers: int | None = None, dedupe: bool = False, merge_threshold: float = 0,
+		palette_colors: int = 0, dither: bool = False, progress_callback=None) -> str:
+	"""
+	参数化生成小动态图片蓝图
+	dedupe为True时相同的帧只生成一组运算器，选择器在这些帧的序号上都会输出该帧；
+	merge_threshold大于0时还会合并差异不超过该值的相近帧；
+	palette_colors大于0时所有帧共用一个该数量颜色的调色板进行量化；
+	progress_callback(已完成步数, 总步数)用于报告进度，每提取或写入一帧完成一步，抛出异常即可取消
+	"""
 	
 	gif = Image.open(gif_path)
 	print("n_frames={}".format(gif.n_frames))
 	print("duration={}ms".format(gif.info['duration']))
 	
+	file_hash = get_file_hash(gif_path)
+	bp_key = make_cache_key(
+		'dynamic', file_hash, width, height, duration, dedupe, merge_threshold, palette_colors, dither)
+	bp = BLUEPRINT_CACHE.get(bp_key)
+	if bp is not None:
+		return bp
+	
 	bp_object = Blueprint()
+	progress = ProgressReporter(progress_callback, gif.n_frames)  # 先按每帧写入一步计数，去重后再修正
+	
+	# 解码所有帧并并行提取颜色
+	frame_key = make_cache_key('frames', 'all_frames', file_hash, width, height, palette_colors, dither)
+	color_list_list = FRAME_COLOR_CACHE.get(frame_key)
+	if color_list_list is None:
+		progress.add_total(gif.n_frames * 2)
+		frame_list = get_gif_frame_list(gif)
+		if palette_colors:
+			frame_list = map_frame_list(resize_and_enhance_frame, frame_list, workers, width, height, progress=progress)
+			frame_list = quantize_frame_list(frame_list, palette_colors, dither)
+			color_list_list = map_frame_list(get_packed_color_list, frame_list, workers, progress=progress)
+		else:
+			progress.add_total(-gif.n_frames)
+			color_list_list = get_frame_color_list_parallel(frame_list, width, height, workers, progress)
+		FRAME_COLOR_CACHE.put(frame_key, color_list_list)
+	
+	# 帧去重
+	if dedupe:
+		color_list_list, frame_index_list_list = dedupe_frame_color_list(color_list_list, merge_threshold)
+		print("unique_frames={}".format(len(color_list_list)))
+	else:
+		frame_index_list_list = [[i] for i in range(len(color_list_list))]
 	
 	# 生成常量运算器
+	progress.add_total(len(color_list_list) - gif.n_frames)
 	image_cc_list = []  # 存储每一帧图形的常量运算器列表
-	for i in range(gif.n_frames):
-		gif.seek(i)
-		rgb_list = get_frame_rgb_list(gif.convert('RGB'), width, height)
-		
+	image_filter_fragments_dict = {}  # 常量运算器序号 -> 过滤器的JSON片段，编码时直接写入
+	for i, color_list in enumerate(color_list_list):
 		cc_object = ConstantCombinator()
 		bp_object.add_entity(cc_object)
 		image_cc_list.append(cc_object)
@@ -233,12 +576,12 @@ def generate_mini_dynamic_image_blueprint(gif_path: str, width: int = 10, height
 		cc_object.position_y = i + 0.5
 		cc_object.rotate_to(DirectionType.EAST.value)
 		
-		for p in range(len(rgb_list)):
-			cc_object.add_filter_auto(count=rgb_list[p][0] << 16 | rgb_list[p][1] << 8 | rgb_list[p][2])
+		image_filter_fragments_dict[cc_object.entity_number] = iter_with_progress(
+			iter_auto_filter_control_behavior_json(color_list), progress)
 	
 	# 生成与常量运算器配对的判断运算器
 	image_select_dc_list = []
-	for i in range(gif.n_frames):
+	for i, frame_index_list in enumerate(frame_index_list_list):
 		dc_object = DeciderCombinator()
 		bp_object.add_entity(dc_object)
 		image_select_dc_list.append(dc_object)
@@ -246,15 +589,18 @@ def generate_mini_dynamic_image_blueprint(gif_path: str, width: int = 10, height
 		dc_object.position_x = 2
 		dc_object.position_y = i + 0.5
 		dc_object.rotate_to(DirectionType.EAST.value)
-		dc_object.add_condition(
-			comparator='=', constant=i,
-			first_signal_name='signal-dot', first_signal_type='virtual', first_use_red_network=False
-		)
+		
+		# 每个使用该图形的帧序号各占一个条件
+		for frame_index in frame_index_list:
+			dc_object.add_condition(
+				comparator='=', constant=frame_index,
+				first_signal_name='signal-dot', first_signal_type='virtual', first_use_red_network=False
+			)
 		dc_object.add_output(signal_name='signal-everything', signal_type='virtual', use_green_network=False)
 		
-		if i == gif.n_frames - 1:
+		if gif.n_frames - 1 in frame_index_list:
 			dc_object.add_condition(
-				comparator='=', constant=i + 1,
+				comparator='=', constant=gif.n_frames,
 				first_signal_name='signal-dot', first_signal_type='virtual',
 				first_use_red_network=False, first_use_green_network=True,
 			)
@@ -306,7 +652,185 @@ def generate_mini_dynamic_image_blueprint(gif_path: str, width: int = 10, height
 	bp_object.connect_entity(control_dc_object, control_ac_object, 'ii', 'r')
 	bp_object.connect_entity(control_ac_object, image_select_dc_list[0], 'oi', 'g')
 	
-	return dict_to_blueprint(bp_object.get_dict())
+	emitter = BlueprintEmitter()
+	bp_object.write_to_emitter(emitter, image_filter_fragments_dict)
+	bp = emitter.finish()
+	BLUEPRINT_CACHE.put(bp_key, bp)
+	progress.finish()
+	return bp
+
+
+TILE_PROCESS_POOL_MIN_COUNT = 16  # 分块图片使用进程池的最少块数
+
+
+def get_tile_box_list(width: int, height: int, tile_width: int = 54, tile_height: int = 54) -> list:
+	"""将width×height的图片按行优先切分为若干块，返回每块的 (左, 上, 宽, 高)，右侧和下侧的块可能更小"""
+	
+	_ = []
+	for top in range(0, height, tile_height):
+		for left in range(0, width, tile_width):
+			_.append((left, top, min(tile_width, width - left), min(tile_height, height - top)))
+	return _
+
+
+def get_tile_color_list(color_list: list, image_width: int, left: int, top: int, width: int, height: int) -> list:
+	"""从整张图片的像素颜色列表中按行优先取出一块"""
+	
+	_ = []
+	for y in range(top, top + height):
+		_.extend(color_list[y * image_width + left:y * image_width + left + width])
+	return _
+
+
+def emit_image_tile_json(
+		tile: tuple, tile_color_list: list,
+		wire_type_list: list, always_on: bool = True) -> tuple[str, str]:
+	"""
+	生成一块图片的实体与线缆JSON片段，返回 (实体片段, 线缆片段)
+	tile为 (第一个实体编号, 宽, 高, 放置左边, 放置上边)，tile_color_list为该块按行优先的像素颜色，
+	块内先是常量运算器，之后按行优先排列电灯
+	每块的信号均从第0个像素信号开始，块与块之间不连线，因此各块的信号互不干扰
+	会在工作进程中调用，参数与结果都只含数字和字符串
+	"""
+	
+	lamp_control_behavior_json_list = get_lamp_control_behavior_json_list()
+	first_number, width, height, place_x, place_y = tile
+	lamp_json = get_lamp_json_template(always_on)
+	
+	# 常量运算器位于块左上角电灯的正上方
+	entity_fragment_list = ['{"control_behavior":%s,"entity_number":%d,"name":"constant-combinator","position":{"x":%d,"y":%d}}' % (
+		''.join(iter_auto_filter_control_behavior_json(tile_color_list)), first_number, place_x, place_y - 1)]
+	
+	wire_fragment_list = []
+	for wire_type in wire_type_list:
+		wire_fragment_list.append('[%d,%d,%d,%d]' % (first_number, wire_type, first_number + 1, wire_type))
+	
+	for y in range(height):
+		for x in range(width):
+			number = first_number + 1 + y * width + x
+			entity_fragment_list.append(lamp_json % (
+				lamp_control_behavior_json_list[y * width + x], number, place_x + x, place_y + y))
+			
+			for wire_type in wire_type_list:
+				if x > 0:  # 连接水平电灯
+					wire_fragment_list.append('[%d,%d,%d,%d]' % (number - 1, wire_type, number, wire_type))
+				if x == width - 1 and y > 0:  # 连接最后一列电灯
+					wire_fragment_list.append('[%d,%d,%d,%d]' % (number - width, wire_type, number, wire_type))
+	
+	return ','.join(entity_fragment_list), ','.join(wire_fragment_list)
+
+
+def generate_tiled_image_blueprint(
+		img_path: str, width: int = 108, height: int = 108,
+		tile_width: int = 54, tile_height: int = 54,
+		wire_type_list: list | None = None, always_on: bool = True,
+		palette_colors: int = 0, dither: bool = False, workers: int | None = None,
+		progress_callback=None) -> str:
+	"""
+	参数化生成分块的大静态图片蓝图，像素数不受单个常量运算器信号数量的限制
+	图片被切分为不超过tile_width×tile_height的块，每块由一个常量运算器和一块显示屏组成
+	每行块的上方留出一行放置该行的常量运算器，各块生成后按行优先写入同一个蓝图
+	拼接JSON片段是持有GIL的纯Python运算，块数不少于TILE_PROCESS_POOL_MIN_COUNT时才交给进程池并行生成，
+	块数较少时启动进程的开销大于收益，直接串行生成；workers为1时总是串行
+	progress_callback(已完成步数, 总步数)用于报告进度，每生成一块完成一步，抛出异常即可取消
+	"""
+	
+	if tile_width * tile_height > MAX_PIXEL_COUNT:
+		print('单块像素总和超过{}上限！'.format(MAX_PIXEL_COUNT))
+		return ''
+	
+	if not wire_type_list:
+		wire_type_list = [WireType.RED_INPUT.value]
+	
+	file_hash = get_file_hash(img_path)
+	bp_key = make_cache_key(
+		'tiled', file_hash, width, height, tile_width, tile_height, wire_type_list, always_on, palette_colors, dither)
+	bp = BLUEPRINT_CACHE.get(bp_key)
+	if bp is not None:
+		return bp
+	
+	# 静态图片只解码第一帧，调色板也只由这一帧生成，键中注明解码方式，以免与动态图片的全部帧混用
+	frame_key = make_cache_key('frames', 'first_frame', file_hash, width, height, palette_colors, dither)
+	color_list_list = FRAME_COLOR_CACHE.get(frame_key)
+	if color_list_list is None:
+		if palette_colors:
+			frame = quantize_frame_list(
+				[resize_and_enhance_frame(Image.open(img_path), width, height)], palette_colors, dither)[0]
+			color_list_list = [get_packed_color_list(frame)]
+		else:
+			color_list_list = [get_frame_color_list(Image.open(img_path), width, height)]
+		FRAME_COLOR_CACHE.put(frame_key, color_list_list)
+	
+	# 每块占用 1 + 宽 × 高 个实体编号，提前算好各块的起始编号与像素颜色，各块即可独立生成
+	tile_list = []
+	tile_color_list_list = []
+	first_number = 1
+	for left, top, tile_w, tile_h in get_tile_box_list(width, height, tile_width, tile_height):
+		place_y = top // tile_height * (tile_height + 1) + 1
+		tile_list.append((first_number, tile_w, tile_h, left, place_y))
+		tile_color_list_list.append(get_tile_color_list(color_list_list[0], width, left, top, tile_w, tile_h))
+		first_number += 1 + tile_w * tile_h
+	
+	progress = ProgressReporter(progress_callback, len(tile_list))
+	if workers == 1 or len(tile_list) < TILE_PROCESS_POOL_MIN_COUNT:
+		fragment_list = []
+		for tile, tile_color_list in zip(tile_list, tile_color_list_list):
+			fragment_list.append(emit_image_tile_json(tile, tile_color_list, wire_type_list, always_on))
+			progress.step()
+	else:
+		from concurrent.futures import ProcessPoolExecutor  # 导入较慢，只在真正并行时导入
+		
+		executor = ProcessPoolExecutor(max_workers=workers)
+		try:
+			fragment_list = []
+			for fragment in executor.map(
+					emit_image_tile_json, tile_list, tile_color_list_list,
+					repeat(wire_type_list), repeat(always_on)):
+				fragment_list.append(fragment)
+				progress.step()
+		finally:
+			executor.shutdown(cancel_futures=True)  # 取消时不再等待剩余的块
+	
+	emitter = BlueprintEmitter()
+	emitter.write('{"blueprint":{"entities":[')
+	emitter.write(','.join(x[0] for x in fragment_list))
+	emitter.write('],"item":"blueprint","wires":[')
+	emitter.write(','.join(x[1] for x in fragment_list if x[1]))
+	emitter.write(']}}')
+	bp = emitter.finish()
+	BLUEPRINT_CACHE.put(bp_key, bp)
+	progress.finish()
+	return bp
+
+
+def report_palette_quantization(
+		img_path: str, width: int = 10, height: int = 10,
+		palette_colors_list: list | None = None, dither: bool = False) -> list:
+	"""
+	对比不同调色板颜色数下蓝图的压缩后大小，gif按动态图片生成，其余按静态图片生成
+	返回 [(颜色数, 蓝图字符数)]，颜色数为0表示未量化
+	"""
+	
+	if palette_colors_list is None:
+		palette_colors_list = [0, 256, 64, 16, 4]
+	
+	_ = []
+	for palette_colors in palette_colors_list:
+		if img_path.lower().endswith('.gif'):
+			bp = generate_mini_dynamic_image_blueprint(
+				img_path, width, height, palette_colors=palette_colors, dither=dither)
+		else:
+			bp = generate_mini_static_image_blueprint(img_path, width, height, palette_colors, dither)
+		_.append((palette_colors, len(bp)))
+	
+	original_size = _[0][1] if _ and _[0][0] == 0 else None
+	for palette_colors, size in _:
+		if original_size:
+			print('palette_colors={} size={} ({:.1%})'.format(palette_colors, size, size / original_size))
+		else:
+			print('palette_colors={} size={}'.format(palette_colors, size))
+	
+	return _
 
 
 if __name__ == '__main__':
@@ -1,11 +1,44 @@
+import array
 import base64
+import importlib.util
+import io
 import json
+import marshal
+import math
+import os
+import sys
+import threading
+import time
 import zlib
-import pyperclip
 
-from pprint import pprint
+from itertools import repeat
+from typing import TextIO
 
-from my_factorio_consts import DirectionType, ALL_SIGNAL_DICT, ALL_QUALITY_LIST
+import my_factorio_consts
+
+from my_factorio_consts import DirectionType, WireType, CompressionLevelType, ALL_QUALITY_LIST, ENTITY_SIZE_DICT
+from my_factorio_cache import ContentCache, make_cache_key
+
+# 可选的高性能JSON后端，未安装时回退到标准库json；导入较慢，首次编解码或切换后端时才导入
+orjson = None
+msgspec = None
+
+# 可选的NumPy，用于列式实体表的向量化运算，未安装时回退到array；导入较慢，首次构建实体表时才导入
+_numpy = None
+_is_numpy_imported = False
+
+
+def get_numpy():
+	"""首次调用时导入NumPy，未安装时返回None"""
+	global _numpy, _is_numpy_imported
+	
+	if not _is_numpy_imported:
+		try:
+			import numpy as _numpy
+		except ImportError:
+			_numpy = None
+		_is_numpy_imported = True
+	return _numpy
 
 '''
 异星工厂蓝图格式：
@@ -27,6 +60,18 @@ from my_factorio_consts import DirectionType, ALL_SIGNAL_DICT, ALL_QUALITY_LIST
 				L 'description' -> str (蓝图的简介)
 				L 'version' -> int (不清楚是什么)
 
+异星工厂蓝图书格式：
+'blueprint_book' -> dict
+					L 'blueprints' -> [dict]
+					|				    L 'index' -> int (在书中的格子序号)
+					|				    L 'blueprint' / 'blueprint_book' / 'upgrade_planner' / 'deconstruction_planner' -> dict
+					L 'active_index' -> int
+					L 'icons' -> [dict]
+					L 'item': 'blueprint-book'
+					L 'label' -> str
+					L 'description' -> str
+					L 'version' -> int
+
 带信号的常量运算器实体格式:
 'control_behavior'
 	L 'sections' -> dict
@@ -48,12 +93,103 @@ from my_factorio_consts import DirectionType, ALL_SIGNAL_DICT, ALL_QUALITY_LIST
 '''
 
 
-def dict_to_blueprint(blueprint_dict: dict) -> str:
+# 标准库json编码器，紧凑分隔符并按键排序，保证输出稳定
+_STDLIB_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), sort_keys=True, ensure_ascii=False)
+
+
+# 当前环境可用的JSON后端列表，按优先级排序，只查找不导入
+_available_json_backend_list = [
+	x for x in ('orjson', 'msgspec') if importlib.util.find_spec(x) is not None] + ['stdlib']
+
+
+def get_available_json_backend_list() -> list:
+	"""获取当前环境可用的JSON后端列表，按优先级排序"""
+	return list(_available_json_backend_list)
+
+
+_json_backend: str | None = None  # 当前使用的JSON后端，为None时在首次编解码时选择优先级最高的后端
+
+
+def get_json_backend() -> str:
+	"""获取当前使用的JSON后端"""
+	return _json_backend or _available_json_backend_list[0]
+
+
+def set_json_backend(backend: str) -> None:
+	"""切换JSON后端，首次切换到某个后端时导入对应的模块"""
+	global _json_backend, orjson, msgspec
+	
+	if backend not in _available_json_backend_list:
+		raise KeyError(f'JSON后端不可用：{backend}')
+	
+	match backend:
+		case 'orjson':
+			import orjson
+		case 'msgspec':
+			import msgspec.json
+	_json_backend = backend
+
+
+def json_encode(obj) -> bytes:
+	"""用当前JSON后端将对象编码为紧凑且按键排序的UTF-8字节串"""
+	
+	match _json_backend:
+		case 'orjson':
+			return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+		case 'msgspec':
+			return msgspec.json.encode(obj, order='sorted')
+		case 'stdlib':
+			return _STDLIB_JSON_ENCODER.encode(obj).encode('utf-8')
+		case _:
+			set_json_backend(get_json_backend())
+			return json_encode(obj)
+
+
+def json_decode(json_data: bytes | bytearray | str):
+	"""用当前JSON后端将JSON数据解码为对象"""
+	
+	match _json_backend:
+		case 'orjson':
+			return orjson.loads(json_data)
+		case 'msgspec':
+			return msgspec.json.decode(json_data)
+		case 'stdlib':
+			return json.loads(json_data)
+		case _:
+			set_json_backend(get_json_backend())
+			return json_decode(json_data)
+
+
+def iter_json_encode(obj, chunk_size: int):
+	"""
+	分块地将对象编码为JSON字节串
+	标准库后端按片段增量生成，第三方后端不支持增量编码，一次性生成整份紧凑JSON
+	"""
+	
+	if _json_backend != 'stdlib':
+		yield json_encode(obj)
+		return
+	
+	fragment_list = []
+	fragment_size = 0
+	for fragment in _STDLIB_JSON_ENCODER.iterencode(obj):
+		fragment_list.append(fragment)
+		fragment_size += len(fragment)
+		if fragment_size >= chunk_size:
+			yield ''.join(fragment_list).encode('utf-8')
+			fragment_list.clear()
+			fragment_size = 0
+	
+	if fragment_list:
+		yield ''.join(fragment_list).encode('utf-8')
+
+
+def dict_to_blueprint(blueprint_dict: dict, compression_level: int = CompressionLevelType.DEFAULT.value) -> str:
 	"""将字典加密为蓝图"""
 	
 	try:
-		json_data = json.dumps(blueprint_dict)  # 将蓝图数据转换为 JSON 字符串
-		compressed_data = zlib.compress(json_data.encode('utf-8'))  # 压缩 JSON 数据
+		json_data = json_encode(blueprint_dict)  # 将蓝图数据转换为 JSON 字节串
+		compressed_data = zlib.compress(json_data, compression_level)  # 压缩 JSON 数据
 		base64_data = base64.b64encode(compressed_data).decode('utf-8')  # 编码为 Base64
 		blueprint_string = f"0{base64_data}"  # 添加蓝图前缀
 		return blueprint_string
@@ -67,16 +203,364 @@ def blueprint_to_dict(blueprint_string: str) -> dict:
 	try:
 		blueprint_string = blueprint_string[1:] if blueprint_string.startswith("0") else blueprint_string  # 去掉0前缀
 		compressed_data = base64.b64decode(blueprint_string)  # Base64 解码
-		json_data = zlib.decompress(compressed_data).decode('utf-8')  # 解压缩数据
-		blueprint_data = json.loads(json_data)  # 反序列化为 JSON
+		json_data = zlib.decompress(compressed_data)  # 解压缩数据
+		blueprint_data = json_decode(json_data)  # 反序列化为 JSON
 		return blueprint_data
 	except Exception as e:
 		raise e
 
 
+# 解码结果缓存，键为蓝图代码的哈希；内存层与磁盘层都保存marshal序列化的字节，默认不启用磁盘层
+DECODE_CACHE = ContentCache(max_memory_items=16)
+
+# 图形界面使用的解码缓存磁盘目录
+DECODE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.calis_factorio_toolbox', 'decode_cache')
+
+
+def blueprint_to_dict_cached(blueprint_string: str) -> dict:
+	"""
+	先查解码缓存，未命中时再经过Base64、zlib与JSON解码，并将结果写入缓存
+	缓存中只保存marshal字节，每次命中都重新反序列化出完整的新字典，
+	返回的字典与缓存及其他调用方互不共用，可以任意修改
+	"""
+	
+	blueprint_string = blueprint_string.strip()
+	# marshal格式随Python版本变化，键中带上版本号
+	key = make_cache_key('decode', marshal.version, sys.version_info[:2], blueprint_string)
+	
+	data = DECODE_CACHE.get(key)
+	if data is not None:
+		return marshal.loads(data)
+	
+	blueprint_dict = blueprint_to_dict(blueprint_string)
+	DECODE_CACHE.put(key, marshal.dumps(blueprint_dict))
+	return blueprint_dict
+
+
+# 体积优化时尝试的压缩策略
+OPTIMIZE_STRATEGY_LIST = [zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED, zlib.Z_RLE, zlib.Z_FIXED]
+
+
+def dict_to_blueprint_optimized(blueprint_dict: dict) -> tuple[str, dict]:
+	"""
+	尝试多种压缩等级与策略，返回体积最小且能正确解码的蓝图
+	同时返回优化报告：选中的等级与策略、默认与优化后的字符数、节省的字符数以及耗时
+	"""
+	
+	start = time.perf_counter()
+	
+	json_data = json_encode(blueprint_dict)
+	default_compressed_data = zlib.compress(json_data, CompressionLevelType.DEFAULT.value)
+	
+	best_compressed_data = default_compressed_data
+	best_level = CompressionLevelType.DEFAULT.value
+	best_strategy = zlib.Z_DEFAULT_STRATEGY
+	for level in range(CompressionLevelType.FAST.value, CompressionLevelType.MAX.value + 1):
+		for strategy in OPTIMIZE_STRATEGY_LIST:
+			compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS, 9, strategy)
+			compressed_data = compressor.compress(json_data) + compressor.flush()
+			if len(compressed_data) >= len(best_compressed_data):
+				continue
+			if zlib.decompress(compressed_data) != json_data:  # 只保留能还原出原始数据的结果
+				continue
+			best_compressed_data = compressed_data
+			best_level = level
+			best_strategy = strategy
+	
+	blueprint_string = f"0{base64.b64encode(best_compressed_data).decode('utf-8')}"
+	default_size = len(base64.b64encode(default_compressed_data)) + 1
+	
+	report = {
+		'level': best_level,
+		'strategy': best_strategy,
+		'default_size': default_size,
+		'size': len(blueprint_string),
+		'saved': default_size - len(blueprint_string),
+		'time': time.perf_counter() - start,
+	}
+	return blueprint_string, report
+
+
+STREAM_CHUNK_SIZE = 64 * 1024  # 流式编解码时每次读写的分块大小
+
+
+class BlueprintEmitter:
+	"""
+	蓝图发射器
+	直接接收JSON文本片段，边写入边压缩边Base64编码，适合不先构建字典就输出大型蓝图；
+	写入的片段必须与json_encode的输出一致（紧凑分隔符、按键排序），结果才能与dict_to_blueprint逐字节相同
+	"""
+	
+	def __init__(
+			self, fp: TextIO | None = None, chunk_size: int = STREAM_CHUNK_SIZE,
+			compression_level: int = CompressionLevelType.DEFAULT.value) -> None:
+		"""fp为None时结果保存在内存中，由finish返回"""
+		self.fp = fp if fp is not None else io.StringIO()
+		self.is_own_fp = fp is None
+		self.chunk_size = chunk_size
+		
+		self.compressor = zlib.compressobj(compression_level)
+		self.pending = b''  # 尚未凑满3字节整数倍、暂时无法编码的压缩数据
+		self.fragment_list = []  # 尚未压缩的JSON片段
+		self.fragment_size = 0
+		
+		self.written = self.fp.write('0')  # 添加蓝图前缀
+	
+	def write_compressed(self, compressed_data: bytes) -> None:
+		"""将压缩数据按3字节对齐编码为Base64后写出"""
+		self.pending += compressed_data
+		usable = len(self.pending) - len(self.pending) % 3  # Base64按3字节一组编码，分块边界必须对齐
+		if usable:
+			self.written += self.fp.write(base64.b64encode(self.pending[:usable]).decode('utf-8'))
+			self.pending = self.pending[usable:]
+	
+	def write_bytes(self, json_data: bytes) -> None:
+		"""写入UTF-8编码的JSON数据"""
+		self.flush_fragments()
+		self.write_compressed(self.compressor.compress(json_data))
+	
+	def write(self, fragment: str) -> None:
+		"""写入JSON文本片段，攒够一块后再压缩"""
+		self.fragment_list.append(fragment)
+		self.fragment_size += len(fragment)
+		if self.fragment_size >= self.chunk_size:
+			self.flush_fragments()
+	
+	def write_value(self, obj) -> None:
+		"""将一个对象编码为JSON后写入"""
+		self.write_bytes(json_encode(obj))
+	
+	def write_entity(self, entity: 'Entity', control_behavior_fragments=None) -> None:
+		"""
+		写入一个实体对象
+		control_behavior_fragments不为None时，用这些JSON片段代替实体自身的control_behavior
+		"""
+		_ = entity.get_dict()
+		if control_behavior_fragments is None:
+			self.write_value(_)
+			return
+		
+		_.pop('control_behavior', None)
+		# 实体字典的其余键均排在control_behavior之后
+		self.write('{"control_behavior":')
+		for fragment in control_behavior_fragments:
+			self.write(fragment)
+		self.write(',')
+		self.write(json_encode(_).decode('utf-8')[1:])
+	
+	def flush_fragments(self) -> None:
+		"""压缩已攒下的JSON片段"""
+		if self.fragment_list:
+			self.write_compressed(self.compressor.compress(''.join(self.fragment_list).encode('utf-8')))
+			self.fragment_list.clear()
+			self.fragment_size = 0
+	
+	def finish(self) -> str:
+		"""结束写入，fp为None时返回完整的蓝图字符串，否则返回空字符串"""
+		self.flush_fragments()
+		self.write_compressed(self.compressor.flush())
+		if self.pending:
+			self.written += self.fp.write(base64.b64encode(self.pending).decode('utf-8'))
+			self.pending = b''
+		
+		return self.fp.getvalue() if self.is_own_fp else ''
+
+
+def dict_to_blueprint_stream(
+		blueprint_dict: dict, fp: TextIO, chunk_size: int = STREAM_CHUNK_SIZE,
+		compression_level: int = CompressionLevelType.DEFAULT.value) -> int:
+	"""
+	将字典流式加密为蓝图并写入文本文件对象
+	JSON片段边生成边压缩边编码，不会在内存中保留完整的压缩数据或Base64字符串
+	返回写入的字符数
+	"""
+	
+	emitter = BlueprintEmitter(fp, chunk_size, compression_level)
+	for json_chunk in iter_json_encode(blueprint_dict, chunk_size):
+		emitter.write_bytes(json_chunk)
+	emitter.finish()
+	
+	return emitter.written
+
+
+def blueprint_stream_to_dict(fp: TextIO, chunk_size: int = STREAM_CHUNK_SIZE) -> dict:
+	"""
+	从文本文件对象中流式解码蓝图为字典
+	Base64和zlib按块增量处理，内存中只累积一份解压后的JSON数据
+	"""
+	
+	decompressor = zlib.decompressobj()
+	json_data = bytearray()  # 解压后的JSON数据
+	pending = ''  # 尚未凑满4字符整数倍、暂时无法解码的Base64字符
+	is_first_chunk = True
+	
+	while chunk := fp.read(chunk_size):
+		chunk = ''.join(chunk.split())  # 去掉换行等空白字符
+		if not chunk:
+			continue
+		if is_first_chunk:
+			chunk = chunk[1:] if chunk.startswith('0') else chunk  # 去掉0前缀
+			is_first_chunk = False
+		
+		pending += chunk
+		usable = len(pending) - len(pending) % 4  # Base64按4字符一组解码，分块边界必须对齐
+		json_data += decompressor.decompress(base64.b64decode(pending[:usable]))
+		pending = pending[usable:]
+	
+	if pending:
+		json_data += decompressor.decompress(base64.b64decode(pending))
+	json_data += decompressor.flush()
+	
+	return json_decode(json_data)
+
+
+def patch_blueprint_dict_metadata(
+		blueprint_dict: dict, label: str | None = None, description: str | None = None,
+		icons: list | None = None) -> dict:
+	"""
+	就地改写蓝图或蓝图书字典顶层的名称、简介和图标，实体、线缆、子蓝图等其余数据保持原样
+	参数为None时不修改该项，为空字符串或空列表时删除该项
+	"""
+	
+	if 'blueprint' in blueprint_dict:
+		blueprint = blueprint_dict['blueprint']
+	elif 'blueprint_book' in blueprint_dict:
+		blueprint = blueprint_dict['blueprint_book']
+	else:
+		raise KeyError('blueprint')
+	
+	for key, value in (('label', label), ('description', description)):
+		if value is None:
+			continue
+		if value:
+			blueprint[key] = value
+		else:
+			blueprint.pop(key, None)
+	
+	if icons is not None:
+		if icons:
+			blueprint['icons'] = [x.get_dict() for x in icons]
+		else:
+			blueprint.pop('icons', None)
+	
+	return blueprint_dict
+
+
+def patch_blueprint_metadata(
+		blueprint_string: str, label: str | None = None, description: str | None = None,
+		icons: list | None = None, compression_level: int = CompressionLevelType.DEFAULT.value) -> str:
+	"""只改写蓝图的名称、简介和图标并重新编码，不经过实体对象化，不会丢失实体对象未建模的字段"""
+	
+	blueprint_dict = blueprint_to_dict(blueprint_string)
+	patch_blueprint_dict_metadata(blueprint_dict, label, description, icons)
+	return dict_to_blueprint(blueprint_dict, compression_level)
+
+
+class NameRegistry:
+	"""
+	名称驻留表
+	将实体名、信号名和信号类型映射为从0开始的小整数id，同名字符串全局只保留一份，
+	对象模型中只保存id，编码时才解析回字符串
+	"""
+	
+	__slots__ = ('name_list', 'id_dict', 'lock', 'seed_function')
+	
+	def __init__(self, seed_function=None) -> None:
+		self.name_list: list = []  # id -> 名称
+		self.id_dict: dict = {}  # 名称 -> id
+		self.lock = threading.Lock()  # 登记新名称时持有，避免并发任务分配出相同的id
+		self.seed_function = seed_function  # 返回初始名称列表，首次使用时才调用，避免导入时遍历全信号表
+	
+	def __len__(self) -> int:
+		self.seed()
+		return len(self.name_list)
+	
+	def __contains__(self, name: str) -> bool:
+		self.seed()
+		return name in self.id_dict
+	
+	def seed(self) -> None:
+		"""登记初始名称，只在第一次调用时生效"""
+		if self.seed_function is not None:
+			with self.lock:
+				self._seed()
+	
+	def _seed(self) -> None:
+		"""登记初始名称，调用方需持有锁"""
+		if self.seed_function is not None:
+			seed_function, self.seed_function = self.seed_function, None
+			for name in seed_function():
+				self._add_name(name)
+	
+	def _add_name(self, name: str) -> int:
+		"""登记名称并返回id，调用方需持有锁"""
+		name_id = self.id_dict.get(name)  # 等锁期间可能已被其他线程登记
+		if name_id is None:
+			name_id = len(self.name_list)
+			name = sys.intern(name)
+			self.name_list.append(name)  # 先追加再公开id，其他线程查到id时名称已经可用
+			self.id_dict[name] = name_id
+		return name_id
+	
+	def get_id(self, name: str) -> int:
+		"""获取名称对应的id，不存在时登记，第一次登记前先登记初始名称"""
+		name_id = self.id_dict.get(name)
+		if name_id is None:
+			with self.lock:
+				self._seed()
+				name_id = self._add_name(name)
+		return name_id
+	
+	def get_name(self, name_id: int) -> str:
+		"""获取id对应的名称"""
+		return self.name_list[name_id]
+	
+	def intern(self, name: str) -> str:
+		"""获取表中保存的同值字符串，用于让各处的信号字典共用同一份名称"""
+		return self.name_list[self.get_id(name)]
+	
+	def intern_signal_dict(self, data):
+		"""
+		原地驻留控制行为中所有信号字典的name、type和quality，返回data本身
+		控制行为仍以普通JSON字典对外公开，所以这里保存的是驻留后的字符串而不是id，编码时无需再解析
+		"""
+		if isinstance(data, dict):
+			for key, value in data.items():
+				if isinstance(value, str):
+					if key in SIGNAL_KEY_SET:
+						data[key] = self.intern(value)
+				else:
+					self.intern_signal_dict(value)
+		elif isinstance(data, list):
+			for x in data:
+				self.intern_signal_dict(x)
+		return data
+
+
+SIGNAL_KEY_SET = {'name', 'type', 'quality'}  # 信号字典中需要驻留的键
+NO_NAME_ID = -1  # 没有名称的实体在EntityTable中的名称id，不对应驻留表中的任何名称
+
+
+def _get_seed_name_list() -> list:
+	"""名称驻留表的初始内容：全信号的名称与类型以及全品质"""
+	_ = []
+	for signal in my_factorio_consts.ALL_SIGNAL_DICT.values():
+		_.append(signal['name'])
+		if 'type' in signal:
+			_.append(signal['type'])
+	return _ + ALL_QUALITY_LIST
+
+
+NAME_REGISTRY = NameRegistry(_get_seed_name_list)  # 全局名称驻留表，解码时遇到的新名称会追加进来
+
+
 class Entity:
 	"""实体对象"""
 	
+	__slots__ = (
+		'entity_number', 'name_id', 'type_id', 'position_x', 'position_y', 'direction',
+		'control_behavior')
+	
 	def __init__(self, entity: dict | None = None) -> None:
 		if entity is None:
 			entity = {}
@@ -91,6 +575,24 @@ class Entity:
 		# 非共有
 		self.control_behavior = None
 	
+	@property
+	def name(self) -> str | None:
+		"""名称，内部以驻留表id保存"""
+		return None if self.name_id is None else NAME_REGISTRY.name_list[self.name_id]
+	
+	@name.setter
+	def name(self, name: str | None) -> None:
+		self.name_id = None if name is None else NAME_REGISTRY.get_id(name)
+	
+	@property
+	def type(self) -> str | None:
+		"""类型，内部以驻留表id保存"""
+		return None if self.type_id is None else NAME_REGISTRY.name_list[self.type_id]
+	
+	@type.setter
+	def type(self, type: str | None) -> None:
+		self.type_id = None if type is None else NAME_REGISTRY.get_id(type)
+	
 	def get_dict(self) -> dict:
 		"""获得该实体对象的字典格式"""
 		_ = {'position': {'x': self.position_x, 'y': self.position_y}}
@@ -123,6 +625,8 @@ class Entity:
 class ConstantCombinator(Entity):
 	"""常量运算器"""
 	
+	__slots__ = ('filter_count',)
+	
 	def __init__(self, entity: dict | None = None) -> None:
 		if entity is None:
 			entity = {}
@@ -131,7 +635,7 @@ class ConstantCombinator(Entity):
 		self.name = 'constant-combinator'
 		
 		# 控制行为
-		self.control_behavior = entity.get('control_behavior')
+		self.control_behavior = NAME_REGISTRY.intern_signal_dict(entity.get('control_behavior'))
 		if not self.control_behavior:
 			self.init_control_behavior()
 		
@@ -160,9 +664,9 @@ class ConstantCombinator(Entity):
 					'comparator': '=',
 					'count': count,
 					'index': filter_index,
-					'name': name,
-					'type': type,
-					'quality': quality
+					'name': NAME_REGISTRY.intern(name),
+					'type': NAME_REGISTRY.intern(type),
+					'quality': NAME_REGISTRY.intern(quality)
 				})
 	
 	def add_filter_auto(self, count: int = 1) -> None:
@@ -178,25 +682,69 @@ class ConstantCombinator(Entity):
 		if len(self.control_behavior['sections']['sections']) < this_filter_section_index:
 			self.control_behavior['sections']['sections'].append({'filters': [], 'index': this_filter_section_index})
 		
+		name, type, quality = my_factorio_consts.ALL_PIXEL_SIGNAL_LIST[this_filter_global_index]
 		signal = {
 			'comparator': '=',
 			'count': count,
 			'index': this_filter_local_index,
-			'name': ALL_SIGNAL_DICT[str(this_filter_global_index // 5)]['name'],
-			'quality': ALL_QUALITY_LIST[this_filter_global_index % 5]
+			'name': NAME_REGISTRY.intern(name),
+			'quality': NAME_REGISTRY.intern(quality)
 		}
 		
-		if 'type' in ALL_SIGNAL_DICT[str(this_filter_global_index // 5)]:
-			signal['type'] = ALL_SIGNAL_DICT[str(this_filter_global_index // 5)]['type']
+		if type:
+			signal['type'] = NAME_REGISTRY.intern(type)
 		
 		self.control_behavior['sections']['sections'][this_filter_section_index - 1]['filters'].append(signal)
 		
 		self.filter_count += 1
 
 
+_pixel_signal_json_list: list | None = None  # 第i个像素信号的JSON片段，首次使用时构建
+
+
+def get_pixel_signal_json_list() -> list:
+	"""获取每个像素信号的JSON片段 "name":..,"quality":..[,"type":..]，与json_encode的输出一致"""
+	global _pixel_signal_json_list
+	
+	if _pixel_signal_json_list is None:
+		# 先在局部变量中构建完整再赋值，避免其他线程读到构建了一半的列表
+		signal_json_list = []
+		for name, type, quality in my_factorio_consts.ALL_PIXEL_SIGNAL_LIST:
+			signal = {'name': name, 'quality': quality}
+			if type:
+				signal['type'] = type
+			signal_json_list.append(json_encode(signal).decode('utf-8')[1:-1])
+		_pixel_signal_json_list = signal_json_list
+	
+	return _pixel_signal_json_list
+
+
+def iter_auto_filter_control_behavior_json(count_list: list):
+	"""
+	逐个生成常量运算器控制行为的JSON片段，
+	结果与对空的ConstantCombinator依次调用add_filter_auto(count)后的control_behavior编码相同
+	"""
+	
+	signal_json_list = get_pixel_signal_json_list()
+	
+	yield '{"sections":{"sections":['
+	for i, count in enumerate(count_list):
+		local_index = i % 1000 + 1
+		if local_index == 1:
+			yield '{"filters":[' if i == 0 else '],"index":%d},{"filters":[' % (i // 1000)
+		else:
+			yield ','
+		yield '{"comparator":"=","count":%d,"index":%d,%s}' % (count, local_index, signal_json_list[i])
+	if count_list:
+		yield '],"index":%d}' % ((len(count_list) - 1) // 1000 + 1)
+	yield ']}}'
+
+
 class DeciderCombinator(Entity):
 	"""判断运算器"""
 	
+	__slots__ = ('conditions', 'outputs')
+	
 	def __init__(self, entity: dict | None = None) -> None:
 		if entity is None:
 			entity = {}
@@ -205,7 +753,7 @@ class DeciderCombinator(Entity):
 		self.name = 'decider-combinator'
 		
 		# 控制行为
-		self.control_behavior = entity.get('control_behavior')
+		self.control_behavior = NAME_REGISTRY.intern_signal_dict(entity.get('control_behavior'))
 		if not self.control_behavior:
 			self.init_control_behavior()
 	
@@ -235,13 +783,13 @@ class DeciderCombinator(Entity):
 		if constant:
 			_['constant'] = constant
 		if first_signal_name:
-			_['first_signal'] = {'name': first_signal_name}
+			_['first_signal'] = {'name': NAME_REGISTRY.intern(first_signal_name)}
 			if first_signal_type:
-				_['first_signal']['type'] = first_signal_type
+				_['first_signal']['type'] = NAME_REGISTRY.intern(first_signal_type)
 		if second_signal_name:
-			_['second_signal'] = {'name': second_signal_name}
+			_['second_signal'] = {'name': NAME_REGISTRY.intern(second_signal_name)}
 			if second_signal_type:
-				_['second_signal']['type'] = second_signal_type
+				_['second_signal']['type'] = NAME_REGISTRY.intern(second_signal_type)
 		self.conditions.append(_)
 	
 	def add_output(
@@ -256,15 +804,17 @@ class DeciderCombinator(Entity):
 				'green': use_green_network,
 				'red': use_red_network}}
 		if signal_name:
-			_['signal'] = {'name': signal_name}
+			_['signal'] = {'name': NAME_REGISTRY.intern(signal_name)}
 			if signal_type:
-				_['signal']['type'] = signal_type
+				_['signal']['type'] = NAME_REGISTRY.intern(signal_type)
 		self.outputs.append(_)
 
 
 class ArithmeticCombinator(Entity):
 	"""算术运算器"""
 	
+	__slots__ = ()
+	
 	def __init__(self, entity: dict | None = None) -> None:
 		if entity is None:
 			entity = {}
@@ -273,7 +823,7 @@ class ArithmeticCombinator(Entity):
 		self.name = 'arithmetic-combinator'
 		
 		# 控制行为
-		self.control_behavior = entity.get('control_behavior')
+		self.control_behavior = NAME_REGISTRY.intern_signal_dict(entity.get('control_behavior'))
 		if not self.control_behavior:
 			self.init_control_behavior()
 	
@@ -283,15 +833,18 @@ class ArithmeticCombinator(Entity):
 	
 	def set_first_signal(self, name: str = '', type: str = ''):
 		"""设置第一信号"""
-		self.control_behavior['arithmetic_conditions']['first_signal'] = {'name': name, 'type': type}
+		self.control_behavior['arithmetic_conditions']['first_signal'] = {
+			'name': NAME_REGISTRY.intern(name), 'type': NAME_REGISTRY.intern(type)}
 	
 	def set_second_signal(self, name: str = '', type: str = ''):
 		"""设置第二信号"""
-		self.control_behavior['arithmetic_conditions']['second_signal'] = {'name': name, 'type': type}
+		self.control_behavior['arithmetic_conditions']['second_signal'] = {
+			'name': NAME_REGISTRY.intern(name), 'type': NAME_REGISTRY.intern(type)}
 	
 	def set_output_signal(self, name: str = '', type: str = ''):
 		"""设置输出信号"""
-		self.control_behavior['arithmetic_conditions']['output_signal'] = {'name': name, 'type': type}
+		self.control_behavior['arithmetic_conditions']['output_signal'] = {
+			'name': NAME_REGISTRY.intern(name), 'type': NAME_REGISTRY.intern(type)}
 	
 	def set_operation(self, operation: str = '*'):
 		"""设置运算符"""
@@ -309,6 +862,8 @@ class ArithmeticCombinator(Entity):
 class Icon:
 	"""图标对象"""
 	
+	__slots__ = ('index', 'signal')
+	
 	def __init__(self, icon: dict) -> None:
 		self.index = icon.get('index')
 		self.signal = {
@@ -325,25 +880,465 @@ class Icon:
 		return _
 
 
+def get_entity_size(entity: Entity) -> tuple:
+	"""获取实体考虑朝向后的占地尺寸 (宽, 高)，朝东或朝西时宽高互换"""
+	width, height = ENTITY_SIZE_DICT.get(entity.name, (1, 1))
+	if entity.direction in (DirectionType.EAST.value, DirectionType.WEST.value):
+		return height, width
+	return width, height
+
+
+def get_entity_box(entity: Entity) -> tuple:
+	"""获取实体的占地矩形 (left, top, right, bottom)，实体坐标为占地中心"""
+	width, height = get_entity_size(entity)
+	return (
+		entity.position_x - width / 2, entity.position_y - height / 2,
+		entity.position_x + width / 2, entity.position_y + height / 2)
+
+
+class SpatialIndex:
+	"""
+	实体的网格哈希空间索引
+	将平面划分为边长cell_size的格子，每个实体登记到其占地矩形覆盖的所有格子中，
+	点查询只检查一个格子，矩形查询只检查覆盖到的格子，最近邻查询由近及远逐圈扩展
+	"""
+	
+	def __init__(self, entities: list | None = None, cell_size: int = 8) -> None:
+		self.cell_size = cell_size  # 格子边长
+		self.cell_dict = {}  # (格子x, 格子y) -> 实体列表
+		self.entity_dict = {}  # 实体 -> (占地矩形, 所在格子列表)
+		self.cell_range = None  # 出现过的格子坐标范围 (min_x, min_y, max_x, max_y)，只扩大不缩小，用于限制最近邻的搜索圈数
+		
+		for entity in entities or []:
+			self.add(entity)
+	
+	def __len__(self) -> int:
+		return len(self.entity_dict)
+	
+	def __contains__(self, entity: Entity) -> bool:
+		return entity in self.entity_dict
+	
+	def get_cell_list(self, left: float, top: float, right: float, bottom: float) -> list:
+		"""获取矩形覆盖的所有格子，右边界与下边界不含"""
+		cell_size = self.cell_size
+		min_x = math.floor(left / cell_size)
+		min_y = math.floor(top / cell_size)
+		max_x = max(min_x, math.ceil(right / cell_size) - 1)
+		max_y = max(min_y, math.ceil(bottom / cell_size) - 1)
+		return [(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)]
+	
+	def add(self, entity: Entity) -> None:
+		"""登记实体，已登记的实体会按当前坐标重新登记"""
+		if entity in self.entity_dict:
+			self.remove(entity)
+		
+		box = get_entity_box(entity)
+		cell_list = self.get_cell_list(*box)
+		for cell in cell_list:
+			self.cell_dict.setdefault(cell, []).append(entity)
+		self.entity_dict[entity] = (box, cell_list)
+		
+		first_x, first_y = cell_list[0]
+		last_x, last_y = cell_list[-1]
+		if self.cell_range is None:
+			self.cell_range = (first_x, first_y, last_x, last_y)
+		else:
+			min_x, min_y, max_x, max_y = self.cell_range
+			self.cell_range = (min(min_x, first_x), min(min_y, first_y), max(max_x, last_x), max(max_y, last_y))
+	
+	def remove(self, entity: Entity) -> None:
+		"""注销实体，未登记时抛出KeyError"""
+		_, cell_list = self.entity_dict.pop(entity)
+		for cell in cell_list:
+			entity_list = self.cell_dict[cell]
+			entity_list.remove(entity)
+			if not entity_list:
+				del self.cell_dict[cell]
+	
+	def update(self, entity: Entity) -> None:
+		"""实体移动、旋转或改名后更新其登记"""
+		self.add(entity)
+	
+	def clear(self) -> None:
+		"""清空索引"""
+		self.cell_dict.clear()
+		self.entity_dict.clear()
+		self.cell_range = None
+	
+	def get_box(self, entity: Entity) -> tuple:
+		"""获取登记时的占地矩形"""
+		return self.entity_dict[entity][0]
+	
+	def query_point(self, x: float, y: float) -> list:
+		"""获取占地矩形包含点 (x, y) 的所有实体"""
+		cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+		_ = []
+		for entity in self.cell_dict.get(cell, []):
+			left, top, right, bottom = self.entity_dict[entity][0]
+			if left <= x < right and top <= y < bottom:
+				_.append(entity)
+		return _
+	
+	def query_rect(self, left: float, top: float, right: float, bottom: float) -> list:
+		"""获取占地矩形与给定矩形重叠（不含仅边界接触）的所有实体，按登记顺序去重"""
+		seen = set()
+		_ = []
+		for cell in self.get_cell_list(left, top, right, bottom):
+			for entity in self.cell_dict.get(cell, []):
+				if entity in seen:
+					continue
+				seen.add(entity)
+				entity_left, entity_top, entity_right, entity_bottom = self.entity_dict[entity][0]
+				if entity_left < right and left < entity_right and entity_top < bottom and top < entity_bottom:
+					_.append(entity)
+		return _
+	
+	def query_nearest(self, x: float, y: float, max_distance: float | None = None) -> Entity | None:
+		"""
+		获取中心点离 (x, y) 最近的实体，max_distance为最大距离，找不到时返回None
+		以点所在格子为中心逐圈向外搜索，第k圈之外的格子距离至少为k * cell_size，当前最优不大于该值时即可停止
+		"""
+		if not self.entity_dict:
+			return None
+		
+		cell_size = self.cell_size
+		center_x = math.floor(x / cell_size)
+		center_y = math.floor(y / cell_size)
+		min_x, min_y, max_x, max_y = self.cell_range
+		max_ring = max(center_x - min_x, max_x - center_x, center_y - min_y, max_y - center_y)
+		if max_distance is not None:
+			max_ring = min(max_ring, math.ceil(max_distance / cell_size))
+		
+		best_entity = None
+		best_distance = math.inf if max_distance is None else max_distance
+		for ring in range(max_ring + 1):
+			for cell_x in range(center_x - ring, center_x + ring + 1):
+				# 圈的上下两行取整行，中间各行只取左右两端
+				step = 1 if cell_x in (center_x - ring, center_x + ring) else max(2 * ring, 1)
+				for cell_y in range(center_y - ring, center_y + ring + 1, step):
+					for entity in self.cell_dict.get((cell_x, cell_y), []):
+						distance = math.hypot(entity.position_x - x, entity.position_y - y)
+						if distance <= best_distance and (best_entity is None or distance < best_distance):
+							best_entity = entity
+							best_distance = distance
+			if best_entity is not None and best_distance <= ring * cell_size:
+				break
+		return best_entity
+	
+	def find_overlaps(self) -> list:
+		"""获取所有占地重叠的实体对 [(实体a, 实体b)]，用于碰撞校验"""
+		seen = set()
+		_ = []
+		for entity_list in self.cell_dict.values():
+			for i, first_entity in enumerate(entity_list):
+				first_left, first_top, first_right, first_bottom = self.entity_dict[first_entity][0]
+				for second_entity in entity_list[i + 1:]:
+					pair_key = (id(first_entity), id(second_entity))
+					if pair_key in seen:
+						continue
+					seen.add(pair_key)
+					left, top, right, bottom = self.entity_dict[second_entity][0]
+					if left < first_right and first_left < right and top < first_bottom and first_top < bottom:
+						_.append((first_entity, second_entity))
+		return _
+
+
+# 连接点 -> 信号线颜色，其余连接点（如电线杆的铜线）不属于电路网络
+WIRE_COLOR_DICT = {
+	WireType.RED_INPUT.value: 'red',
+	WireType.RED_OUTPUT.value: 'red',
+	WireType.GREEN_INPUT.value: 'green',
+	WireType.GREEN_OUTPUT.value: 'green',
+}
+
+
+class UnionFind:
+	"""并查集，按大小合并并做路径减半"""
+	
+	def __init__(self) -> None:
+		self.parent_dict = {}  # 节点 -> 父节点
+		self.size_dict = {}  # 根节点 -> 集合大小
+	
+	def find(self, node):
+		"""获取节点所在集合的根节点，新节点自成一个集合"""
+		parent_dict = self.parent_dict
+		if node not in parent_dict:
+			parent_dict[node] = node
+			self.size_dict[node] = 1
+			return node
+		
+		while parent_dict[node] != node:
+			parent_dict[node] = parent_dict[parent_dict[node]]
+			node = parent_dict[node]
+		return node
+	
+	def union(self, first_node, second_node) -> None:
+		"""合并两个节点所在的集合"""
+		first_root = self.find(first_node)
+		second_root = self.find(second_node)
+		if first_root == second_root:
+			return
+		if self.size_dict[first_root] < self.size_dict[second_root]:
+			first_root, second_root = second_root, first_root
+		self.parent_dict[second_root] = first_root
+		self.size_dict[first_root] += self.size_dict.pop(second_root)
+
+
+class WireGraph:
+	"""
+	信号线图索引
+	由蓝图中 [实体a, 连接点a, 实体b, 连接点b] 的原始列表构建，图自己保存一份去重后的线缆，不修改传入的列表
+	以无向的端点对为键做O(1)查重与删除，邻接表按 实体序号 -> 连接点 -> 对端集合 组织，
+	红线与绿线各用一个并查集求连通的电路网络，删除线缆后并查集在下次查询时重建
+	"""
+	
+	def __init__(self, wire_list: list | None = None) -> None:
+		self.wire_dict = {}  # 线缆的键 -> (实体a, 连接点a, 实体b, 连接点b)，保持添加顺序
+		self.adjacency_dict = {}  # 实体序号 -> {连接点: {(对端实体序号, 对端连接点)}}
+		self.union_find_dict = {'red': None, 'green': None}  # 颜色 -> 并查集，为None时需重建
+		self.network_dict = {'red': None, 'green': None}  # 颜色 -> {根节点: 网络节点集合}，查询时才生成
+		
+		# 原始列表中可能已有重复线缆，只保留第一条
+		self.add_wires(wire_list or [])
+	
+	def __len__(self) -> int:
+		return len(self.wire_dict)
+	
+	def get_wire_list(self) -> list:
+		"""获取全部线缆的列表 [[实体a, 连接点a, 实体b, 连接点b]]，按添加顺序排列，修改结果不影响图"""
+		return [list(x) for x in self.wire_dict.values()]
+	
+	@staticmethod
+	def get_wire_key(
+			first_entity_number: int, first_connector: int, second_entity_number: int, second_connector: int) -> tuple:
+		"""获取线缆的无向键，两端顺序不同的同一条线缆键相同"""
+		first_end = (first_entity_number, first_connector)
+		second_end = (second_entity_number, second_connector)
+		return (first_end, second_end) if first_end <= second_end else (second_end, first_end)
+	
+	@staticmethod
+	def get_wire_color(first_connector: int, second_connector: int) -> str | None:
+		"""
+		获取线缆颜色，两端都不是信号线连接点时（如电线杆与电闸的铜线连接点）返回None，
+		信号线连接点与铜线连接点相连或两端颜色不一致时抛出ValueError
+		"""
+		first_color = WIRE_COLOR_DICT.get(first_connector)
+		second_color = WIRE_COLOR_DICT.get(second_connector)
+		
+		if first_color is None and second_color is None:
+			return None  # 铜线，只登记邻接关系，不参与红绿电路网络
+		if first_color is None or second_color is None:
+			raise ValueError('信号线连接点不能与铜线连接点{}相连'.format(
+				first_connector if first_color is None else second_connector))
+		if first_color != second_color:
+			raise ValueError('连接点{}与{}的线缆颜色不一致'.format(first_connector, second_connector))
+		return first_color
+	
+	def link(self, first_entity_number: int, first_connector: int, second_entity_number: int, second_connector: int) -> None:
+		"""在邻接表与并查集中登记一条线缆"""
+		color = self.get_wire_color(first_connector, second_connector)
+		
+		self.adjacency_dict.setdefault(first_entity_number, {}).setdefault(first_connector, set()).add(
+			(second_entity_number, second_connector))
+		self.adjacency_dict.setdefault(second_entity_number, {}).setdefault(second_connector, set()).add(
+			(first_entity_number, first_connector))
+		
+		if color is not None:
+			if self.union_find_dict[color] is not None:
+				self.union_find_dict[color].union(
+					(first_entity_number, first_connector), (second_entity_number, second_connector))
+			self.network_dict[color] = None
+	
+	def has_wire(
+			self, first_entity_number: int, first_connector: int, second_entity_number: int, second_connector: int) -> bool:
+		"""线缆是否已存在"""
+		return self.get_wire_key(first_entity_number, first_connector, second_entity_number, second_connector) in self.wire_dict
+	
+	def add_wire(
+			self, first_entity_number: int, first_connector: int, second_entity_number: int, second_connector: int) -> bool:
+		"""添加线缆，已存在时不添加并返回False"""
+		key = self.get_wire_key(first_entity_number, first_connector, second_entity_number, second_connector)
+		if key in self.wire_dict:
+			return False
+		
+		self.link(first_entity_number, first_connector, second_entity_number, second_connector)
+		self.wire_dict[key] = (first_entity_number, first_connector, second_entity_number, second_connector)
+		return True
+	
+	def add_wires(self, wire_list: list) -> int:
+		"""批量添加线缆，返回实际添加的数量"""
+		return sum(self.add_wire(*x) for x in wire_list)
+	
+	def remove_wires(self, wire_list: list) -> int:
+		"""批量删除线缆，返回实际删除的数量"""
+		key_set = {self.get_wire_key(*x) for x in wire_list} & self.wire_dict.keys()
+		if not key_set:
+			return 0
+		
+		for first_end, second_end in key_set:
+			self.unlink(first_end, second_end)
+			if second_end != first_end:
+				self.unlink(second_end, first_end)
+			color = self.get_wire_color(first_end[1], second_end[1])
+			if color is not None:
+				self.union_find_dict[color] = None  # 并查集不支持删除，下次查询时重建
+				self.network_dict[color] = None
+		
+		for key in key_set:
+			del self.wire_dict[key]
+		return len(key_set)
+	
+	def remove_wire(
+			self, first_entity_number: int, first_connector: int, second_entity_number: int, second_connector: int) -> bool:
+		"""删除线缆，不存在时返回False"""
+		return bool(self.remove_wires([[first_entity_number, first_connector, second_entity_number, second_connector]]))
+	
+	def remove_entity(self, entity_number: int) -> int:
+		"""删除与实体相连的所有线缆，返回删除的数量"""
+		wire_list = [
+			[entity_number, connector, *end]
+			for connector, end_set in self.adjacency_dict.get(entity_number, {}).items() for end in end_set]
+		return self.remove_wires(wire_list)
+	
+	def unlink(self, end: tuple, other_end: tuple) -> None:
+		"""从邻接表中删除end到other_end的一侧"""
+		entity_number, connector = end
+		connector_dict = self.adjacency_dict[entity_number]
+		connector_dict[connector].discard(other_end)
+		if not connector_dict[connector]:
+			del connector_dict[connector]
+			if not connector_dict:
+				del self.adjacency_dict[entity_number]
+	
+	def get_neighbors(self, entity_number: int, connector: int | None = None) -> set:
+		"""获取与实体（的某个连接点）直接相连的对端 {(实体序号, 连接点)}"""
+		connector_dict = self.adjacency_dict.get(entity_number, {})
+		if connector is not None:
+			return set(connector_dict.get(connector, set()))
+		return set().union(*connector_dict.values())
+	
+	def get_union_find(self, color: str) -> UnionFind:
+		"""获取某种颜色的并查集，失效时由全部线缆重建"""
+		if self.union_find_dict[color] is None:
+			union_find = UnionFind()
+			for first_end, second_end in self.wire_dict:
+				if WIRE_COLOR_DICT.get(first_end[1]) == color:
+					union_find.union(first_end, second_end)
+			self.union_find_dict[color] = union_find
+		return self.union_find_dict[color]
+	
+	def get_network_dict(self, color: str) -> dict:
+		"""获取某种颜色的所有电路网络 {根节点: {(实体序号, 连接点)}}"""
+		if self.network_dict[color] is None:
+			union_find = self.get_union_find(color)
+			network_dict = {}
+			for node in union_find.parent_dict:
+				network_dict.setdefault(union_find.find(node), set()).add(node)
+			self.network_dict[color] = network_dict
+		return self.network_dict[color]
+	
+	def get_networks(self, color: str) -> list:
+		"""获取某种颜色的所有电路网络，每个网络为连接点集合 {(实体序号, 连接点)}"""
+		return list(self.get_network_dict(color).values())
+	
+	def get_network(self, entity_number: int, connector: int) -> set:
+		"""获取连接点所在的电路网络，未接线时只含其自身"""
+		color = WIRE_COLOR_DICT.get(connector)
+		if color is None:
+			raise ValueError('连接点{}不属于电路网络'.format(connector))
+		
+		node = (entity_number, connector)
+		union_find = self.get_union_find(color)
+		if node not in union_find.parent_dict:
+			return {node}
+		return set(self.get_network_dict(color)[union_find.find(node)])
+	
+	def is_connected(
+			self, first_entity_number: int, first_connector: int, second_entity_number: int, second_connector: int) -> bool:
+		"""两个连接点是否处于同一电路网络"""
+		first_node = (first_entity_number, first_connector)
+		second_node = (second_entity_number, second_connector)
+		if first_node == second_node:
+			return True
+		
+		color = self.get_wire_color(first_connector, second_connector)
+		if color is None:
+			return False
+		union_find = self.get_union_find(color)
+		if first_node not in union_find.parent_dict or second_node not in union_find.parent_dict:
+			return False
+		return union_find.find(first_node) == union_find.find(second_node)
+
+
 class Blueprint:
-	"""蓝图对象"""
+	"""
+	蓝图对象
+	只对象化名称、简介、版本号、线缆、图标和实体，地砖、时刻表等其余键保存在原始字典中，get_dict时原样写回
+	"""
+	
+	MODELLED_KEY_SET = {'item', 'label', 'description', 'version', 'wires', 'icons', 'entities'}  # 由对象属性生成的键
 	
-	def __init__(self, blueprint_dict: dict | None = None) -> None:
+	def __init__(self, blueprint_dict: dict | None = None, lazy: bool = False) -> None:
+		"""
+		lazy为True时不立即构建实体对象，原始实体列表保持不变，
+		直到首次访问entities才对象化；若从未访问，get_dict会原样写回原始实体列表
+		"""
 		if blueprint_dict is None:
 			blueprint_dict = {}
 		
 		blueprint = blueprint_dict.get('blueprint', {})
 		
+		self._raw_blueprint: dict = blueprint  # 原始蓝图字典，不会被修改，未对象化的键从这里写回
 		self.label = blueprint.get('label')  # 名称
 		self.description = blueprint.get('description')  # 简介
 		self.version = blueprint.get('version')  # 版本号
-		self.wires = blueprint.get('wires')  # 线缆数据
+		self._raw_wire_list: list | None = blueprint.get('wires')  # 尚未构建信号线图时的原始线缆列表，不会被修改
 		self.icons = [Icon(x) for x in blueprint.get('icons', [])]  # 图标列表
-		self.entities = [Entity(x) for x in blueprint.get('entities', [])]  # 实体列表
+		
+		self._raw_entity_list: list | None = blueprint.get('entities', [])  # 尚未对象化的原始实体列表
+		self._entities: list | None = None  # 实体列表
+		self._spatial_index: SpatialIndex | None = None  # 空间索引，首次查询时构建
+		self._wire_graph: WireGraph | None = None  # 信号线图索引，首次使用时构建，之后线缆只保存在图中
+		if not lazy:
+			self.entities  # 立即对象化
 	
-	def get_dict(self) -> dict:
-		"""获得该蓝图对象的字典形式"""
-		_ = {'item': 'blueprint'}
+	@property
+	def entities(self) -> list:
+		"""实体列表，惰性模式下首次访问时才对象化"""
+		if self._entities is None:
+			self._entities = [Entity(x) for x in self._raw_entity_list]
+			self._raw_entity_list = None
+		return self._entities
+	
+	@entities.setter
+	def entities(self, entities: list) -> None:
+		self._entities = entities
+		self._raw_entity_list = None
+		self._spatial_index = None
+	
+	def set_wire_list(self, wire_list: list | None) -> None:
+		"""整体替换线缆数据，信号线图在下次使用时由新列表重建"""
+		self._raw_wire_list = wire_list
+		self._wire_graph = None
+	
+	def get_wire_list(self) -> list | None:
+		"""获取用于写入蓝图的线缆列表，尚未构建信号线图时原样返回原始列表"""
+		if self._wire_graph is not None:
+			return self._wire_graph.get_wire_list()
+		return self._raw_wire_list
+	
+	def is_entities_loaded(self) -> bool:
+		"""实体是否已经对象化"""
+		return self._entities is not None
+	
+	def get_unmodelled_dict(self) -> dict:
+		"""获取原始字典中未对象化的键值"""
+		return {k: v for k, v in self._raw_blueprint.items() if k not in self.MODELLED_KEY_SET}
+	
+	def get_header_dict(self) -> dict:
+		"""获取除实体以外的蓝图字典，get_dict与write_to_emitter共用，保证两者写出的键一致"""
+		_ = self.get_unmodelled_dict()
+		_['item'] = 'blueprint'
 		
 		if self.label:
 			_['label'] = self.label
@@ -351,18 +1346,75 @@ class Blueprint:
 			_['description'] = self.description
 		if self.version:
 			_['version'] = self.version
-		if self.wires:
-			_['wires'] = self.wires
+		wire_list = self.get_wire_list()
+		if wire_list:
+			_['wires'] = wire_list
 		if self.icons:
 			_['icons'] = [x.get_dict() for x in self.icons]
-		if self.entities:
-			_['entities'] = [x.get_dict() for x in self.entities]
+		
+		return _
+	
+	def get_dict(self) -> dict:
+		"""获得该蓝图对象的字典形式"""
+		_ = self.get_header_dict()
+		if not self.is_entities_loaded():
+			if self._raw_entity_list:
+				_['entities'] = self._raw_entity_list  # 未访问过的实体原样写回
+		elif self._entities:
+			_['entities'] = [x.get_dict() for x in self._entities]
 		
 		return {'blueprint': _}
 	
+	def write_to_emitter(self, emitter: BlueprintEmitter, control_behavior_fragments_dict: dict | None = None) -> None:
+		"""
+		将蓝图直接写入发射器，结果与get_dict后编码相同
+		control_behavior_fragments_dict为 {实体序号: control_behavior的JSON片段}，用于不构建字典地写入大型控制行为
+		"""
+		if control_behavior_fragments_dict is None:
+			control_behavior_fragments_dict = {}
+		
+		_ = self.get_header_dict()
+		if self.get_entities_number():
+			_['entities'] = None  # 占位，实际内容单独写入
+		
+		emitter.write('{"blueprint":{')
+		for i, key in enumerate(sorted(_)):
+			if i:
+				emitter.write(',')
+			emitter.write(json_encode(key).decode('utf-8') + ':')
+			
+			if key != 'entities':
+				emitter.write_value(_[key])
+			elif not self.is_entities_loaded():
+				emitter.write_value(self._raw_entity_list)
+			else:
+				emitter.write('[')
+				for j, entity in enumerate(self._entities):
+					if j:
+						emitter.write(',')
+					emitter.write_entity(entity, control_behavior_fragments_dict.get(entity.entity_number))
+				emitter.write(']')
+		emitter.write('}}')
+	
 	def get_entities_number(self) -> int:
 		"""获取实体总数"""
-		return len(self.entities)
+		if not self.is_entities_loaded():
+			return len(self._raw_entity_list)
+		return len(self._entities)
+	
+	def get_entities_by_name(self, name: str) -> list:
+		"""获取所有指定名称的实体"""
+		if name not in NAME_REGISTRY:
+			return []
+		name_id = NAME_REGISTRY.get_id(name)
+		return [x for x in self.entities if x.name_id == name_id]
+	
+	def replace_entities(self, old_name: str, name: str = None, type: str = None) -> int:
+		"""将所有指定名称的实体置换为新的name或type，返回置换的数量"""
+		entity_list = self.get_entities_by_name(old_name)
+		for entity in entity_list:
+			entity.replace(name, type)
+		return len(entity_list)
 	
 	def add_entity(self, entity: Entity, entity_number: int = 0) -> None:
 		"""添加实体"""
@@ -370,47 +1422,432 @@ class Blueprint:
 			entity.entity_number = len(self.entities) + 1
 		
 		self.entities.append(entity)
+		if self._spatial_index is not None:
+			self._spatial_index.add(entity)
+	
+	def get_spatial_index(self) -> SpatialIndex:
+		"""
+		获取空间索引，首次调用时构建，之后由add_entity维护
+		直接移动、旋转实体或用EntityTable写回后，需调用reset_spatial_index或SpatialIndex.update
+		"""
+		if self._spatial_index is None:
+			self._spatial_index = SpatialIndex(self.entities)
+		return self._spatial_index
+	
+	def reset_spatial_index(self) -> None:
+		"""丢弃空间索引，下次查询时重新构建"""
+		self._spatial_index = None
+	
+	def get_entities_at(self, x: float, y: float) -> list:
+		"""获取占据点 (x, y) 的所有实体"""
+		return self.get_spatial_index().query_point(x, y)
+	
+	def get_entities_in_rect(self, left: float, top: float, right: float, bottom: float) -> list:
+		"""获取与矩形重叠的所有实体"""
+		return self.get_spatial_index().query_rect(left, top, right, bottom)
+	
+	def get_nearest_entity(self, x: float, y: float, max_distance: float | None = None) -> Entity | None:
+		"""获取中心点离 (x, y) 最近的实体"""
+		return self.get_spatial_index().query_nearest(x, y, max_distance)
+	
+	def get_wire_graph(self) -> WireGraph:
+		"""
+		获取信号线图索引，首次调用时由原始线缆列表构建（原始列表可能与解码缓存共用，不会被修改），
+		之后线缆只保存在图中，写回蓝图时由图生成；set_wire_list会丢弃当前的图
+		"""
+		if self._wire_graph is None:
+			self._wire_graph = WireGraph(self._raw_wire_list)
+			self._raw_wire_list = None
+		return self._wire_graph
 	
 	def connect_entity(
 			self, first_entity: Entity, second_entity: Entity,
 			connect_code: str = 'ii', wire_type: str = '') -> None:
-		"""将实体用信号线连接在一起"""
+		"""将实体用信号线连接在一起，已存在的线缆不会重复添加"""
 		if not first_entity.entity_number or not second_entity.entity_number:
 			raise KeyError
 		
-		if not self.wires:
-			self.wires = []
-		
 		match connect_code:
 			case 'ii':
-				if 'r' in wire_type:
-					self.wires.append([first_entity.entity_number, 1, second_entity.entity_number, 1])
-				if 'g' in wire_type:
-					self.wires.append([first_entity.entity_number, 2, second_entity.entity_number, 2])
+				first_connector, second_connector = WireType.RED_INPUT.value, WireType.RED_INPUT.value
 			case 'io':
-				if 'r' in wire_type:
-					self.wires.append([first_entity.entity_number, 1, second_entity.entity_number, 3])
-				if 'g' in wire_type:
-					self.wires.append([first_entity.entity_number, 2, second_entity.entity_number, 4])
+				first_connector, second_connector = WireType.RED_INPUT.value, WireType.RED_OUTPUT.value
 			case 'oi':
-				if 'r' in wire_type:
-					self.wires.append([first_entity.entity_number, 3, second_entity.entity_number, 1])
-				if 'g' in wire_type:
-					self.wires.append([first_entity.entity_number, 4, second_entity.entity_number, 2])
+				first_connector, second_connector = WireType.RED_OUTPUT.value, WireType.RED_INPUT.value
 			case 'oo':
-				if 'r' in wire_type:
-					self.wires.append([first_entity.entity_number, 3, second_entity.entity_number, 3])
-				if 'g' in wire_type:
-					self.wires.append([first_entity.entity_number, 4, second_entity.entity_number, 4])
+				first_connector, second_connector = WireType.RED_OUTPUT.value, WireType.RED_OUTPUT.value
 			case _:
 				raise KeyError
+		
+		wire_graph = self.get_wire_graph()
+		if 'r' in wire_type:
+			wire_graph.add_wire(first_entity.entity_number, first_connector, second_entity.entity_number, second_connector)
+		if 'g' in wire_type:
+			# 绿线的连接点编号比同侧红线大1
+			wire_graph.add_wire(
+				first_entity.entity_number, first_connector + 1, second_entity.entity_number, second_connector + 1)
+
+
+class BlueprintBook:
+	"""
+	蓝图书对象
+	子条目保持原始字典，首次通过get_child访问时才对象化：蓝图为惰性Blueprint，嵌套蓝图书为BlueprintBook，
+	升级规划、拆除规划等其余条目原样返回字典；未访问过的条目在get_dict时原样写回，
+	访问过的条目只用对象覆盖其对象化的键，其余键照原样保留
+	"""
+	
+	MODELLED_KEY_SET = {'item', 'label', 'description', 'version', 'active_index', 'icons', 'blueprints'}  # 由对象属性生成的键
+	
+	def __init__(self, book_dict: dict | None = None) -> None:
+		if book_dict is None:
+			book_dict = {}
+		
+		book = book_dict.get('blueprint_book', {})
+		
+		self._raw_book: dict = book  # 原始蓝图书字典，不会被修改，未对象化的键从这里写回
+		self.label = book.get('label')  # 名称
+		self.description = book.get('description')  # 简介
+		self.version = book.get('version')  # 版本号
+		self.active_index = book.get('active_index')  # 当前选中的格子序号
+		self.icons = [Icon(x) for x in book.get('icons', [])]  # 图标列表
+		
+		self._raw_child_list: list = list(book.get('blueprints', []))  # 原始子条目 {'index': 格子序号, 类型: 字典}，复制列表以免添加条目时修改原始字典
+		self._child_object_list: list = [None] * len(self._raw_child_list)  # 已对象化的子条目
+	
+	def __len__(self) -> int:
+		return len(self._raw_child_list)
+	
+	def get_index(self, position: int) -> int:
+		"""获取第position个子条目在书中的格子序号"""
+		return self._raw_child_list[position].get('index', position)
+	
+	def get_child_type(self, position: int) -> str:
+		"""获取第position个子条目的类型，如'blueprint'、'blueprint_book'"""
+		for key in self._raw_child_list[position]:
+			if key != 'index':
+				return key
+		raise KeyError(position)
+	
+	def get_child(self, position: int):
+		"""获取第position个子条目，首次访问时对象化"""
+		if self._child_object_list[position] is None:
+			child_type = self.get_child_type(position)
+			child_dict = {child_type: self._raw_child_list[position][child_type]}
+			match child_type:
+				case 'blueprint':
+					self._child_object_list[position] = Blueprint(child_dict, lazy=True)
+				case 'blueprint_book':
+					self._child_object_list[position] = BlueprintBook(child_dict)
+				case _:
+					self._child_object_list[position] = child_dict
+		return self._child_object_list[position]
+	
+	def iter_blueprints(self, recursive: bool = True):
+		"""按书中顺序遍历所有蓝图对象，recursive为True时包含嵌套蓝图书中的蓝图"""
+		for i in range(len(self)):
+			match self.get_child_type(i):
+				case 'blueprint':
+					yield self.get_child(i)
+				case 'blueprint_book' if recursive:
+					yield from self.get_child(i).iter_blueprints(recursive)
+	
+	def add_child(self, child, index: int | None = None) -> None:
+		"""添加蓝图或蓝图书，index为None时放在最后一个格子之后"""
+		if index is None:
+			index = max((self.get_index(i) for i in range(len(self))), default=-1) + 1
+		
+		child_type = 'blueprint_book' if isinstance(child, BlueprintBook) else 'blueprint'
+		self._raw_child_list.append({'index': index, child_type: child.get_dict()[child_type]})
+		self._child_object_list.append(child)
+	
+	def get_dict(self) -> dict:
+		"""获得该蓝图书对象的字典形式"""
+		_ = {k: v for k, v in self._raw_book.items() if k not in self.MODELLED_KEY_SET}
+		_['item'] = 'blueprint-book'
+		
+		if self.label:
+			_['label'] = self.label
+		if self.description:
+			_['description'] = self.description
+		if self.version:
+			_['version'] = self.version
+		if self.active_index is not None:
+			_['active_index'] = self.active_index
+		if self.icons:
+			_['icons'] = [x.get_dict() for x in self.icons]
+		
+		blueprints = []
+		for i, raw_child in enumerate(self._raw_child_list):
+			child = self._child_object_list[i]
+			if child is None or isinstance(child, dict):
+				blueprints.append(raw_child)  # 未访问过的条目原样写回
+				continue
+			child_type = self.get_child_type(i)
+			entry = dict(raw_child)  # 保留条目中除子字典外的其他键
+			entry[child_type] = child.get_dict()[child_type]
+			blueprints.append(entry)
+		if blueprints:
+			_['blueprints'] = blueprints
+		
+		return {'blueprint_book': _}
+
+
+class GenerationCancelled(Exception):
+	"""生成或批量处理任务被取消，由进度回调抛出"""
+
+
+def map_blueprint_list(function, item_list: list, workers: int | None = None, args: tuple = ()) -> list:
+	"""
+	在进程池中对每一项调用function(item, *args)，结果顺序与item_list一致，args为其余位置参数
+	JSON编解码在持有GIL时进行，因此使用进程池；function必须是模块顶层函数，item与结果需可pickle，
+	应传递字典或字符串而不是实体对象（名称id只在本进程有效）；workers为1时串行处理，为None时按CPU核数
+	"""
+	
+	if workers == 1 or len(item_list) <= 1:
+		return [function(x, *args) for x in item_list]
+	
+	from concurrent.futures import ProcessPoolExecutor  # 导入较慢，只在真正并行时导入
+	
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		return list(executor.map(function, item_list, *[repeat(x) for x in args]))
+
+
+def dict_list_to_blueprint_list(
+		blueprint_dict_list: list, compression_level: int = CompressionLevelType.DEFAULT.value,
+		workers: int | None = None) -> list:
+	"""并行地将多个字典加密为蓝图"""
+	return map_blueprint_list(dict_to_blueprint, blueprint_dict_list, workers, (compression_level,))
+
+
+def blueprint_list_to_dict_list(blueprint_string_list: list, workers: int | None = None) -> list:
+	"""并行地将多个蓝图代码解码为字典"""
+	return map_blueprint_list(blueprint_to_dict, blueprint_string_list, workers)
+
+
+def get_book_blueprint_entry_list(book_dict: dict, recursive: bool = True) -> list:
+	"""按书中顺序收集蓝图书字典中的蓝图条目 {'index': 格子序号, 'blueprint': 字典}，recursive为True时包含嵌套蓝图书"""
+	
+	_ = []
+	for entry in book_dict.get('blueprint_book', {}).get('blueprints', []):
+		if 'blueprint' in entry:
+			_.append(entry)
+		elif 'blueprint_book' in entry and recursive:
+			_.extend(get_book_blueprint_entry_list(entry, recursive))
+	return _
+
+
+def encode_book_blueprints(
+		book_dict: dict, compression_level: int = CompressionLevelType.DEFAULT.value,
+		workers: int | None = None, recursive: bool = True) -> list:
+	"""将蓝图书中的每个蓝图并行地单独加密，返回 [(名称, 蓝图代码)]，顺序与get_book_blueprint_entry_list一致"""
+	
+	entry_list = get_book_blueprint_entry_list(book_dict, recursive)
+	blueprint_string_list = dict_list_to_blueprint_list(
+		[{'blueprint': x['blueprint']} for x in entry_list], compression_level, workers)
+	return [(x['blueprint'].get('label'), y) for x, y in zip(entry_list, blueprint_string_list)]
+
+
+def transform_book_blueprints(
+		book_dict: dict, function, workers: int | None = None, args: tuple = (), recursive: bool = True) -> dict:
+	"""
+	在进程池中对蓝图书中的每个蓝图调用function({'blueprint': 字典}, *args)，并将返回的蓝图字典就地写回
+	function必须是模块顶层函数，返回值的格式与参数相同
+	"""
+	
+	entry_list = get_book_blueprint_entry_list(book_dict, recursive)
+	result_list = map_blueprint_list(function, [{'blueprint': x['blueprint']} for x in entry_list], workers, args)
+	for entry, result in zip(entry_list, result_list):
+		entry['blueprint'] = result['blueprint']
+	return book_dict
+
+
+def _to_json_number(value: float) -> int | float:
+	"""整数值的坐标写回为int，保持蓝图紧凑"""
+	value = float(value)
+	return int(value) if value.is_integer() else value
+
+
+class EntityTable:
+	"""
+	列式实体表
+	将实体序号、名称id、坐标和朝向存为平行数组，用于对整张蓝图做批量几何变换，
+	安装了NumPy时每种变换都是一次向量化运算，否则回退到array逐个计算
+	"""
+	
+	def __init__(self, entities: list | None = None) -> None:
+		"""entities可以是Entity对象列表，也可以是原始实体字典列表"""
+		if entities is None:
+			entities = []
+		
+		self.entities = entities  # 行对应的实体，写回时按顺序更新
+		
+		entity_number_list = []
+		name_id_list = []
+		x_list = []
+		y_list = []
+		direction_list = []
+		for entity in entities:
+			if isinstance(entity, dict):
+				position = entity.get('position', {})
+				entity_number_list.append(entity.get('entity_number') or 0)
+				name = entity.get('name')
+				name_id_list.append(NO_NAME_ID if name is None else NAME_REGISTRY.get_id(name))
+				x_list.append(position.get('x', 0))
+				y_list.append(position.get('y', 0))
+				direction_list.append(entity.get('direction') or 0)
+			else:
+				entity_number_list.append(entity.entity_number or 0)
+				name_id_list.append(NO_NAME_ID if entity.name_id is None else entity.name_id)
+				x_list.append(entity.position_x)
+				y_list.append(entity.position_y)
+				direction_list.append(entity.direction or 0)
+		
+		self.numpy = numpy = get_numpy()  # 为None时各列使用array
+		if numpy is not None:
+			self.entity_number = numpy.array(entity_number_list, dtype=numpy.int32)
+			self.name_id = numpy.array(name_id_list, dtype=numpy.int32)
+			self.x = numpy.array(x_list, dtype=numpy.float64)
+			self.y = numpy.array(y_list, dtype=numpy.float64)
+			self.direction = numpy.array(direction_list, dtype=numpy.int32)
+		else:
+			self.entity_number = array.array('i', entity_number_list)
+			self.name_id = array.array('i', name_id_list)
+			self.x = array.array('d', x_list)
+			self.y = array.array('d', y_list)
+			self.direction = array.array('i', direction_list)
+	
+	@classmethod
+	def from_blueprint(cls, blueprint: 'Blueprint') -> 'EntityTable':
+		"""从蓝图对象构建，惰性蓝图中未对象化的实体直接读取原始字典"""
+		if blueprint.is_entities_loaded():
+			return cls(blueprint.entities)
+		return cls(blueprint._raw_entity_list)
+	
+	def __len__(self) -> int:
+		return len(self.entities)
+	
+	def replace_name(self, old_name: str, name: str) -> int:
+		"""将所有指定名称的实体改名，返回改名的数量"""
+		if old_name not in NAME_REGISTRY:
+			return 0
+		old_name_id = NAME_REGISTRY.get_id(old_name)
+		name_id = NAME_REGISTRY.get_id(name)
+		
+		if self.numpy is not None:
+			mask = self.name_id == old_name_id
+			self.name_id[mask] = name_id
+			return int(mask.sum())
+		
+		count = 0
+		for i, x in enumerate(self.name_id):
+			if x == old_name_id:
+				self.name_id[i] = name_id
+				count += 1
+		return count
+	
+	def write_back(self) -> None:
+		"""将坐标、朝向与名称写回对应的实体"""
+		for i, entity in enumerate(self.entities):
+			x = _to_json_number(self.x[i])
+			y = _to_json_number(self.y[i])
+			direction = int(self.direction[i])
+			name_id = int(self.name_id[i])
+			name = None if name_id == NO_NAME_ID else NAME_REGISTRY.get_name(name_id)
+			
+			if isinstance(entity, dict):
+				entity['position'] = {'x': x, 'y': y}
+				if name is not None:
+					entity['name'] = name
+				if direction:
+					entity['direction'] = direction
+				else:
+					entity.pop('direction', None)
+			else:
+				entity.position_x = x
+				entity.position_y = y
+				entity.name = name
+				entity.direction = direction or None
+	
+	def translate(self, dx: float = 0, dy: float = 0) -> None:
+		"""平移所有实体"""
+		if self.numpy is not None:
+			self.x += dx
+			self.y += dy
+		else:
+			self.x = array.array('d', [x + dx for x in self.x])
+			self.y = array.array('d', [y + dy for y in self.y])
+	
+	def rotate(self, quarter_turns: int = 1, center_x: float = 0, center_y: float = 0) -> None:
+		"""绕中心点顺时针旋转若干个90度，同时旋转坐标与朝向"""
+		quarter_turns %= 4
+		if not quarter_turns:
+			return
+		
+		# 异星工厂的y轴向下，顺时针旋转90度为 (x, y) -> (-y, x)
+		match quarter_turns:
+			case 1:
+				cos, sin = 0, 1
+			case 2:
+				cos, sin = -1, 0
+			case _:
+				cos, sin = 0, -1
+		
+		if self.numpy is not None:
+			dx = self.x - center_x
+			dy = self.y - center_y
+			self.x = center_x + dx * cos - dy * sin
+			self.y = center_y + dx * sin + dy * cos
+			self.direction = (self.direction + quarter_turns * 4) % 16
+		else:
+			xy_list = [(x - center_x, y - center_y) for x, y in zip(self.x, self.y)]
+			self.x = array.array('d', [center_x + dx * cos - dy * sin for dx, dy in xy_list])
+			self.y = array.array('d', [center_y + dx * sin + dy * cos for dx, dy in xy_list])
+			self.direction = array.array('i', [(d + quarter_turns * 4) % 16 for d in self.direction])
+	
+	def mirror(self, horizontal: bool = True, center_x: float = 0, center_y: float = 0) -> None:
+		"""
+		镜像所有实体
+		horizontal为True时左右翻转，否则上下翻转
+		"""
+		if horizontal:
+			# 左右翻转：x取反，东西朝向互换
+			if self.numpy is not None:
+				self.x = 2 * center_x - self.x
+				self.direction = (16 - self.direction) % 16
+			else:
+				self.x = array.array('d', [2 * center_x - x for x in self.x])
+				self.direction = array.array('i', [(16 - d) % 16 for d in self.direction])
+		else:
+			# 上下翻转：y取反，南北朝向互换
+			if self.numpy is not None:
+				self.y = 2 * center_y - self.y
+				self.direction = (24 - self.direction) % 16
+			else:
+				self.y = array.array('d', [2 * center_y - y for y in self.y])
+				self.direction = array.array('i', [(24 - d) % 16 for d in self.direction])
+	
+	def get_bounding_box(self) -> tuple | None:
+		"""获取所有实体中心点的包围盒 (min_x, min_y, max_x, max_y)，没有实体时返回None"""
+		if not len(self):
+			return None
+		if self.numpy is not None:
+			return float(self.x.min()), float(self.y.min()), float(self.x.max()), float(self.y.max())
+		return min(self.x), min(self.y), max(self.x), max(self.y)
+	
+	def get_center(self) -> tuple | None:
+		"""获取包围盒中心，可作为旋转与镜像的中心点"""
+		box = self.get_bounding_box()
+		if box is None:
+			return None
+		return (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
 
 
 if __name__ == '__main__':
-	with open('blueprint_cache.txt', 'r', encoding='utf-8') as f:
-		bp = f.read()
+	from pprint import pprint
+	import pyperclip
 	
-	bp_dict = blueprint_to_dict(bp)
+	with open('blueprint_cache.txt', 'r', encoding='utf-8') as f:
+		bp_dict = blueprint_stream_to_dict(f)
 	pprint(bp_dict)
 	
 	bp_object = Blueprint(bp_dict)  # 对象化
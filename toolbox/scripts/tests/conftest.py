@@ -0,0 +1,28 @@
+import glob
+import os
+import sys
+
+import pytest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.join(SCRIPTS_DIR, '..', '..')
+
+# 脚本都是平铺的模块，测试时从脚本目录导入
+sys.path.insert(0, SCRIPTS_DIR)
+
+
+def get_repo_blueprint_path_list() -> list:
+	"""获取仓库中所有蓝图文本文件的路径"""
+	_ = glob.glob(os.path.join(REPO_DIR, 'toolbox', 'blueprints', '*.txt'))
+	_ += glob.glob(os.path.join(REPO_DIR, 'toolbox', 'scripts', '*.txt'))
+	_ += glob.glob(os.path.join(REPO_DIR, '飞船', '*', '*.txt'))
+	return sorted(_)
+
+
+REPO_BLUEPRINT_PATH_LIST = get_repo_blueprint_path_list()
+
+
+@pytest.fixture(params=REPO_BLUEPRINT_PATH_LIST, ids=os.path.basename)
+def repo_blueprint_path(request) -> str:
+	"""依次返回仓库中每个蓝图文件的路径"""
+	return request.param
@@ -0,0 +1,56 @@
+import pytest
+from PIL import Image
+
+import my_factorio_funcs
+from my_factorio_cache import make_cache_key
+
+
+@pytest.fixture
+def empty_caches():
+	"""测试前后清空生成用的缓存，且不使用磁盘层"""
+	cache_list = [my_factorio_funcs.FRAME_COLOR_CACHE, my_factorio_funcs.BLUEPRINT_CACHE]
+	for cache in cache_list:
+		cache.set_disk_dir(None)
+		cache.clear()
+	yield
+	for cache in cache_list:
+		cache.clear()
+
+
+@pytest.fixture
+def animated_png_path(tmp_path) -> str:
+	"""三帧颜色各不相同的动态PNG"""
+	frame_list = [Image.new('RGB', (8, 8), color) for color in ((255, 0, 0), (0, 255, 0), (0, 0, 255))]
+	path = str(tmp_path / 'animated.png')
+	frame_list[0].save(path, save_all=True, append_images=frame_list[1:], duration=100, loop=0)
+	return path
+
+
+def test_frame_cache_keys_are_separate():
+	"""只解码第一帧与解码全部帧的帧颜色缓存键不能相同"""
+	assert make_cache_key('frames', 'first_frame', 'hash', 4, 4, 0, False) != make_cache_key(
+		'frames', 'all_frames', 'hash', 4, 4, 0, False)
+
+
+def test_static_then_dynamic_uses_all_frames(empty_caches, animated_png_path):
+	"""先生成静态图片后再生成同一图片的动态蓝图，结果应与缓存为空时直接生成的相同"""
+	my_factorio_funcs.generate_mini_static_image_blueprint(animated_png_path, 4, 4)
+	after_static_bp = my_factorio_funcs.generate_mini_dynamic_image_blueprint(animated_png_path, 4, 4)
+	
+	my_factorio_funcs.FRAME_COLOR_CACHE.clear()
+	my_factorio_funcs.BLUEPRINT_CACHE.clear()
+	fresh_bp = my_factorio_funcs.generate_mini_dynamic_image_blueprint(animated_png_path, 4, 4)
+	
+	assert after_static_bp == fresh_bp
+
+
+def test_dynamic_then_static_uses_first_frame(empty_caches, animated_png_path):
+	"""先生成动态蓝图后再生成同一图片的静态蓝图，结果应与缓存为空时直接生成的相同"""
+	my_factorio_funcs.generate_mini_dynamic_image_blueprint(animated_png_path, 4, 4)
+	after_dynamic_bp = my_factorio_funcs.generate_mini_static_image_blueprint(animated_png_path, 4, 4)
+	
+	my_factorio_funcs.FRAME_COLOR_CACHE.clear()
+	my_factorio_funcs.BLUEPRINT_CACHE.clear()
+	fresh_bp = my_factorio_funcs.generate_mini_static_image_blueprint(animated_png_path, 4, 4)
+	
+	assert after_dynamic_bp == fresh_bp
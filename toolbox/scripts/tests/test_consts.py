@@ -0,0 +1,59 @@
+from collections import Counter
+
+import my_factorio_consts
+from my_factorio_consts import ENTITY_SIZE_DICT, MAX_PIXEL_COUNT, SIGNAL_COUNT
+from my_factorio_lib import Blueprint, blueprint_stream_to_dict, get_book_blueprint_entry_list, get_entity_size
+
+
+def get_blueprint_object_list(path: str) -> list:
+	"""读取蓝图文件，返回其中所有蓝图的对象，蓝图书会递归展开"""
+	with open(path, 'r', encoding='utf-8') as f:
+		bp_dict = blueprint_stream_to_dict(f)
+	if 'blueprint' in bp_dict:
+		blueprint_list = [bp_dict['blueprint']]
+	else:
+		blueprint_list = [x['blueprint'] for x in get_book_blueprint_entry_list(bp_dict)]
+	return [Blueprint({'blueprint': x}) for x in blueprint_list]
+
+
+def test_signal_count():
+	"""常量SIGNAL_COUNT应与全信号字典的条目数一致，像素上限由它计算"""
+	assert len(my_factorio_consts.ALL_SIGNAL_DICT) == SIGNAL_COUNT
+	assert len(my_factorio_consts.ALL_PIXEL_SIGNAL_LIST) == MAX_PIXEL_COUNT
+
+
+def test_entity_size_dict_lists_every_entity(repo_blueprint_path):
+	"""仓库蓝图中出现的实体都应列在实体占地尺寸字典中"""
+	missing_set = set()
+	for bp_object in get_blueprint_object_list(repo_blueprint_path):
+		missing_set |= {x.name for x in bp_object.entities} - ENTITY_SIZE_DICT.keys()
+	assert not missing_set
+
+
+def test_entity_size_dict_matches_positions(repo_blueprint_path):
+	"""
+	整数尺寸的实体坐标应与尺寸的奇偶一致：奇数边长的中心在半格上，偶数在整格上
+	整张蓝图可以整体偏移，因此以蓝图中最常见的偏移为准
+	"""
+	problem_list = []
+	for bp_object in get_blueprint_object_list(repo_blueprint_path):
+		offset_list = []  # (实体, 该实体左上角相对整格的偏移)
+		for entity in bp_object.entities:
+			width, height = get_entity_size(entity)
+			if isinstance(width, int) and isinstance(height, int):
+				offset_list.append((entity, ((entity.position_x - width / 2) % 1, (entity.position_y - height / 2) % 1)))
+		
+		if offset_list:
+			grid_offset = Counter(x[1] for x in offset_list).most_common(1)[0][0]
+			problem_list += [(x.name, get_entity_size(x)) for x, offset in offset_list if offset != grid_offset]
+	
+	assert not problem_list
+
+
+def test_entity_size_dict_has_no_overlaps(repo_blueprint_path):
+	"""游戏中放置的蓝图不应有占地重叠"""
+	overlap_list = []
+	for bp_object in get_blueprint_object_list(repo_blueprint_path):
+		overlap_list += [
+			tuple(sorted([x.name, y.name])) for x, y in bp_object.get_spatial_index().find_overlaps()]
+	assert not overlap_list
@@ -0,0 +1,44 @@
+import pytest
+
+from my_factorio_lib import DECODE_CACHE, blueprint_to_dict, blueprint_to_dict_cached, dict_to_blueprint
+
+
+@pytest.fixture
+def empty_decode_cache(tmp_path):
+	"""测试前后清空解码缓存，并在临时目录中启用磁盘层"""
+	DECODE_CACHE.clear()
+	DECODE_CACHE.set_disk_dir(str(tmp_path))
+	yield
+	DECODE_CACHE.clear()
+	DECODE_CACHE.set_disk_dir(None)
+
+
+def test_cached_decode_matches_decode(empty_decode_cache, repo_blueprint_path):
+	"""未命中、内存层命中与磁盘层命中的结果都应与直接解码相同"""
+	with open(repo_blueprint_path, 'r', encoding='utf-8') as f:
+		bp = f.read()
+	expected_dict = blueprint_to_dict(bp.strip())
+	
+	assert blueprint_to_dict_cached(bp) == expected_dict
+	assert blueprint_to_dict_cached(bp) == expected_dict
+	DECODE_CACHE.memory_dict.clear()
+	assert blueprint_to_dict_cached(bp) == expected_dict
+
+
+def test_cached_decode_returns_independent_copies(empty_decode_cache):
+	"""修改一次返回结果中的实体、线缆或子蓝图，不应影响之后命中缓存的结果"""
+	bp_dict = {'blueprint_book': {
+		'item': 'blueprint-book',
+		'blueprints': [{'index': 0, 'blueprint': {
+			'item': 'blueprint',
+			'entities': [{'entity_number': 1, 'name': 'small-lamp', 'position': {'x': 0, 'y': 0}}],
+			'wires': [[1, 1, 1, 2]]}}]}}
+	bp = dict_to_blueprint(bp_dict)
+	
+	first_dict = blueprint_to_dict_cached(bp)
+	child = first_dict['blueprint_book']['blueprints'][0]['blueprint']
+	child['entities'][0]['position']['x'] = 10
+	child['wires'].clear()
+	first_dict['blueprint_book']['blueprints'].append({'index': 1})
+	
+	assert blueprint_to_dict_cached(bp) == bp_dict
@@ -0,0 +1,61 @@
+import pytest
+
+from my_factorio_funcs import emit_screen_blueprint, get_screen_blueprint_dict
+from my_factorio_lib import (
+	Blueprint, BlueprintEmitter, ConstantCombinator, Entity, Icon, dict_to_blueprint,
+	iter_auto_filter_control_behavior_json)
+
+
+@pytest.mark.parametrize('width, height', [(1, 1), (3, 2), (10, 10), (54, 54), (5, 587)])
+@pytest.mark.parametrize('wire_type_list', [[1], [2], [1, 2], []])
+def test_screen_emitter_matches_dict(width, height, wire_type_list):
+	"""直接写入片段生成的显示屏应与先构建字典再编码的结果逐字节相同"""
+	assert emit_screen_blueprint(width, height, wire_type_list) == dict_to_blueprint(
+		get_screen_blueprint_dict(width, height, wire_type_list))
+
+
+def test_screen_emitter_matches_dict_when_not_always_on():
+	"""电灯不常亮时两种方式的结果也应逐字节相同"""
+	assert emit_screen_blueprint(4, 3, [1, 2], always_on=False) == dict_to_blueprint(
+		get_screen_blueprint_dict(4, 3, [1, 2], always_on=False))
+
+
+@pytest.mark.parametrize('count', [0, 1, 1000, 1001, 2935])
+def test_auto_filter_fragments_match_dict(count):
+	"""常量运算器控制行为的片段应与逐个add_filter_auto后的字典编码相同，包括跨越1000个信号的分段"""
+	count_list = [i * 5717 % 0x1000000 for i in range(count)]
+	
+	dict_bp_object = Blueprint()
+	cc_object = ConstantCombinator()
+	for x in count_list:
+		cc_object.add_filter_auto(x)
+	dict_bp_object.add_entity(cc_object)
+	
+	emitter_bp_object = Blueprint()
+	cc_object = ConstantCombinator()
+	emitter_bp_object.add_entity(cc_object)
+	emitter = BlueprintEmitter()
+	emitter_bp_object.write_to_emitter(
+		emitter, {cc_object.entity_number: iter_auto_filter_control_behavior_json(count_list)})
+	
+	assert emitter.finish() == dict_to_blueprint(dict_bp_object.get_dict())
+
+
+def test_blueprint_emitter_keeps_header_fields():
+	"""名称、简介、图标、线缆与未建模的键都应同时出现在两种方式的结果中"""
+	bp_object = Blueprint({'blueprint': {
+		'label': 'emitter-label',
+		'description': 'emitter-description',
+		'snap-to-grid': {'x': 2, 'y': 2},
+		'tiles': [{'name': 'concrete', 'position': {'x': 0, 'y': 0}}],
+	}})
+	bp_object.icons.append(Icon({'index': 1, 'signal': {'name': 'small-lamp'}}))
+	lamp_list = [Entity({'name': 'small-lamp', 'position': {'x': i, 'y': 0}}) for i in range(3)]
+	for lamp in lamp_list:
+		bp_object.add_entity(lamp)
+	bp_object.connect_entity(lamp_list[0], lamp_list[1], wire_type='rg')
+	bp_object.connect_entity(lamp_list[1], lamp_list[2], wire_type='g')
+	
+	emitter = BlueprintEmitter()
+	bp_object.write_to_emitter(emitter)
+	assert emitter.finish() == dict_to_blueprint(bp_object.get_dict())
@@ -0,0 +1,47 @@
+import base64
+import json
+import zlib
+
+from my_factorio_lib import Icon, blueprint_to_dict, json_encode, patch_blueprint_metadata
+
+
+def decompress_blueprint(blueprint_string: str) -> bytes:
+	"""将蓝图字符串还原为解压后的JSON字节串"""
+	return zlib.decompress(base64.b64decode(blueprint_string.strip()[1:]))
+
+
+def test_patch_metadata_fidelity(repo_blueprint_path):
+	"""
+	改写元数据后，解压得到的JSON字节串应与「原蓝图只替换名称、简介和图标」后的规范编码逐字节相同
+	原蓝图由游戏导出，键顺序与分隔符和规范编码不同，所以比较的是规范编码而不是原始字节
+	"""
+	with open(repo_blueprint_path, 'r', encoding='utf-8') as f:
+		bp = f.read()
+	
+	icon_list = [Icon({'index': 1, 'signal': {'name': 'constant-combinator', 'type': 'item'}})]
+	patched_bp = patch_blueprint_metadata(
+		bp, label='fidelity-label', description='fidelity-description', icons=icon_list)
+	
+	expected_dict = blueprint_to_dict(bp)
+	expected_blueprint = expected_dict.get('blueprint') or expected_dict['blueprint_book']
+	expected_blueprint['label'] = 'fidelity-label'
+	expected_blueprint['description'] = 'fidelity-description'
+	expected_blueprint['icons'] = [x.get_dict() for x in icon_list]
+	
+	assert decompress_blueprint(patched_bp) == json_encode(expected_dict)
+
+
+def test_patch_metadata_keeps_other_keys(repo_blueprint_path):
+	"""用标准库独立解码原蓝图与改写后的蓝图，除名称、简介和图标外的数据应完全相同"""
+	with open(repo_blueprint_path, 'r', encoding='utf-8') as f:
+		bp = f.read()
+	
+	original_dict = json.loads(decompress_blueprint(bp))
+	patched_dict = json.loads(decompress_blueprint(patch_blueprint_metadata(bp, label='fidelity-label')))
+	
+	assert original_dict.keys() == patched_dict.keys()
+	for top_key in original_dict:
+		original_blueprint = original_dict[top_key]
+		patched_blueprint = patched_dict[top_key]
+		for key in original_blueprint.keys() - {'label'}:
+			assert patched_blueprint[key] == original_blueprint[key], key
@@ -0,0 +1,101 @@
+import pytest
+
+from my_factorio_consts import WireType
+from my_factorio_lib import Blueprint, WireGraph
+
+RED_INPUT = WireType.RED_INPUT.value
+GREEN_INPUT = WireType.GREEN_INPUT.value
+RED_OUTPUT = WireType.RED_OUTPUT.value
+
+
+def test_duplicate_wires_are_kept_once():
+	"""原始列表中重复的线缆与两端顺序颠倒的同一条线缆只保留第一条"""
+	wire_list = [[1, RED_INPUT, 2, RED_INPUT], [2, RED_INPUT, 1, RED_INPUT], [1, RED_INPUT, 2, RED_INPUT]]
+	wire_graph = WireGraph(wire_list)
+	
+	assert len(wire_graph) == 1
+	assert wire_graph.get_wire_list() == [[1, RED_INPUT, 2, RED_INPUT]]
+	assert len(wire_list) == 3  # 不修改传入的列表
+
+
+def test_add_wire_rejects_duplicate():
+	"""已存在的线缆不会重复添加，同一对端点的红线和绿线是两条不同的线缆"""
+	wire_graph = WireGraph()
+	
+	assert wire_graph.add_wire(1, RED_INPUT, 2, RED_OUTPUT)
+	assert not wire_graph.add_wire(2, RED_OUTPUT, 1, RED_INPUT)
+	assert wire_graph.add_wire(1, GREEN_INPUT, 2, WireType.GREEN_OUTPUT.value)
+	assert wire_graph.add_wires([[1, RED_INPUT, 2, RED_OUTPUT], [2, RED_INPUT, 3, RED_INPUT]]) == 1
+	assert len(wire_graph) == 3
+
+
+def test_remove_wire_then_add_again():
+	"""删除后邻接表与网络都应更新，之后可以再次添加同一条线缆"""
+	wire_graph = WireGraph([[1, RED_INPUT, 2, RED_INPUT], [2, RED_INPUT, 3, RED_INPUT]])
+	assert wire_graph.is_connected(1, RED_INPUT, 3, RED_INPUT)
+	
+	assert wire_graph.remove_wire(3, RED_INPUT, 2, RED_INPUT)
+	assert not wire_graph.remove_wire(3, RED_INPUT, 2, RED_INPUT)
+	assert not wire_graph.is_connected(1, RED_INPUT, 3, RED_INPUT)
+	assert wire_graph.get_neighbors(3) == set()
+	
+	assert wire_graph.add_wire(2, RED_INPUT, 3, RED_INPUT)
+	assert wire_graph.is_connected(1, RED_INPUT, 3, RED_INPUT)
+
+
+def test_remove_entity():
+	"""删除实体时与其相连的所有线缆都被删除"""
+	wire_graph = WireGraph([
+		[1, RED_INPUT, 2, RED_INPUT], [2, GREEN_INPUT, 3, GREEN_INPUT], [1, RED_INPUT, 3, RED_INPUT]])
+	
+	assert wire_graph.remove_entity(2) == 2
+	assert wire_graph.get_wire_list() == [[1, RED_INPUT, 3, RED_INPUT]]
+
+
+def test_mismatched_colors_raise():
+	"""红线连接点与绿线连接点之间不能连线"""
+	with pytest.raises(ValueError):
+		WireGraph().add_wire(1, RED_INPUT, 2, GREEN_INPUT)
+
+
+def test_blueprint_connect_entity_dedupes():
+	"""蓝图重复连接同一对实体时只保留一条线缆，原始线缆列表不被修改"""
+	raw_wire_list = [[1, RED_INPUT, 2, RED_INPUT], [2, RED_INPUT, 1, RED_INPUT]]
+	bp_object = Blueprint({'blueprint': {
+		'entities': [
+			{'entity_number': 1, 'name': 'small-lamp', 'position': {'x': 0, 'y': 0}},
+			{'entity_number': 2, 'name': 'small-lamp', 'position': {'x': 1, 'y': 0}}],
+		'wires': raw_wire_list}})
+	first_lamp, second_lamp = bp_object.entities
+	
+	bp_object.connect_entity(first_lamp, second_lamp, wire_type='r')
+	bp_object.connect_entity(second_lamp, first_lamp, wire_type='rg')
+	
+	assert bp_object.get_wire_list() == [[1, RED_INPUT, 2, RED_INPUT], [2, GREEN_INPUT, 1, GREEN_INPUT]]
+	assert bp_object.get_dict()['blueprint']['wires'] == bp_object.get_wire_list()
+	assert len(raw_wire_list) == 2
+
+
+def test_copper_wires_are_not_circuit_networks():
+	"""铜线连接点之间的线缆只登记邻接关系，不属于红绿电路网络，也不能与信号线连接点相连"""
+	wire_graph = WireGraph([[1, 5, 2, 5], [2, 6, 3, 5]])
+	
+	assert len(wire_graph) == 2
+	assert wire_graph.get_neighbors(2) == {(1, 5), (3, 5)}
+	assert wire_graph.get_networks('red') == []
+	assert not wire_graph.is_connected(1, 5, 2, 5)
+	with pytest.raises(ValueError):
+		wire_graph.add_wire(1, RED_INPUT, 2, 5)
+	
+	assert wire_graph.remove_entity(2) == 2
+	assert len(wire_graph) == 0
+
+
+def test_set_wire_list_replaces_graph():
+	"""整体替换线缆数据后，图由新列表重建"""
+	bp_object = Blueprint({'blueprint': {'wires': [[1, RED_INPUT, 2, RED_INPUT]]}})
+	bp_object.get_wire_graph().add_wire(2, RED_INPUT, 3, RED_INPUT)
+	
+	bp_object.set_wire_list([[4, GREEN_INPUT, 5, GREEN_INPUT]])
+	assert bp_object.get_wire_list() == [[4, GREEN_INPUT, 5, GREEN_INPUT]]
+	assert len(bp_object.get_wire_graph()) == 1
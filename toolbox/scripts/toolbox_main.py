@@ -1,15 +1,16 @@
 import sys
 
-import winsound
-
-from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox, QFileDialog, QDialog
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+	QApplication, QMainWindow, QMessageBox, QFileDialog, QDialog, QProgressBar, QPushButton, QPlainTextEdit)
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QEvent, pyqtSignal
 from PyQt5.QtGui import QFont, QPixmap, QFontMetrics, QMovie
 
 from toolbox_ui.ui_main import Ui_MainWindow
 from toolbox_ui.dialog_text_edit import Ui_DialogTextEdit
-from my_factorio_funcs import *
-from my_factorio_lib import Blueprint
+from my_factorio_consts import MAX_PIXEL_COUNT
+from my_factorio_lib import (
+	Blueprint, BlueprintBook, GenerationCancelled, DECODE_CACHE, DECODE_CACHE_DIR,
+	blueprint_to_dict_cached, dict_to_blueprint, patch_blueprint_dict_metadata)
 
 
 class DialogTextEdit(QDialog):
@@ -33,6 +34,132 @@ class DialogTextEdit(QDialog):
 		super().close()
 
 
+class BlueprintTextHolder:
+	"""
+	在控件之外持有完整的蓝图代码
+	几十KB的单行文本放进QPlainTextEdit时排版很慢，因此控件中只显示截断的预览与大小统计，
+	复制与保存都直接使用持有的文本；未持有文本时退回到控件中用户粘贴的内容
+	"""
+	
+	PREVIEW_LENGTH = 300  # 预览显示的字符数
+	
+	def __init__(self, text_edit: QPlainTextEdit) -> None:
+		self.text_edit = text_edit
+		self.text = ''  # 持有的完整蓝图代码
+		self.is_read_only = text_edit.isReadOnly()  # 控件原本是否只读，清空后恢复
+	
+	def set_text(self, text: str, source: str = '') -> None:
+		"""持有text，控件中显示预览；source为文本来源，如文件路径"""
+		self.text = text
+		if not text:
+			self.clear()
+			return
+		
+		preview = text[:self.PREVIEW_LENGTH]
+		if len(text) > self.PREVIEW_LENGTH:
+			preview += '……'
+		stats = '字符数：{}（{:.1f}KB）'.format(len(text), len(text.encode('utf-8')) / 1024)
+		if source:
+			stats += '\n来源：{}'.format(source)
+		
+		self.text_edit.setReadOnly(True)  # 预览不可编辑，避免与持有的文本不一致
+		self.text_edit.setPlainText('{}\n\n{}'.format(preview, stats))
+	
+	def get_text(self) -> str:
+		"""获取完整蓝图代码"""
+		if self.text:
+			return self.text
+		return self.text_edit.toPlainText()
+	
+	def clear(self) -> None:
+		"""清空持有的文本与控件"""
+		self.text = ''
+		self.text_edit.setReadOnly(self.is_read_only)
+		self.text_edit.setPlainText('')
+	
+	def load_file(self, file_path: str) -> None:
+		"""从文件读取蓝图代码"""
+		with open(file_path, 'r', encoding='utf-8') as f:
+			self.set_text(f.read().strip(), file_path)
+	
+	def save_file(self, file_path: str) -> None:
+		"""将蓝图代码保存到文件"""
+		with open(file_path, 'w', encoding='utf-8') as f:
+			f.write(self.get_text())
+
+
+class WorkerSignals(QObject):
+	"""后台任务的信号，由工作线程发出，在界面线程中处理"""
+	
+	progress = pyqtSignal(int, int)  # 已完成步数, 总步数
+	finished = pyqtSignal(object)  # 任务结果
+	failed = pyqtSignal(str)  # 错误信息
+
+
+class Worker(QRunnable):
+	"""
+	在线程池中执行生成函数的后台任务
+	生成函数需接受progress_callback参数；取消后下一次报告进度时抛出GenerationCancelled中止生成
+	"""
+	
+	def __init__(self, function, *args, **kwargs):
+		super().__init__()  # 保持autoDelete，由线程池持有任务直到执行完毕，主窗口只通过Python属性取消
+		
+		self.function = function
+		self.args = args
+		self.kwargs = kwargs
+		self.signals = WorkerSignals()
+		self.is_cancelled = False
+	
+	def cancel(self) -> None:
+		self.is_cancelled = True
+	
+	def on_progress(self, done: int, total: int) -> None:
+		if self.is_cancelled:
+			raise GenerationCancelled
+		self.signals.progress.emit(done, total)
+	
+	def run(self) -> None:
+		try:
+			result = self.function(*self.args, progress_callback=self.on_progress, **self.kwargs)
+		except GenerationCancelled:
+			return
+		except Exception as e:
+			if not self.is_cancelled:
+				self.signals.failed.emit(str(e))
+			return
+		
+		if not self.is_cancelled:
+			self.signals.finished.emit(result)
+
+
+def call_funcs(function_name: str, *args, **kwargs):
+	"""首次调用时才导入my_factorio_funcs（依赖PIL与全像素信号表，导入较慢），再调用其中的函数"""
+	import my_factorio_funcs
+	
+	return getattr(my_factorio_funcs, function_name)(*args, **kwargs)
+
+
+def load_blueprint(blueprint_string: str, progress_callback=None) -> tuple:
+	"""解码蓝图或蓝图书代码并对象化，返回 (原始字典, 对象)，在后台线程中调用"""
+	
+	bp_dict = blueprint_to_dict_cached(blueprint_string)
+	if progress_callback:
+		progress_callback(1, 2)
+	
+	# 判断是否是合法的蓝图或蓝图书代码
+	if 'blueprint' in bp_dict:
+		bp_object = Blueprint(bp_dict, lazy=True)  # 只编辑元数据，无需对象化实体
+	elif 'blueprint_book' in bp_dict:
+		bp_object = BlueprintBook(bp_dict)  # 子蓝图在访问前保持原始字典
+	else:
+		raise ValueError('代码中未查找到蓝图或蓝图书字典')
+	
+	if progress_callback:
+		progress_callback(2, 2)
+	return bp_dict, bp_object
+
+
 class MainWindow(QMainWindow):
 	def __init__(self):
 		__version__ = '0.0.2'
@@ -54,6 +181,15 @@ class MainWindow(QMainWindow):
 		self.mini_image_file_path: str = ''  # 静态小图片生成功能中加载的图片地址
 		self.mini_image_dynamic_file_path: str = ''  # 动态小图片生成功能中加载的图片地址
 		self.__blueprint_loaded_bp: Blueprint | None = None  # 蓝图编辑功能中加载的蓝图对象
+		self.blueprint_loaded_dict: dict | None = None  # 蓝图编辑功能中加载的原始蓝图字典
+		
+		self.current_worker: Worker | None = None  # 正在执行的后台任务，新任务会取代它
+		
+		# 启用解码缓存的磁盘层，重新分析打开过的蓝图时跳过解码
+		DECODE_CACHE.set_disk_dir(DECODE_CACHE_DIR, 64 * 1024 * 1024)
+		
+		self.init_status_bar()  # 初始化进度条
+		self.init_file_controls()  # 初始化文件读写控件
 	
 	def set_additional_css(self) -> None:
 		"""设置额外的css"""
@@ -67,6 +203,83 @@ class MainWindow(QMainWindow):
 		
 		self.setStyleSheet(self.styleSheet() + additional_css)
 	
+	def init_status_bar(self) -> None:
+		"""在状态栏中添加后台任务的进度条与取消按钮"""
+		self.progress_bar = QProgressBar()
+		self.progress_bar.setValue(0)
+		self.pushButton_job_cancel = QPushButton('取消')
+		self.pushButton_job_cancel.setEnabled(False)
+		self.pushButton_job_cancel.clicked.connect(self.on_job_cancel_clicked)
+		
+		self.statusBar().addPermanentWidget(self.progress_bar, 1)
+		self.statusBar().addPermanentWidget(self.pushButton_job_cancel)
+	
+	def init_file_controls(self) -> None:
+		"""添加保存与加载文件的按钮，输入框支持拖入蓝图文件，蓝图代码保存在控件之外"""
+		self.mini_screen_output = BlueprintTextHolder(self.ui.plainTextEdit_mini_screen_output)
+		self.mini_image_output = BlueprintTextHolder(self.ui.plainTextEdit_mini_image_output)
+		self.mini_image_dynamic_output = BlueprintTextHolder(self.ui.plainTextEdit_mini_image_dynamic_output)
+		self.blueprint_input = BlueprintTextHolder(self.ui.plainTextEdit_blueprint_input)
+		
+		# 生成结果的保存按钮，放在复制按钮下方
+		for holder, copy_button, layout in (
+				(self.mini_screen_output, self.ui.pushButton_mini_screen_copy, self.ui.verticalLayout_8),
+				(self.mini_image_output, self.ui.pushButton_mini_image_copy, self.ui.verticalLayout_10),
+				(self.mini_image_dynamic_output, self.ui.pushButton_mini_image_dynamic_copy, self.ui.verticalLayout_25)):
+			save_button = QPushButton('保存到文件')
+			save_button.setFont(copy_button.font())
+			save_button.clicked.connect(lambda _, x=holder: self.on_save_file_clicked(x))
+			layout.addWidget(save_button)
+		
+		# 蓝图输入的加载按钮，放在清空与分析按钮之间
+		self.pushButton_blueprint_load = QPushButton('从文件加载')
+		self.pushButton_blueprint_load.setFont(self.ui.pushButton_blueprint_clear.font())
+		self.pushButton_blueprint_load.clicked.connect(self.on_blueprint_load_clicked)
+		self.ui.horizontalLayout_3.insertWidget(1, self.pushButton_blueprint_load)
+		
+		# 拖放事件发给QPlainTextEdit的viewport
+		self.ui.plainTextEdit_blueprint_input.viewport().installEventFilter(self)
+	
+	def eventFilter(self, obj, event) -> bool:
+		"""处理拖入蓝图输入框的文件"""
+		if obj is self.ui.plainTextEdit_blueprint_input.viewport():
+			if event.type() in (QEvent.DragEnter, QEvent.DragMove) and event.mimeData().hasUrls():
+				event.acceptProposedAction()
+				return True
+			if event.type() == QEvent.Drop and event.mimeData().hasUrls():
+				file_path_list = [x.toLocalFile() for x in event.mimeData().urls() if x.isLocalFile()]
+				if file_path_list:
+					self.load_blueprint_file(file_path_list[0])
+				event.acceptProposedAction()
+				return True
+		return super().eventFilter(obj, event)
+	
+	def on_save_file_clicked(self, holder: BlueprintTextHolder) -> None:
+		"""保存到文件按钮"""
+		if not holder.get_text():
+			QMessageBox.critical(self, '错误', '尚未生成蓝图', QMessageBox.Ok)
+			return
+		
+		file_path, _ = QFileDialog.getSaveFileName(self, '保存蓝图', '', 'Text Files (*.txt)')
+		if file_path:
+			try:
+				holder.save_file(file_path)
+			except OSError as e:
+				QMessageBox.critical(self, '错误', str(e), QMessageBox.Ok)
+	
+	def on_blueprint_load_clicked(self) -> None:
+		"""从文件加载按钮"""
+		file_path, _ = QFileDialog.getOpenFileName(self, '选择蓝图文件', '', 'Text Files (*.txt);;All Files (*)')
+		if file_path:
+			self.load_blueprint_file(file_path)
+	
+	def load_blueprint_file(self, file_path: str) -> None:
+		"""将蓝图文件读入输入框的缓冲区"""
+		try:
+			self.blueprint_input.load_file(file_path)
+		except (OSError, UnicodeDecodeError) as e:
+			QMessageBox.critical(self, '错误', str(e), QMessageBox.Ok)
+	
 	def init_signals(self) -> None:
 		"""初始化信号"""
 		# 显示屏
@@ -87,6 +300,67 @@ class MainWindow(QMainWindow):
 		self.ui.pushButton_blueprint_description_edit.clicked.connect(self.on_blueprint_description_edit_clicked)
 		self.ui.pushButton_blueprint_copy.clicked.connect(self.on_blueprint_copy_clicked)
 	
+	"""后台任务相关"""
+	
+	def start_job(self, on_finished, function, *args, **kwargs) -> None:
+		"""在线程池中执行function，完成后在界面线程中调用on_finished(结果)；正在执行的任务会被取消"""
+		
+		if self.current_worker:
+			self.current_worker.cancel()
+		
+		worker = Worker(function, *args, **kwargs)
+		worker.signals.progress.connect(lambda done, total: self.on_job_progress(worker, done, total))
+		worker.signals.finished.connect(lambda result: self.on_job_finished(worker, on_finished, result))
+		worker.signals.failed.connect(lambda message: self.on_job_failed(worker, message))
+		self.current_worker = worker
+		
+		self.progress_bar.setMaximum(0)  # 尚未报告总步数时显示为忙碌
+		self.pushButton_job_cancel.setEnabled(True)
+		QThreadPool.globalInstance().start(worker)
+	
+	def stop_job(self) -> None:
+		"""清除当前任务并重置进度条"""
+		self.current_worker = None
+		self.progress_bar.setMaximum(100)
+		self.progress_bar.setValue(0)
+		self.pushButton_job_cancel.setEnabled(False)
+	
+	def on_job_progress(self, worker: Worker, done: int, total: int) -> None:
+		"""后台任务报告进度时触发，已被取代的任务不更新进度条"""
+		if worker is not self.current_worker:
+			return
+		self.progress_bar.setMaximum(total)
+		self.progress_bar.setValue(done)
+	
+	def on_job_finished(self, worker: Worker, on_finished, result) -> None:
+		"""后台任务完成时触发"""
+		if worker is not self.current_worker:
+			return
+		self.stop_job()
+		on_finished(result)
+	
+	def on_job_failed(self, worker: Worker, message: str) -> None:
+		"""后台任务出错时触发"""
+		if worker is not self.current_worker:
+			return
+		self.stop_job()
+		QMessageBox.critical(self, '错误', message, QMessageBox.Ok)
+	
+	def on_job_cancel_clicked(self) -> None:
+		"""取消按钮"""
+		if self.current_worker:
+			self.current_worker.cancel()
+		self.stop_job()
+	
+	def copy_text(self, text: str, beep: bool = True) -> None:
+		"""复制文本到剪贴板，pyperclip与winsound在首次复制时才导入"""
+		import pyperclip
+		import winsound
+		
+		pyperclip.copy(text)
+		if beep:
+			winsound.MessageBeep()
+	
 	"""显示屏生成相关"""
 	
 	def on_mini_screen_generate_clicked(self) -> None:
@@ -105,20 +379,19 @@ class MainWindow(QMainWindow):
 		if self.ui.checkBox_mini_screen_green_wire.checkState():
 			wires_type_list.append(2)
 		
-		bp = generate_screen_blueprint(
+		self.start_job(
+			self.mini_screen_output.set_text,
+			call_funcs, 'generate_screen_blueprint',
 			self.ui.spinBox_mini_screen_width.value(),
 			self.ui.spinBox_mini_screen_height.value(),
 			wires_type_list,
 			bool(self.ui.checkBox_mini_screen_always_on.checkState())
 		)
-		
-		self.ui.plainTextEdit_mini_screen_output.setPlainText(bp)
 	
 	def on_mini_screen_copy_clicked(self) -> None:
 		"""复制显示屏蓝图按钮按下时触发"""
 		
-		pyperclip.copy(self.ui.plainTextEdit_mini_screen_output.toPlainText())
-		winsound.MessageBeep()
+		self.copy_text(self.mini_screen_output.get_text())
 	
 	"""静态小图片蓝图生成相关"""
 	
@@ -142,23 +415,33 @@ class MainWindow(QMainWindow):
 			return
 		
 		pix_count = self.ui.spinBox_mini_image_width.value() * self.ui.spinBox_mini_image_height.value()
-		if pix_count <= 0 or pix_count > 2935:
-			QMessageBox.critical(self, "错误", "请确保像素数量在1~2935之间", QMessageBox.Ok)
+		if pix_count <= 0:
+			QMessageBox.critical(self, "错误", "请确保像素数量大于0", QMessageBox.Ok)
 			return
 		
-		self.ui.plainTextEdit_mini_image_output.setPlainText(
-			generate_mini_static_image_blueprint(
+		# 超过单个常量运算器的信号数量时，切分为多块常量运算器与显示屏
+		if pix_count > MAX_PIXEL_COUNT:
+			self.start_job(
+				self.mini_image_output.set_text,
+				call_funcs, 'generate_tiled_image_blueprint',
 				self.mini_image_file_path,
 				self.ui.spinBox_mini_image_width.value(),
 				self.ui.spinBox_mini_image_height.value()
 			)
+			return
+		
+		self.start_job(
+			self.mini_image_output.set_text,
+			call_funcs, 'generate_mini_static_image_blueprint',
+			self.mini_image_file_path,
+			self.ui.spinBox_mini_image_width.value(),
+			self.ui.spinBox_mini_image_height.value()
 		)
 	
 	def on_mini_image_copy_clicked(self) -> None:
 		"""复制小静态图片蓝图按钮按下时触发"""
 		
-		pyperclip.copy(self.ui.plainTextEdit_mini_image_output.toPlainText())
-		winsound.MessageBeep()
+		self.copy_text(self.mini_image_output.get_text())
 	
 	"""动态小图片蓝图生成相关"""
 	
@@ -177,7 +460,7 @@ class MainWindow(QMainWindow):
 			movie.start()
 			
 			# 同步帧间间隔到ui
-			self.ui.spinBox_mini_image_dynamic_duration.setValue(get_gif_duration(file_path))
+			self.ui.spinBox_mini_image_dynamic_duration.setValue(call_funcs('get_gif_duration', file_path))
 	
 	def on_mini_image_dynamic_generate_clicked(self) -> None:
 		"""生成动态小图片蓝图按钮按下时触发"""
@@ -191,20 +474,19 @@ class MainWindow(QMainWindow):
 			QMessageBox.critical(self, "错误", "请确保像素数量在1~2935之间", QMessageBox.Ok)
 			return
 		
-		self.ui.plainTextEdit_mini_image_dynamic_output.setPlainText(
-			generate_mini_dynamic_image_blueprint(
-				self.mini_image_dynamic_file_path,
-				self.ui.spinBox_mini_image_dynamic_width.value(),
-				self.ui.spinBox_mini_image_dynamic_height.value(),
-				self.ui.spinBox_mini_image_dynamic_duration.value()
-			)
+		self.start_job(
+			self.mini_image_dynamic_output.set_text,
+			call_funcs, 'generate_mini_dynamic_image_blueprint',
+			self.mini_image_dynamic_file_path,
+			self.ui.spinBox_mini_image_dynamic_width.value(),
+			self.ui.spinBox_mini_image_dynamic_height.value(),
+			self.ui.spinBox_mini_image_dynamic_duration.value()
 		)
 	
 	def on_mini_image_dynamic_copy_clicked(self) -> None:
 		"""复制小动态图片按钮按下时触发"""
 		
-		pyperclip.copy(self.ui.plainTextEdit_mini_image_dynamic_output.toPlainText())
-		winsound.MessageBeep()
+		self.copy_text(self.mini_image_dynamic_output.get_text())
 	
 	"""蓝图编辑功能相关"""
 	
@@ -232,29 +514,17 @@ class MainWindow(QMainWindow):
 	def on_blueprint_clear_clicked(self) -> None:
 		"""清空按钮"""
 		
-		self.ui.plainTextEdit_blueprint_input.setPlainText('')
+		self.blueprint_input.clear()
 	
 	def on_blueprint_analyze_clicked(self) -> None:
-		"""分析按钮"""
+		"""分析按钮，在后台解码并对象化"""
 		
-		# 尝试将代码转换为字典
-		try:
-			bp_dict = blueprint_to_dict(self.ui.plainTextEdit_blueprint_input.toPlainText())
-		except Exception as e:
-			QMessageBox.critical(self, '错误', str(e), QMessageBox.Ok)
-			return
-		
-		# 判断是否是合法的蓝图代码
-		if 'blueprint' not in bp_dict:
-			QMessageBox.critical(self, '错误', '代码中未查找到蓝图字典', QMessageBox.Ok)
-			return
+		self.start_job(self.on_blueprint_loaded, load_blueprint, self.blueprint_input.get_text())
+	
+	def on_blueprint_loaded(self, result: tuple) -> None:
+		"""后台分析完成时触发"""
 		
-		# 尝试对象化
-		try:
-			self.blueprint_loaded_bp = Blueprint(bp_dict)
-		except Exception as e:
-			QMessageBox.critical(self, '错误', str(e), QMessageBox.Ok)
-			return
+		self.blueprint_loaded_dict, self.blueprint_loaded_bp = result
 		
 		# 刷新控件
 		self.refresh_blueprint_controls()
@@ -283,10 +553,21 @@ class MainWindow(QMainWindow):
 	
 	def on_blueprint_copy_clicked(self) -> None:
 		"""复制蓝图按钮"""
-		pyperclip.copy(dict_to_blueprint(self.blueprint_loaded_bp.get_dict()))
+		# 只改写元数据，保留实体对象未建模的字段
+		patch_blueprint_dict_metadata(
+			self.blueprint_loaded_dict,
+			label=self.blueprint_loaded_bp.label or '',
+			description=self.blueprint_loaded_bp.description or '',
+			icons=self.blueprint_loaded_bp.icons
+		)
+		self.copy_text(dict_to_blueprint(self.blueprint_loaded_dict), beep=False)
 
 
 if __name__ == '__main__':
+	import multiprocessing
+	
+	multiprocessing.freeze_support()  # 打包后的程序中，进程池的工作进程从这里进入而不是重新打开主窗口
+	
 	QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)  # 启用HD缩放
 	
 	app = QApplication(sys.argv)
@@ -26,7 +26,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=False,  # UPX压缩的文件每次启动都要解压，关闭以缩短冷启动
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,
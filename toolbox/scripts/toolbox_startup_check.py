@@ -0,0 +1,104 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+"""
+工具箱冷启动耗时检查
+1. 用 python -X importtime 导入toolbox_main，按累计耗时列出最慢的模块
+2. 启动主窗口，测量从启动解释器到窗口第一次绘制的总耗时
+总耗时超过预算时以退出码1结束，可以放进打包前的检查流程
+
+用法示例：
+python toolbox_startup_check.py --budget 1.5
+python toolbox_startup_check.py --offscreen  # 没有显示器时使用Qt的离屏平台
+"""
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 在子进程中执行：创建主窗口并在第一次绘制时输出时间戳
+FIRST_PAINT_CODE = '''
+import sys
+from PyQt5.QtCore import QEvent, QObject
+from PyQt5.QtWidgets import QApplication
+import toolbox_main
+
+
+class FirstPaintFilter(QObject):
+	def eventFilter(self, obj, event):
+		if obj is main_window and event.type() == QEvent.Paint:
+			import time
+			print(time.time())
+			app.quit()
+		return False
+
+
+app = QApplication(sys.argv)
+main_window = toolbox_main.MainWindow()
+paint_filter = FirstPaintFilter()
+main_window.installEventFilter(paint_filter)
+main_window.show()
+app.exec_()
+'''
+
+
+def get_import_time_list(module_name: str = 'toolbox_main', env: dict | None = None) -> list:
+	"""在新进程中导入模块，返回 [(累计耗时秒, 模块名)]，按耗时从大到小排列"""
+	
+	result = subprocess.run(
+		[sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module_name)],
+		cwd=SCRIPTS_DIR, env=env, capture_output=True, text=True)
+	
+	_ = []
+	for line in result.stderr.splitlines():
+		# import time: self [us] | cumulative | imported package
+		if not line.startswith('import time:') or 'cumulative' in line:
+			continue
+		self_time, cumulative, name = line[len('import time:'):].split('|')
+		_.append((int(cumulative) / 1000000, name.rstrip()))
+	
+	_.sort(reverse=True)
+	return _
+
+
+def get_first_paint_time(env: dict | None = None) -> float:
+	"""启动主窗口，返回从启动子进程到窗口第一次绘制的秒数"""
+	
+	start = time.time()
+	result = subprocess.run(
+		[sys.executable, '-c', FIRST_PAINT_CODE], cwd=SCRIPTS_DIR, env=env, capture_output=True, text=True)
+	if result.returncode != 0:
+		raise RuntimeError(result.stderr)
+	return float(result.stdout.strip().splitlines()[-1]) - start
+
+
+def main(argv: list | None = None) -> int:
+	"""命令行入口，冷启动超过预算时返回1"""
+	
+	parser = argparse.ArgumentParser(description='测量工具箱的导入耗时与首次绘制耗时')
+	parser.add_argument('--budget', type=float, default=1.5, help='首次绘制的耗时预算，单位为秒')
+	parser.add_argument('--top', type=int, default=15, help='列出导入最慢的模块数量')
+	parser.add_argument('--repeat', type=int, default=3, help='测量首次绘制的次数，取最小值')
+	parser.add_argument('--offscreen', action='store_true', help='使用Qt的离屏平台，适用于没有显示器的环境')
+	args = parser.parse_args(argv)
+	
+	env = dict(os.environ)
+	if args.offscreen:
+		env['QT_QPA_PLATFORM'] = 'offscreen'
+	
+	print('导入耗时（累计）：')
+	for cumulative, name in get_import_time_list(env=env)[:args.top]:
+		print('{:8.1f}ms  {}'.format(cumulative * 1000, name))
+	
+	first_paint_time = min(get_first_paint_time(env) for _ in range(args.repeat))
+	print('首次绘制耗时：{:.0f}ms，预算：{:.0f}ms'.format(first_paint_time * 1000, args.budget * 1000))
+	
+	if first_paint_time > args.budget:
+		print('冷启动超过预算！')
+		return 1
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())